@@ -0,0 +1,82 @@
+"""벤치마크용 합성 카탈로그 생성
+
+실제 restaurants.json 레코드를 복제해 id/slug/이름만 바꾼 N건짜리 데이터
+디렉터리를 만든다. 나머지 데이터 파일은 원본을 그대로 복사한다.
+대규모(10만 건 이상) 벤치마크는 JSON 검증을 건너뛰는 make_restaurants()를 쓴다.
+"""
+
+import copy
+import json
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+from pyongyang_naengmyeon.catalog.snapshot import DATA_FILES, DEFAULT_DATA_DIR
+from pyongyang_naengmyeon.models import Restaurant
+
+
+def make_restaurant_records(size: int, seed: int = 0) -> list[dict]:
+    """원본 레코드를 변형 복제한 N건 생성"""
+    with open(DEFAULT_DATA_DIR / "restaurants.json", encoding="utf-8") as f:
+        base = json.load(f)["restaurants"]
+    rng = random.Random(seed)
+    records = []
+    for i in range(size):
+        r = copy.deepcopy(base[i % len(base)])
+        copy_no = i // len(base)
+        r["id"] = i + 1
+        if copy_no:
+            r["name"] = f"{r['name']} {copy_no}호점"
+            r["slug"] = f"{r.get('slug') or r['id']}-{copy_no}"
+            if r.get("menu"):
+                r["menu"]["naengmyeon_price"] += rng.randrange(-3, 4) * 500
+            if r.get("rating_score"):
+                rating = r["rating_score"] + rng.uniform(-0.3, 0.3)
+                r["rating_score"] = round(min(5.0, max(3.0, rating)), 1)
+        records.append(r)
+    return records
+
+
+def make_data_dir(size: int, seed: int = 0) -> Path:
+    """N건짜리 임시 데이터 디렉터리 생성 (호출자가 정리)"""
+    data_dir = Path(tempfile.mkdtemp(prefix=f"naengmyeon-{size}-"))
+    for name in DATA_FILES:
+        if name != "restaurants.json":
+            shutil.copy(DEFAULT_DATA_DIR / name, data_dir / name)
+    with open(data_dir / "restaurants.json", "w", encoding="utf-8") as f:
+        json.dump({"restaurants": make_restaurant_records(size, seed)}, f, ensure_ascii=False)
+    return data_dir
+
+
+def make_restaurants(size: int, seed: int = 0) -> list[Restaurant]:
+    """검증을 건너뛴 N건 Restaurant 목록 (텍스트/수치 필드를 무작위로 섞음)"""
+    with open(DEFAULT_DATA_DIR / "restaurants.json", encoding="utf-8") as f:
+        base = [Restaurant(**r) for r in json.load(f)["restaurants"]]
+    rng = random.Random(seed)
+    restaurants = []
+    for i in range(size):
+        r = base[i % len(base)]
+        other = rng.choice(base)
+        broth = r.broth.model_copy(update={
+            "description": other.broth.description,
+            "beef_aroma_level": rng.randint(1, 5),
+            "saltiness_level": rng.randint(1, 5),
+            "clarity_level": rng.randint(1, 5),
+            "has_slush_ice": rng.random() < 0.3,
+        })
+        restaurants.append(r.model_copy(update={
+            "id": i + 1,
+            "slug": f"{r.slug}-{i}",
+            "name": f"{r.name} {i}" if i >= len(base) else r.name,
+            "region": rng.choice(base).region,
+            "lineage": rng.choice(base).lineage,
+            "tier": rng.choice((1, 2, 2, 3)),
+            "rating_score": round(rng.uniform(3.0, 5.0), 1),
+            "average_wait_minutes": rng.randrange(0, 60, 5),
+            "broth": broth,
+            "tags": rng.sample(other.tags, k=min(3, len(other.tags))) + r.tags[:2],
+            "features": rng.choice(base).features,
+            "special_notes": rng.choice(base).special_notes,
+        }))
+    return restaurants
@@ -0,0 +1,77 @@
+"""콜드 스타트 벤치마크 (첫 응답까지 걸리는 시간)
+
+카탈로그 크기별로 새 파이썬 프로세스를 띄워 import → 카탈로그 로드 →
+첫 search_restaurants / get_restaurant 응답까지의 시간을 잰다.
+JSON 로드(NAENGMYEON_COMPILED_CATALOG=0)와 컴파일된 catalog.bin 로드를 비교한다.
+
+실행: PYTHONPATH=src python benchmarks/bench_cold_start.py [크기...]
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+from _catalog import make_data_dir
+
+from pyongyang_naengmyeon.catalog.snapshot import build_catalog
+
+SIZES = (24, 1_000, 10_000)
+RUNS = 3
+
+# 자식 프로세스: 서버 모듈 import 부터 첫 응답까지
+FIRST_RESPONSE = """
+import asyncio, sys, time
+from pathlib import Path
+from pyongyang_naengmyeon.server import DataProvider
+from pyongyang_naengmyeon.tools.definitions import GetRestaurantInput, SearchRestaurantsInput
+provider = DataProvider(data_dir=Path(sys.argv[1]))
+loaded = time.perf_counter()
+asyncio.run(provider.search_restaurants(SearchRestaurantsInput(region="jongno_euljiro", limit=10)))
+asyncio.run(provider.get_restaurant(GetRestaurantInput(id="1")))
+print(provider.snapshot.compiled, provider.snapshot.load_seconds)
+"""
+
+
+def first_response(data_dir: str, compiled: bool) -> tuple[float, float]:
+    """(프로세스 시작 → 첫 응답 초, 카탈로그 로드 초) 중앙값"""
+    env = {**os.environ, "NAENGMYEON_COMPILED_CATALOG": "1" if compiled else "0"}
+    totals, loads = [], []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        out = subprocess.run(
+            [sys.executable, "-c", FIRST_RESPONSE, data_dir],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        totals.append(time.perf_counter() - started)
+        assert out[0] == str(compiled), out
+        loads.append(float(out[1]))
+    return sorted(totals)[RUNS // 2], sorted(loads)[RUNS // 2]
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    print(
+        f"{'restaurants':>12} {'json load':>11} {'bin load':>10} "
+        f"{'json first':>12} {'bin first':>11}"
+    )
+    for size in sizes:
+        data_dir = make_data_dir(size)
+        try:
+            build_catalog(data_dir)
+            json_total, json_load = first_response(str(data_dir), compiled=False)
+            bin_total, bin_load = first_response(str(data_dir), compiled=True)
+        finally:
+            shutil.rmtree(data_dir)
+        print(
+            f"{size:>12,} {json_load * 1000:>8.0f} ms {bin_load * 1000:>7.0f} ms "
+            f"{json_total * 1000:>9.0f} ms {bin_total * 1000:>8.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
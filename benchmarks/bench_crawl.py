@@ -0,0 +1,82 @@
+"""plan_crawl 벤치마크: 전수 탐색 vs 탐욕 구성 + 교체 탐색 + 순서 DP
+
+(1) 후보 상위 M곳에서 k곳을 고르는 모든 순열을 평가하는 전수 탐색과
+(2) plan_crawl (최근접 이웃식 구성 → 교체 지역 탐색 → 집합 × 마지막 맛집 DP) 를
+비교한다. 전수 탐색은 작은 M/k 에서만 돌리고 점수 차이를 함께 보인다.
+큰 카탈로그에서는 plan_crawl 지연만 잰다 (후보 축소 + 시간 예산).
+
+실행: PYTHONPATH=src python benchmarks/bench_crawl.py [크기 ...]
+"""
+
+import itertools
+import logging
+import sys
+import time
+from collections.abc import Callable
+
+import numpy as np
+from _catalog import make_restaurants
+
+from pyongyang_naengmyeon.catalog import RestaurantColumns
+from pyongyang_naengmyeon.catalog.crawl import MINUTE_COST, TIER_BONUS, _Problem, plan_crawl
+from pyongyang_naengmyeon.catalog.hours import DAY_MINUTES, parse_open_at
+
+SIZES = (1_000, 10_000, 100_000)
+STOPS = (3, 4, 5, 8)
+ORIGIN = (37.5657, 126.9769)  # 시청역
+WHEN = parse_open_at("토 11:00")
+MEAL = 40
+# 전수 탐색 후보 수 / 최대 stops
+EXHAUSTIVE_CANDIDATES = 12
+EXHAUSTIVE_STOPS = 4
+REPEAT = 10
+
+
+def _ms(fn: Callable[[], object], repeat: int = REPEAT) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    # 합성 카탈로그는 해석 실패 레코드를 복제하므로 경고를 끈다
+    logging.disable(logging.WARNING)
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    start = float(WHEN.weekday * DAY_MINUTES + WHEN.minute)
+    print(
+        f"{'restaurants':>12} {'stops':>5} {'exhaustive':>11} {'plan_crawl':>11} {'score gap':>10}"
+    )
+    for size in sizes:
+        columns = RestaurantColumns.from_restaurants(make_restaurants(size))
+        for k in STOPS:
+            fast = _ms(lambda: plan_crawl(columns, None, ORIGIN, WHEN, k, MEAL))
+            if k > EXHAUSTIVE_STOPS:
+                print(f"{size:>12,} {k:>5} {'-':>11} {fast:>8.1f} ms {'-':>10}")
+                continue
+
+            # 같은 후보에서 가치 상위 EXHAUSTIVE_CANDIDATES 곳만 전수 탐색
+            mask = np.zeros(size, dtype=bool)
+            value = columns.rating + TIER_BONUS * (columns.tier == 1)
+            value = value - MINUTE_COST * columns.expected_wait(np.arange(size))
+            mask[np.argsort(-value, kind="stable")[:EXHAUSTIVE_CANDIDATES]] = True
+            small = plan_crawl(columns, mask, ORIGIN, WHEN, k, MEAL)
+            problem = _Problem(columns, np.flatnonzero(mask), ORIGIN, start, MEAL)
+
+            def exhaustive() -> float:
+                return max(
+                    problem.evaluate(route)
+                    for route in itertools.permutations(range(len(problem.positions)), k)
+                )
+
+            best = exhaustive()
+            slow = _ms(exhaustive, repeat=1)
+            print(
+                f"{size:>12,} {k:>5} {slow:>8.1f} ms {fast:>8.1f} ms "
+                f"{best - small.score:>10.3f}"
+            )
+            assert small.score <= best + 1e-9
+
+
+if __name__ == "__main__":
+    main()
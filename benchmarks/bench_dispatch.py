@@ -0,0 +1,74 @@
+"""도구 호출 디스패치/입력 검증 벤치마크
+
+tools/call 한 건에서 핸들러 전에 드는 비용을 비교한다.
+(1) SDK 의 호출마다 jsonschema 검증 + if/elif 체인 + Model(**arguments)
+(2) 레지스트리 dict 조회 + 미리 만든 TypeAdapter 검증
+그리고 MCP 서버를 거친 tools/call 전체 왕복 시간을 함께 잰다.
+
+실행: PYTHONPATH=src python benchmarks/bench_dispatch.py
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+import jsonschema
+from mcp import types
+
+from pyongyang_naengmyeon.server import DataProvider, create_server
+from pyongyang_naengmyeon.tools.definitions import REGISTRY
+
+REPEAT = 200
+
+CALLS: list[tuple[str, dict]] = [
+    ("search_restaurants", {"region": "jongno_euljiro", "query": "육향", "limit": 10}),
+    ("get_restaurant", {"id": "1"}),
+    ("recommend", {"experience_level": "beginner", "broth_preference": "rich_beefy"}),
+    ("get_side_pairings", {"restaurant_id": "1", "budget": 30000}),
+]
+
+
+def _us(fn: Callable[[], object], repeat: int = REPEAT) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main() -> None:
+    server = create_server(DataProvider())
+    handler = server.request_handlers[types.CallToolRequest]
+    names = list(REGISTRY)
+
+    print(f"{'tool':<20} {'jsonschema+chain':>17} {'registry':>10} {'round trip':>12}")
+    for name, arguments in CALLS:
+        spec = REGISTRY[name]
+        schema = spec.tool.inputSchema
+
+        def legacy() -> object:
+            jsonschema.validate(instance=arguments, schema=schema)
+            for candidate in names:  # if/elif 체인
+                if candidate == name:
+                    break
+            return spec.input_model(**arguments)
+
+        def registry() -> object:
+            return REGISTRY[name].adapter.validate_python(arguments)
+
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name=name, arguments=arguments),
+        )
+
+        def round_trip() -> object:
+            return asyncio.run(handler(request))
+
+        round_trip()  # 도구 캐시 / 렌더 캐시 준비
+        print(
+            f"{name:<20} {_us(legacy, 20):>14.1f} us {_us(registry):>7.1f} us "
+            f"{_us(round_trip, 50) / 1000:>9.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
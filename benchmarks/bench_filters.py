@@ -0,0 +1,127 @@
+"""필터/정렬 벤치마크: 리스트 컴프리헨션 vs 열 단위 벡터 연산
+
+search_restaurants / recommend 의 조건 조합을 (1) 레코드마다 중첩 속성에
+접근하는 리스트 컴프리헨션 + sorted() 와 (2) RestaurantIndex 의 불리언 마스크 +
+순위 기반 부분 정렬로 각각 처리해 첫 페이지(20건)를 얻는 시간을 비교한다.
+두 경로의 결과가 같은지도 확인한다.
+
+실행: PYTHONPATH=src python benchmarks/bench_filters.py [크기 ...]
+"""
+
+import sys
+import time
+from collections.abc import Callable
+
+from _catalog import make_restaurants
+
+from pyongyang_naengmyeon.catalog import RestaurantIndex
+from pyongyang_naengmyeon.models import ExperienceLevel, Region, Restaurant
+
+SIZES = (10_000, 100_000, 200_000)
+LIMIT = 20
+REPEAT = 5
+
+
+def _is_michelin(r: Restaurant) -> bool:
+    return any(c.type.value.startswith("michelin") for c in r.certifications)
+
+
+# (이름, 행 조건, 마스크 생성, 정렬) — 정렬: "rating" 또는 "tier_rating"
+CASES: list[tuple[str, Callable[[Restaurant], bool], Callable[[RestaurantIndex], list], str]] = [
+    (
+        "region+price",
+        lambda r: r.region == Region.JONGNO_EULJIRO and r.naengmyeon_price <= 15000,
+        lambda ix: [ix.eq("region", Region.JONGNO_EULJIRO), ix.at_most("price", 15000)],
+        "rating",
+    ),
+    (
+        "slush+tier1",
+        lambda r: r.broth.has_slush_ice and r.tier == 1,
+        lambda ix: [ix.eq("has_slush_ice", True), ix.eq("tier", 1)],
+        "rating",
+    ),
+    (
+        "michelin+level",
+        lambda r: _is_michelin(r) and ExperienceLevel.BEGINNER in r.recommended_for,
+        lambda ix: [ix.flag("michelin"), ix.has("recommended_for", ExperienceLevel.BEGINNER)],
+        "rating",
+    ),
+    (
+        "recommend beefy",
+        lambda r: (
+            ExperienceLevel.EXPERT in r.recommended_for
+            and r.broth.beef_aroma_level >= 4
+            and (r.average_wait_minutes or 0) <= 20
+        ),
+        lambda ix: [
+            ix.has("recommended_for", ExperienceLevel.EXPERT),
+            ix.at_least("beef_aroma", 4),
+            ix.at_most("wait", 20),
+        ],
+        "tier_rating",
+    ),
+    (
+        "taste thresholds",
+        lambda r: (
+            r.broth.clarity_level >= 4
+            and r.noodle.buckwheat_ratio >= 70
+            and r.expert_rating.authenticity_score >= 80
+        ),
+        lambda ix: [
+            ix.at_least("clarity", 4),
+            ix.at_least("buckwheat_ratio", 70),
+            ix.at_least("authenticity", 80),
+        ],
+        "rating",
+    ),
+]
+
+SORT_KEYS: dict[str, Callable[[Restaurant], object]] = {
+    "rating": lambda r: -(r.rating_score or 0),
+    "tier_rating": lambda r: (r.tier, -(r.rating_score or 0)),
+}
+
+
+def _ms(fn: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - started) / REPEAT * 1000
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    print(
+        f"{'restaurants':>12} {'case':<17} {'hits':>8} {'list comp':>11} "
+        f"{'vectorized':>11} {'speedup':>8}"
+    )
+    for size in sizes:
+        restaurants = make_restaurants(size)
+        index = RestaurantIndex(restaurants)
+        orders = {
+            "rating": (index.rating_order, index.rating_rank),
+            "tier_rating": (index.tier_rating_order, index.tier_rating_rank),
+        }
+        for name, predicate, masks, sort in CASES:
+            key = SORT_KEYS[sort]
+
+            def list_comp() -> tuple[int, list[Restaurant]]:
+                hits = [r for r in restaurants if predicate(r)]
+                return len(hits), sorted(hits, key=key)[:LIMIT]
+
+            def vectorized() -> tuple[int, list[Restaurant]]:
+                return index.page(masks(index), *orders[sort], 0, LIMIT)
+
+            expected, got = list_comp(), vectorized()
+            assert expected[0] == got[0], name
+            assert [r.id for r in expected[1]] == [r.id for r in got[1]], name
+
+            slow, fast = _ms(list_comp), _ms(vectorized)
+            print(
+                f"{size:>12,} {name:<17} {got[0]:>8,} "
+                f"{slow:>8.2f} ms {fast:>8.2f} ms {slow / fast:>7.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
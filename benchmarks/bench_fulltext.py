@@ -0,0 +1,51 @@
+"""전문 검색(BM25) 벤치마크
+
+카탈로그 크기별 역색인 구축 시간과 질의 지연(top-k / 구조화 필터 결합)을 측정한다.
+
+실행: PYTHONPATH=src python benchmarks/bench_fulltext.py [크기 ...]
+"""
+
+import sys
+import time
+
+from _catalog import make_restaurants
+
+from pyongyang_naengmyeon.catalog import FullTextIndex, RestaurantIndex
+from pyongyang_naengmyeon.models import Region
+
+SIZES = (1_000, 10_000, 100_000)
+QUERIES = ("진한 육수 슴슴한", "살얼음 쫄깃", "녹두전 노포", "메밀향")
+REPEAT = 20
+
+
+def _ms(fn) -> float:
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - started) / REPEAT * 1000
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    print(f"{'docs':>9} {'build':>9} {'terms':>7} {'top-10':>9} {'all hits':>9} {'+filter':>9}")
+    for size in sizes:
+        restaurants = make_restaurants(size)
+        started = time.perf_counter()
+        fulltext = FullTextIndex(restaurants)
+        build_s = time.perf_counter() - started
+        index = RestaurantIndex(restaurants)
+        region = index.eq("region", Region.JONGNO_EULJIRO)
+
+        top_k = sum(_ms(lambda q=q: fulltext.search(q, k=10)) for q in QUERIES) / len(QUERIES)
+        all_hits = sum(_ms(lambda q=q: fulltext.search(q)) for q in QUERIES) / len(QUERIES)
+        filtered = sum(
+            _ms(lambda q=q: fulltext.search(q, k=10, candidates=region)) for q in QUERIES
+        ) / len(QUERIES)
+        print(
+            f"{size:>9,} {build_s:>8.2f}s {len(fulltext):>7,} "
+            f"{top_k:>7.2f}ms {all_hits:>7.2f}ms {filtered:>7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""오타/초성 이름 해석 벤치마크: 전수 편집 거리 vs 삭제 사전 색인
+
+(1) 질의마다 모든 맛집의 이름/영문명/slug 와 자모 편집 거리를 계산하는 방식과
+(2) FuzzyNameIndex (SymSpell 식 삭제 사전 + 초성 색인) 를 비교한다.
+색인 구축 시간과 질의 지연을 재고, 두 경로의 후보가 같은지도 확인한다.
+
+실행: PYTHONPATH=src python benchmarks/bench_fuzzy.py [크기 ...]
+"""
+
+import sys
+import time
+from collections.abc import Callable
+
+from _catalog import make_restaurants
+
+from pyongyang_naengmyeon.catalog import RestaurantColumns, RestaurantResolver
+from pyongyang_naengmyeon.catalog.fuzzy import decompose, edit_distance, max_distance
+from pyongyang_naengmyeon.catalog.resolver import normalize
+
+SIZES = (1_000, 10_000, 50_000)
+QUERIES = ("을밀데", "봉피앙", "Wooraeok", "필동멘옥", "pildong-myunok")
+REPEAT = 20
+
+
+def _ms(fn: Callable[[], object], repeat: int = REPEAT) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    print(
+        f"{'restaurants':>12} {'query':<16} {'build':>9} {'pairwise':>11} "
+        f"{'index':>9} {'speedup':>8}"
+    )
+    for size in sizes:
+        restaurants = make_restaurants(size)
+        columns = RestaurantColumns.from_restaurants(restaurants)
+
+        def build() -> RestaurantResolver:
+            resolver = RestaurantResolver(restaurants, columns)
+            resolver.warm()
+            return resolver
+
+        build_ms = _ms(build, repeat=1)
+        resolver = build()
+        names = zip(columns.name, columns.name_english, columns.name_hanja, columns.slug)
+        keys = [{decompose(normalize(n)) for n in row if n} for row in names]
+
+        for query in QUERIES:
+            q = decompose(normalize(query))
+            limit = max_distance(len(q))
+
+            def pairwise() -> dict[int, int]:
+                # 질의마다 전체 이름과 거리 계산 (색인 없음)
+                found = {}
+                for pos, row in enumerate(keys):
+                    distance = min(edit_distance(q, key, limit) for key in row)
+                    if distance <= limit:
+                        found[pos] = distance
+                return found
+
+            def indexed() -> list[tuple[int, int]]:
+                return resolver._fuzzy_positions(query)
+
+            assert pairwise() == {pos: d for d, pos in indexed()}, query
+            slow, fast = _ms(pairwise, repeat=1), _ms(indexed)
+            print(
+                f"{size:>12,} {query:<16} {build_ms:>6.0f} ms "
+                f"{slow:>8.1f} ms {fast:>6.2f} ms {slow / fast:>7.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
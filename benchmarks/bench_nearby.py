@@ -0,0 +1,95 @@
+"""search_nearby 벤치마크: 전체 거리 계산 vs 위경도 격자 색인
+
+전국에 흩어진 N개 좌표(도시 주변에 몰리도록 생성)에 대해
+(1) 질의마다 모든 맛집까지 하버사인 거리를 계산해 정렬하는 방식과
+(2) GeoIndex 의 격자 칸 후보 + 후보만 거리 계산을 비교한다.
+반경 1km / 5km 안 가까운 k 곳(도구처럼 결과 수 제한)과 k-최근접(k=5),
+조건 마스크가 있는 경우를 잰다.
+두 경로의 결과가 같은지도 확인한다.
+
+실행: PYTHONPATH=src python benchmarks/bench_nearby.py [크기 ...]
+"""
+
+import sys
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from pyongyang_naengmyeon.catalog import GeoIndex
+from pyongyang_naengmyeon.catalog.geo import haversine
+
+SIZES = (10_000, 100_000, 1_000_000)
+REPEAT = 50
+K = 5
+# (위도, 경도, 표준편차°) — 서울, 부산, 대구, 대전, 광주, 그 외 전국
+CITIES = ((37.55, 126.98, 0.08), (35.15, 129.06, 0.05), (35.87, 128.60, 0.04),
+          (36.35, 127.38, 0.04), (35.16, 126.85, 0.04))
+QUERY = (37.5657, 126.9769)  # 시청역
+
+
+def make_locations(size: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    location = np.empty((size, 2))
+    city = rng.integers(0, len(CITIES) + 1, size)
+    for i, (lat, lon, spread) in enumerate(CITIES):
+        rows = city == i
+        location[rows] = rng.normal((lat, lon), spread, (rows.sum(), 2))
+    rest = city == len(CITIES)
+    location[rest] = rng.uniform((34.5, 126.3), (38.3, 129.4), (rest.sum(), 2))
+    return location
+
+
+def _ms(fn: Callable[[], object], repeat: int = REPEAT) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    print(
+        f"{'restaurants':>12} {'query':<14} {'build':>9} {'scan':>10} "
+        f"{'index':>9} {'speedup':>8}"
+    )
+    for size in sizes:
+        location = make_locations(size)
+        build = _ms(lambda: GeoIndex(location), repeat=3)
+        geo = GeoIndex(location)
+        mask = np.random.default_rng(1).random(size) < 0.3
+        lat, lon = QUERY
+
+        cases: dict[str, tuple[float | None, np.ndarray | None]] = {
+            "radius 1km": (1_000.0, None),
+            "radius 5km": (5_000.0, None),
+            f"nearest {K}": (None, None),
+            f"nearest {K}+mask": (None, mask),
+        }
+        for name, (radius, m) in cases.items():
+
+            def scan() -> np.ndarray:
+                # 전체 거리 계산 후 정렬 (색인 없음)
+                distances = haversine(lat, lon, location[:, 0], location[:, 1])
+                if m is not None:
+                    distances = np.where(m, distances, np.inf)
+                order = np.argsort(distances, kind="stable")[:K]
+                if radius is None:
+                    return order
+                return order[distances[order] <= radius]
+
+            def indexed() -> np.ndarray:
+                if radius is None:
+                    return geo.nearest(lat, lon, K, m)[0]
+                return geo.within(lat, lon, radius, m, K)[0]
+
+            assert np.array_equal(scan(), indexed()), name
+            slow, fast = _ms(scan, repeat=5), _ms(indexed)
+            print(
+                f"{size:>12,} {name:<14} {build:>6.1f} ms "
+                f"{slow:>7.2f} ms {fast:>6.3f} ms {slow / fast:>7.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
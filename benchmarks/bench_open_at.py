@@ -0,0 +1,73 @@
+"""open_at 필터 벤치마크: 질의마다 영업시간 문자열 해석 vs 주간 비트맵
+
+(1) 질의마다 모든 맛집의 영업시간/휴무일 문자열을 해석해 그 시각의 영업 여부를 보는 방식과
+(2) 로드 시 한 번 컴파일한 주간 비트맵에서 비트 하나를 검사하는 RestaurantIndex.open_at 을
+비교한다. 컴파일 시간과 질의 지연을 재고, 두 경로의 결과가 같은지도 확인한다.
+
+실행: PYTHONPATH=src python benchmarks/bench_open_at.py [크기 ...]
+"""
+
+import json
+import logging
+import sys
+import time
+from collections.abc import Callable
+
+import numpy as np
+from _catalog import make_restaurants
+
+from pyongyang_naengmyeon.catalog import RestaurantColumns, RestaurantIndex
+from pyongyang_naengmyeon.catalog.hours import compile_schedule, load_holidays, parse_open_at
+from pyongyang_naengmyeon.catalog.snapshot import DEFAULT_DATA_DIR
+
+SIZES = (1_000, 10_000, 50_000)
+QUERIES = ("월 12:00", "일 16:30", "2026-09-25T12:00")
+REPEAT = 200
+
+
+def _ms(fn: Callable[[], object], repeat: int = REPEAT) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    # 합성 카탈로그는 해석 실패 레코드를 복제하므로 경고를 끈다
+    logging.disable(logging.WARNING)
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    holidays = load_holidays(json.loads((DEFAULT_DATA_DIR / "holidays.json").read_bytes()))
+    print(
+        f"{'restaurants':>12} {'open_at':<18} {'compile':>9} {'parse':>10} "
+        f"{'bitmap':>9} {'speedup':>8}"
+    )
+    for size in sizes:
+        restaurants = make_restaurants(size)
+        compile_ms = _ms(lambda: RestaurantColumns.from_restaurants(restaurants), repeat=1)
+        index = RestaurantIndex(restaurants)
+
+        for query in QUERIES:
+            when = parse_open_at(query, holidays=holidays)
+
+            def parse() -> np.ndarray:
+                # 질의마다 문자열 해석 (컴파일 없음)
+                mask = np.empty(size, dtype=bool)
+                for i, r in enumerate(restaurants):
+                    schedule = compile_schedule(r)
+                    closed = schedule.closed_on[when.holidays].any()
+                    mask[i] = schedule.week[when.slot] and not closed
+                return mask
+
+            def bitmap() -> np.ndarray:
+                return index.open_at(when)
+
+            assert np.array_equal(parse(), bitmap()), query
+            slow, fast = _ms(parse, repeat=1), _ms(bitmap)
+            print(
+                f"{size:>12,} {query:<18} {compile_ms:>6.0f} ms "
+                f"{slow:>7.0f} ms {fast:>6.3f} ms {slow / fast:>7.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
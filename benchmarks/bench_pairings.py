@@ -0,0 +1,91 @@
+"""get_side_pairings 예산 구성 벤치마크: 전수 탐색 vs 배낭 DP
+
+실제 카탈로그의 맛집마다 (1) Restaurant.side_menus 에서 메뉴별 접시 수 조합을 모두
+평가하는 전수 탐색과 (2) 로드 시 만든 SideMenuColumn 위의 optimize_sides 를 비교한다.
+두 경로의 최고 가치가 같은지도 확인한다.
+
+실행: PYTHONPATH=src python benchmarks/bench_pairings.py [인원수 ...]
+"""
+
+import itertools
+import logging
+import math
+import sys
+import time
+from collections.abc import Callable
+
+from pyongyang_naengmyeon.catalog import load_snapshot
+from pyongyang_naengmyeon.catalog.pairings import (
+    BASE_VALUE,
+    PAIRING_VALUE,
+    PRICE_UNIT,
+    SHARE,
+    SIGNATURE_VALUE,
+    optimize_sides,
+)
+from pyongyang_naengmyeon.models import Restaurant
+
+PARTY_SIZES = (1, 2, 4, 8)
+PER_PERSON = 30_000
+REPEAT = 20
+
+
+def _ms(fn: Callable[[], object], repeat: int = REPEAT) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def exhaustive(r: Restaurant, party: int, budget: int) -> float | None:
+    """메뉴별 접시 수 (0..SHARE 명당 1접시) 조합 전수 평가"""
+    remaining = budget - r.naengmyeon_price * party
+    if remaining < 0:
+        return None
+    copies = max(1, math.ceil(party / SHARE))
+    best = 0.0
+    for counts in itertools.product(range(copies + 1), repeat=len(r.side_menus)):
+        cost = sum(-(-m.price // PRICE_UNIT) * PRICE_UNIT * n for m, n in zip(r.side_menus, counts))
+        if cost > remaining:
+            continue
+        value = sum(
+            (BASE_VALUE + SIGNATURE_VALUE * m.is_signature + PAIRING_VALUE * bool(m.pairing_note))
+            * sum(1 / c for c in range(1, n + 1))
+            for m, n in zip(r.side_menus, counts)
+        )
+        best = max(best, value)
+    return best
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)
+    parties = [int(a) for a in sys.argv[1:]] or PARTY_SIZES
+    snapshot = load_snapshot()
+    restaurants = list(snapshot.restaurants)
+    column = snapshot.index.columns.side_menus
+    print(f"{'party':>5} {'restaurants':>12} {'exhaustive':>11} {'knapsack':>10} {'speedup':>8}")
+    for party in parties:
+        budget = PER_PERSON * party
+
+        def slow() -> list[float | None]:
+            return [exhaustive(r, party, budget) for r in restaurants]
+
+        def fast() -> list[float | None]:
+            results = [
+                optimize_sides(column, pos, r.naengmyeon_price, party, budget)
+                for pos, r in enumerate(restaurants)
+            ]
+            return [c.value if c else None for c in results]
+
+        for a, b in zip(slow(), fast()):
+            assert (a is None) == (b is None) and (a is None or abs(a - b) < 1e-9), (party, a, b)
+        slow_ms, fast_ms = _ms(slow, repeat=1), _ms(fast)
+        per_query = fast_ms / len(restaurants) * 1000
+        print(
+            f"{party:>5} {len(restaurants):>12} {slow_ms:>8.1f} ms {fast_ms:>7.2f} ms "
+            f"{slow_ms / fast_ms:>7.0f}x  (질의당 {per_query:.0f} µs)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""세션 생성 비용 벤치마크
+
+카탈로그 크기별로 (1) 스냅샷 최초 로드 시간과 (2) 공유 스냅샷을 쓰는
+create_server() 1회 비용을 비교한다. (2)는 데이터 크기와 무관하게 일정해야 한다.
+
+실행: PYTHONPATH=src python benchmarks/bench_session_setup.py
+"""
+
+import shutil
+import sys
+import time
+
+from _catalog import make_data_dir
+
+from pyongyang_naengmyeon.catalog import load_snapshot
+from pyongyang_naengmyeon.server import DataProvider, create_server
+
+SIZES = (24, 1_000, 10_000)
+SESSIONS = 200
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    print(f"{'restaurants':>12} {'snapshot load':>15} {'per-session setup':>19}")
+    for size in sizes:
+        data_dir = make_data_dir(size)
+        try:
+            started = time.perf_counter()
+            snapshot = load_snapshot(data_dir)
+            load_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            for _ in range(SESSIONS):
+                create_server(DataProvider(snapshot=snapshot))
+            session_us = (time.perf_counter() - started) / SESSIONS * 1_000_000
+        finally:
+            shutil.rmtree(data_dir)
+        print(f"{size:>12,} {load_ms:>12.1f} ms {session_us:>16.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
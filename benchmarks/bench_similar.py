@@ -0,0 +1,76 @@
+"""find_similar 벤치마크: 레코드별 거리 계산 vs 특징 행렬 최근접 이웃
+
+(1) 질의마다 레코드에서 특징 벡터를 뽑아 거리를 계산하고 정렬하는 방식과
+(2) 로드 시 만든 SimilarityIndex 의 행렬-벡터 곱 + argpartition 을 비교한다.
+필터 없음 / 지역+가격 필터 두 경우의 질의 시간과 인덱스 구축 시간을 잰다.
+두 경로의 상위 k 거리가 같은지도 확인한다.
+
+실행: PYTHONPATH=src python benchmarks/bench_similar.py [크기 ...]
+"""
+
+import sys
+import time
+from collections.abc import Callable
+
+import numpy as np
+from _catalog import make_restaurants
+
+from pyongyang_naengmyeon.catalog import RestaurantColumns, RestaurantIndex, SimilarityIndex
+from pyongyang_naengmyeon.catalog.similarity import embed
+from pyongyang_naengmyeon.models import Region
+
+SIZES = (1_000, 10_000, 50_000)
+K = 5
+REPEAT = 20
+
+
+def _ms(fn: Callable[[], object], repeat: int = REPEAT) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    print(
+        f"{'restaurants':>12} {'filter':<13} {'build':>9} {'per-record':>12} "
+        f"{'index':>9} {'speedup':>8}"
+    )
+    for size in sizes:
+        restaurants = make_restaurants(size)
+        columns = RestaurantColumns.from_restaurants(restaurants)
+        index = RestaurantIndex(restaurants, columns)
+        build = _ms(lambda: SimilarityIndex(columns), repeat=3)
+        similarity = SimilarityIndex(columns)
+        pos = size // 2
+
+        cases = {
+            "none": None,
+            "region+price": index.combine([
+                index.eq("region", Region.GANGNAM_SEOCHO),
+                index.at_most("price", 15000),
+            ]),
+        }
+        for name, mask in cases.items():
+
+            def per_record() -> list[float]:
+                # 질의마다 레코드 → 벡터 변환 후 거리 계산 (인덱스 없음)
+                rows = [i for i in range(size) if i != pos and (mask is None or mask[i])]
+                vectors = embed(RestaurantColumns.from_restaurants([restaurants[i] for i in rows]))
+                query = embed(RestaurantColumns.from_restaurants([restaurants[pos]]))[0]
+                return sorted(float(np.linalg.norm(v - query)) for v in vectors)[:K]
+
+            def indexed() -> np.ndarray:
+                return similarity.nearest(pos, K, mask)[1]
+
+            assert np.allclose(per_record(), indexed(), atol=1e-3), name
+            slow, fast = _ms(per_record, repeat=1), _ms(indexed)
+            print(
+                f"{size:>12,} {name:<13} {build:>6.1f} ms "
+                f"{slow:>9.2f} ms {fast:>6.3f} ms {slow / fast:>7.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""멀티 워커 처리량 벤치마크
+
+워커 수별로 서버를 띄우고 search_restaurants tools/call 을 stateless /mcp 로
+일정 시간 동시에 보내 초당 처리량을 측정한다. 부하 생성기도 CPU 를 쓰므로
+코어 수가 워커 수 + 부하 프로세스 수보다 충분히 많은 머신에서 실행해야
+거의 선형에 가까운 확장을 확인할 수 있다.
+
+실행: PYTHONPATH=src python benchmarks/bench_workers.py --workers 1 2 4 --duration 10
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+HEADERS = {
+    "accept": "application/json, text/event-stream",
+    "content-type": "application/json",
+}
+CALL = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "tools/call",
+    "params": {
+        "name": "search_restaurants",
+        "arguments": {"region": "jongno_euljiro", "limit": 10},
+    },
+}
+
+
+async def _load(url: str, concurrency: int, duration: float) -> int:
+    done = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal done
+        while time.perf_counter() < deadline:
+            r = await client.post("/mcp", json=CALL, headers=HEADERS)
+            r.raise_for_status()
+            done += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    return done
+
+
+def _load_process(args: tuple[str, int, float]) -> int:
+    return asyncio.run(_load(*args))
+
+
+def _wait_ready(url: str, timeout: float = 30) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{url}/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("서버가 시작되지 않았습니다")
+
+
+def measure(url: str, clients: int, concurrency: int, duration: float) -> float:
+    """부하 프로세스 clients 개로 duration 초 동안 요청 → req/s"""
+    with multiprocessing.Pool(clients) as pool:
+        counts = pool.map(_load_process, [(url, concurrency, duration)] * clients)
+    return sum(counts) / duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=0, help="부하 프로세스 수 (기본: 워커 수)")
+    parser.add_argument("--concurrency", type=int, default=16, help="부하 프로세스당 동시 요청")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8900)
+    args = parser.parse_args()
+
+    print(f"cpu cores: {os.cpu_count()}")
+    print(f"{'workers':>8} {'req/s':>10} {'speedup':>8} {'efficiency':>11}")
+    baseline = None
+    for workers in args.workers:
+        url = f"http://127.0.0.1:{args.port}"
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "pyongyang_naengmyeon.sse_server",
+                "--host", "127.0.0.1", "--port", str(args.port), "--workers", str(workers),
+            ],
+            env={**os.environ, "NAENGMYEON_STATELESS_HTTP": "1"},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_ready(url)
+            rps = measure(url, args.clients or workers, args.concurrency, args.duration)
+        finally:
+            server.terminate()
+            server.wait()
+        baseline = baseline or rps
+        speedup = rps / baseline
+        print(f"{workers:>8} {rps:>10.1f} {speedup:>7.2f}x {speedup / workers:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
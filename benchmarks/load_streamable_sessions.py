@@ -0,0 +1,108 @@
+"""Streamable HTTP 세션 생성 부하 테스트
+
+N개 클라이언트가 동시에 initialize 를 보내고, 응답으로 받은 mcp-session-id 로
+K개 요청을 곧바로 동시에(파이프라인) 보낸다. 세션은 정확히 N개 생성되어야 한다.
+
+실행:
+    PYTHONPATH=src python benchmarks/load_streamable_sessions.py            # 앱 직접 호출
+    PYTHONPATH=src python benchmarks/load_streamable_sessions.py --url http://localhost:8000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+import httpx
+
+HEADERS = {
+    "accept": "application/json, text/event-stream",
+    "content-type": "application/json",
+}
+PROTOCOL_VERSION = "2025-03-26"
+
+
+def _initialize(client_no: int) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": f"load-{client_no}", "version": "0"},
+        },
+    }
+
+
+async def run_client(client: httpx.AsyncClient, client_no: int, pipelined: int) -> str:
+    """initialize 후 세션 ID 로 요청을 동시에 보냄"""
+    response = await client.post("/mcp", json=_initialize(client_no), headers=HEADERS)
+    response.raise_for_status()
+    session_id = response.headers["mcp-session-id"]
+    headers = {**HEADERS, "mcp-session-id": session_id, "mcp-protocol-version": PROTOCOL_VERSION}
+
+    calls = [
+        client.post(
+            "/mcp",
+            json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+            headers=headers,
+        )
+    ]
+    for i in range(pipelined):
+        calls.append(
+            client.post(
+                "/mcp",
+                json={
+                    "jsonrpc": "2.0",
+                    "id": i + 1,
+                    "method": "tools/call",
+                    "params": {"name": "search_restaurants", "arguments": {"limit": 3}},
+                },
+                headers=headers,
+            )
+        )
+    for r in await asyncio.gather(*calls):
+        r.raise_for_status()
+    return session_id
+
+
+async def _created_sessions(client: httpx.AsyncClient) -> int:
+    return (await client.get("/health")).json()["sessions"]["created"]
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--pipelined", type=int, default=5)
+    parser.add_argument("--url", help="실행 중인 서버 주소 (생략 시 앱 직접 호출)")
+    args = parser.parse_args()
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=30)
+    else:
+        from pyongyang_naengmyeon.sse_server import app
+
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://app")
+
+    async with client:
+        before = await _created_sessions(client)
+        started = time.perf_counter()
+        session_ids = await asyncio.gather(
+            *(run_client(client, n, args.pipelined) for n in range(args.clients))
+        )
+        elapsed = time.perf_counter() - started
+        created = await _created_sessions(client) - before
+
+    requests = args.clients * (args.pipelined + 2)
+    print(f"clients={args.clients} pipelined={args.pipelined} requests={requests}")
+    print(
+        f"elapsed={elapsed:.2f}s  distinct session ids={len(set(session_ids))}  created={created}"
+    )
+    ok = created == args.clients == len(set(session_ids))
+    print("OK: 세션 수 == 클라이언트 수" if ok else "FAIL: 중복 세션 생성")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,39 @@
+"""평양냉면 카탈로그 (불변 스냅샷)"""
+
+from .binary import CompiledCatalog
+from .columns import RestaurantColumns
+from .fulltext import FullTextIndex
+from .fuzzy import FuzzyNameIndex
+from .geo import GeoIndex
+from .indexes import RestaurantIndex
+from .render_cache import RenderCache
+from .resolver import RestaurantResolver
+from .similarity import SimilarityIndex
+from .snapshot import (
+    CatalogSnapshot,
+    build_catalog,
+    compute_version,
+    get_shared_snapshot,
+    load_snapshot,
+)
+from .store import CatalogStore, ReloadResult, shared_store
+
+__all__ = [
+    "CatalogSnapshot",
+    "CatalogStore",
+    "CompiledCatalog",
+    "FullTextIndex",
+    "FuzzyNameIndex",
+    "GeoIndex",
+    "ReloadResult",
+    "RenderCache",
+    "RestaurantColumns",
+    "RestaurantIndex",
+    "RestaurantResolver",
+    "SimilarityIndex",
+    "build_catalog",
+    "compute_version",
+    "get_shared_snapshot",
+    "load_snapshot",
+    "shared_store",
+]
@@ -0,0 +1,29 @@
+"""카탈로그 컴파일: data/*.json → catalog.bin
+
+실행: python -m pyongyang_naengmyeon.catalog [--data-dir DIR] [--output PATH]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from .binary import CATALOG_FILE
+from .snapshot import DEFAULT_DATA_DIR, build_catalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="평양냉면 카탈로그 컴파일")
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR)
+    parser.add_argument("--output", type=Path, help=f"출력 경로 (기본: <data-dir>/{CATALOG_FILE})")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    path = build_catalog(args.data_dir, args.output)
+    print(
+        f"{path} ({path.stat().st_size:,} bytes) 생성 완료 "
+        f"({time.perf_counter() - started:.2f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
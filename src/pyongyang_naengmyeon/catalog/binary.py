@@ -0,0 +1,402 @@
+"""컴파일된 바이너리 카탈로그
+
+data/*.json 을 미리 검증해 한 파일(catalog.bin)로 컴파일한다. 서버는 이 파일을
+mmap 으로 열고, 인덱스 구축에 필요한 열과 전문 검색 포스팅은 배열로 그대로 매핑하며,
+레코드(Restaurant)는 접근할 때 한 건씩 디코딩한다 (검증도 그때 한다).
+
+파일 구조 (섹션은 8바이트 정렬)::
+
+    MAGIC(8) | 헤더 길이(uint32) | 헤더 JSON | 섹션...
+
+- strings.*   : 인터닝된 문자열 테이블 (offsets + UTF-8 데이터)
+- 수치 열      : id, tier, rating, price, ..., 맛 프로필/특징 플래그/좌표/영업시간 행렬 (NumPy 배열)
+- side_menus.* : 사이드 메뉴 CSR (offsets + 가격/시그니처/페어링 팁 여부)
+- 문자열 열    : slug/name 등은 문자열 테이블 번호 (-1 = None)
+- records.*   : 레코드별 JSON (offsets + 데이터, 긴 텍스트는 여기에만 있음)
+- fulltext.*  : 용어(문자열 번호) + CSR 포스팅 (위치, BM25 가중치)
+- 나머지 JSON 파일은 원본 바이트 그대로
+
+빌드: python -m pyongyang_naengmyeon.catalog [--data-dir DIR]
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast, overload
+
+import numpy as np
+
+from ..models import ExperienceLevel, Restaurant
+from .columns import CODE_FIELDS, CodeColumn, MultiCodeColumn, RestaurantColumns, SideMenuColumn
+from .fulltext import FullTextIndex
+
+if TYPE_CHECKING:
+    from .snapshot import CatalogSnapshot
+
+CATALOG_FILE = "catalog.bin"
+MAGIC = b"NMCAT\x00\x00\x06"
+_HEADER_LENGTH = struct.Struct("<I")
+_ALIGN = 8
+
+# RestaurantColumns 의 수치 열
+_NUMERIC_COLUMNS = (
+    "id",
+    "tier",
+    "rating",
+    "price",
+    "wait",
+    "has_slush_ice",
+    "dongchimi",
+    "michelin",
+    "taste",
+    "flags",
+    "location",
+    "hours",
+    "holiday_closed",
+)
+# SideMenuColumn 의 CSR 배열
+_SIDE_MENU_ARRAYS = ("offsets", "price", "signature", "pairing")
+_STRING_COLUMNS = ("slug", "name", "name_english", "name_hanja")
+_AUX_FILES = (
+    "lineages.json",
+    "eating_guides.json",
+    "side_menus.json",
+    "places.json",
+    "holidays.json",
+)
+
+
+class InvalidCatalogError(ValueError):
+    """읽을 수 없는 카탈로그 파일"""
+
+
+# 저장되는 열/포스팅을 만드는 모듈 (바뀌면 컴파일된 카탈로그를 다시 만들어야 함)
+_DERIVATION_MODULES = ("binary.py", "columns.py", "hours.py", "fulltext.py", "pairings.py")
+
+
+def schema_fingerprint() -> str:
+    """모델 정의 + 열 생성 코드 지문 (바뀌면 컴파일된 카탈로그를 쓰지 않음)"""
+    digest = hashlib.sha256()
+    catalog_dir = Path(__file__).resolve().parent
+    paths = sorted((catalog_dir.parent / "models").glob("*.py"))
+    paths += [catalog_dir / name for name in _DERIVATION_MODULES]
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+# ============================================================
+# 쓰기
+# ============================================================
+
+
+class _StringTable:
+    """인터닝 문자열 테이블"""
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+
+    def intern(self, text: str | None) -> int:
+        if text is None:
+            return -1
+        return self._ids.setdefault(text, len(self._ids))
+
+    def intern_all(self, texts: Sequence[str | None]) -> np.ndarray:
+        return np.fromiter((self.intern(t) for t in texts), dtype=np.int32, count=len(texts))
+
+    def to_arrays(self) -> tuple[np.ndarray, bytes]:
+        encoded = [text.encode() for text in self._ids]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        return offsets, b"".join(encoded)
+
+
+def _blob_arrays(blobs: Sequence[bytes]) -> tuple[np.ndarray, bytes]:
+    offsets = np.zeros(len(blobs) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in blobs], out=offsets[1:])
+    return offsets, b"".join(blobs)
+
+
+def write_catalog(
+    path: Path,
+    snapshot: "CatalogSnapshot",
+    sources: Mapping[str, bytes | None],
+    file_stats: Mapping[str, list[int] | None],
+) -> None:
+    """스냅샷을 바이너리 카탈로그로 저장 (원자적 교체)"""
+    restaurants = snapshot.restaurants
+    columns = snapshot.index.columns
+    strings = _StringTable()
+    sections: dict[str, np.ndarray | bytes] = {}
+
+    for name in _NUMERIC_COLUMNS:
+        sections[name] = getattr(columns, name)
+    for name in CODE_FIELDS:
+        sections[name] = getattr(columns, name).codes
+    sections["recommended_for.offsets"] = columns.recommended_for.offsets
+    sections["recommended_for.codes"] = columns.recommended_for.codes
+    for name in _SIDE_MENU_ARRAYS:
+        sections[f"side_menus.{name}"] = getattr(columns.side_menus, name)
+    for name in _STRING_COLUMNS:
+        sections[name] = strings.intern_all(getattr(columns, name))
+
+    sections["records.offsets"], sections["records.data"] = _blob_arrays(
+        [r.model_dump_json(exclude_defaults=True).encode() for r in restaurants]
+    )
+
+    terms, offsets, positions, weights = snapshot.fulltext.to_arrays()
+    sections["fulltext.terms"] = strings.intern_all(terms)
+    sections["fulltext.offsets"] = offsets
+    sections["fulltext.positions"] = positions
+    sections["fulltext.weights"] = weights
+
+    for name in _AUX_FILES:
+        if sources.get(name) is not None:
+            sections[name] = sources[name]  # type: ignore[assignment]
+
+    sections["strings.offsets"], sections["strings.data"] = strings.to_arrays()
+
+    header: dict[str, Any] = {
+        "count": len(restaurants),
+        "schema": schema_fingerprint(),
+        "file_hashes": dict(snapshot.file_hashes),
+        "file_stats": dict(file_stats),
+        "vocab": {
+            **{name: [v.value for v in getattr(columns, name).vocab] for name in CODE_FIELDS},
+            "recommended_for": [v.value for v in columns.recommended_for.vocab],
+        },
+        "sections": {},
+    }
+
+    # 헤더 크기가 섹션 오프셋에 영향을 주므로 오프셋은 데이터 시작 기준 상대값
+    payload = bytearray()
+    for name, data in sections.items():
+        payload.extend(b"\0" * (-len(payload) % _ALIGN))
+        if isinstance(data, np.ndarray):
+            # 2차원 배열은 열 우선(Fortran) 순서로 저장
+            raw = data.tobytes(order="F")
+            header["sections"][name] = [len(payload), len(raw), data.dtype.str, data.shape]
+        else:
+            raw = data
+            header["sections"][name] = [len(payload), len(raw), "bytes"]
+        payload.extend(raw)
+
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode()
+    prefix = MAGIC + _HEADER_LENGTH.pack(len(header_bytes)) + header_bytes
+    prefix += b"\0" * (-len(prefix) % _ALIGN)
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(prefix)
+            f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+# ============================================================
+# 읽기
+# ============================================================
+
+
+class StringTable:
+    """mmap 위의 문자열 테이블 (접근 시 디코딩)"""
+
+    def __init__(self, offsets: np.ndarray, data: memoryview):
+        self._offsets = offsets.tolist()
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str | None:
+        if i < 0:
+            return None
+        return str(self._data[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+
+    def decode(self, ids: np.ndarray) -> tuple[str | None, ...]:
+        offsets = self._offsets
+        data = self._data
+        return tuple(
+            str(data[offsets[i]:offsets[i + 1]], "utf-8") if i >= 0 else None
+            for i in ids.tolist()
+        )
+
+
+class LazyRestaurants(Sequence[Restaurant]):
+    """접근할 때 한 건씩 디코딩하는 레코드 목록 (디코딩 결과는 캐시)
+
+    레코드는 빌드 때 이미 검증됐지만, 디코딩은 model_validate_json 으로 다시 검증한다.
+    검증을 없앤 것이 아니라 첫 접근까지 미룬 것이다 (레코드당 한 번, 약 90 µs).
+    model_construct 는 중첩 모델(사이드 메뉴 등)을 만들지 않아 쓰지 않는다.
+    """
+
+    def __init__(self, offsets: np.ndarray, data: memoryview):
+        self._offsets = offsets.tolist()
+        self._data = data
+        self._decoded: list[Restaurant | None] = [None] * (len(self._offsets) - 1)
+
+    def __len__(self) -> int:
+        return len(self._decoded)
+
+    def _decode(self, pos: int) -> Restaurant:
+        restaurant = self._decoded[pos]
+        if restaurant is None:
+            raw = self._data[self._offsets[pos]:self._offsets[pos + 1]]
+            # 첫 접근 시 전체 검증 (스냅샷마다 레코드당 한 번)
+            restaurant = Restaurant.model_validate_json(bytes(raw))
+            self._decoded[pos] = restaurant
+        return restaurant
+
+    @overload
+    def __getitem__(self, pos: int) -> Restaurant: ...
+
+    @overload
+    def __getitem__(self, pos: slice) -> list[Restaurant]: ...
+
+    def __getitem__(self, pos: int | slice) -> Restaurant | list[Restaurant]:
+        if isinstance(pos, slice):
+            return [self._decode(i) for i in range(*pos.indices(len(self)))]
+        if pos < 0:
+            pos += len(self)
+        if not 0 <= pos < len(self):
+            raise IndexError(pos)
+        return self._decode(pos)
+
+    def __iter__(self) -> Iterator[Restaurant]:
+        return (self._decode(pos) for pos in range(len(self)))
+
+    @property
+    def decoded(self) -> int:
+        """지금까지 디코딩한 레코드 수"""
+        return sum(r is not None for r in self._decoded)
+
+
+class CompiledCatalog:
+    """mmap 으로 연 바이너리 카탈로그"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # 빈 파일
+                raise InvalidCatalogError(f"빈 카탈로그 파일: {path}") from e
+        buf = memoryview(self._mmap)
+        if bytes(buf[:len(MAGIC)]) != MAGIC:
+            raise InvalidCatalogError(f"카탈로그 형식이 다릅니다: {path}")
+        start = len(MAGIC) + _HEADER_LENGTH.size
+        try:
+            (header_length,) = _HEADER_LENGTH.unpack_from(buf, len(MAGIC))
+            self.header: dict[str, Any] = json.loads(bytes(buf[start:start + header_length]))
+        except (struct.error, ValueError) as e:
+            raise InvalidCatalogError(f"카탈로그 헤더를 읽을 수 없습니다: {path}") from e
+        self._base = start + header_length + (-(start + header_length) % _ALIGN)
+        self._buf = buf
+        self._strings: StringTable | None = None
+
+    @property
+    def count(self) -> int:
+        return cast(int, self.header["count"])
+
+    @property
+    def schema(self) -> str:
+        return cast(str, self.header["schema"])
+
+    @property
+    def file_hashes(self) -> dict[str, str]:
+        return cast(dict[str, str], self.header["file_hashes"])
+
+    @property
+    def file_stats(self) -> dict[str, list[int] | None]:
+        return cast(dict[str, list[int] | None], self.header["file_stats"])
+
+    def _section(self, name: str) -> memoryview:
+        offset, length, *_ = self.header["sections"][name]
+        start = self._base + offset
+        return self._buf[start:start + length]
+
+    def array(self, name: str) -> np.ndarray:
+        """섹션 → 읽기 전용 배열 (복사 없음)"""
+        _, _, dtype, shape = self.header["sections"][name]
+        flat = np.frombuffer(self._section(name), dtype=np.dtype(dtype))
+        return flat.reshape(shape, order="F")
+
+    def raw(self, name: str) -> memoryview | None:
+        if name not in self.header["sections"]:
+            return None
+        return self._section(name)
+
+    @property
+    def strings(self) -> StringTable:
+        if self._strings is None:
+            self._strings = StringTable(self.array("strings.offsets"), self.raw("strings.data"))  # type: ignore[arg-type]
+        return self._strings
+
+    def source(self, name: str) -> bytes | None:
+        """보조 JSON 파일 원본"""
+        raw = self.raw(name)
+        return bytes(raw) if raw is not None else None
+
+    def _code_column(self, name: str) -> CodeColumn:
+        enum, _ = CODE_FIELDS[name]
+        vocab: list[Any] = self.header["vocab"][name]
+        return CodeColumn(self.array(name), tuple(map(enum, vocab)))
+
+    def columns(self) -> RestaurantColumns:
+        array = self.array
+        strings = self.strings
+        recommended_for: list[str] = self.header["vocab"]["recommended_for"]
+        return RestaurantColumns(
+            id=array("id"),
+            tier=array("tier"),
+            rating=array("rating"),
+            price=array("price"),
+            wait=array("wait"),
+            has_slush_ice=array("has_slush_ice"),
+            dongchimi=array("dongchimi"),
+            michelin=array("michelin"),
+            taste=array("taste"),
+            flags=array("flags"),
+            location=array("location"),
+            hours=array("hours"),
+            holiday_closed=array("holiday_closed"),
+            region=self._code_column("region"),
+            lineage=self._code_column("lineage"),
+            broth_base=self._code_column("broth_base"),
+            noodle_style=self._code_column("noodle_style"),
+            noodle_thickness=self._code_column("noodle_thickness"),
+            recommended_for=MultiCodeColumn(
+                array("recommended_for.offsets"),
+                array("recommended_for.codes"),
+                tuple(map(ExperienceLevel, recommended_for)),
+            ),
+            side_menus=SideMenuColumn(
+                *(array(f"side_menus.{name}") for name in _SIDE_MENU_ARRAYS)
+            ),
+            slug=strings.decode(array("slug")),
+            # 이름은 None 이 없으므로 -1 번호가 나오지 않음
+            name=cast(tuple[str, ...], strings.decode(array("name"))),
+            name_english=strings.decode(array("name_english")),
+            name_hanja=strings.decode(array("name_hanja")),
+        )
+
+    def restaurants(self) -> LazyRestaurants:
+        return LazyRestaurants(self.array("records.offsets"), self.raw("records.data"))  # type: ignore[arg-type]
+
+    def fulltext(self) -> FullTextIndex:
+        return FullTextIndex.from_arrays(
+            self.count,
+            self.strings.decode(self.array("fulltext.terms")),  # type: ignore[arg-type]
+            self.array("fulltext.offsets"),
+            self.array("fulltext.positions"),
+            self.array("fulltext.weights"),
+        )
@@ -0,0 +1,248 @@
+"""레스토랑 열(column) 데이터
+
+필터/정렬/해석기에 필요한 필드를 열 단위 배열로 모은다. JSON 에서 로드하면
+Restaurant 레코드에서 뽑아내고, 컴파일된 카탈로그에서는 레코드를 디코딩하지 않고
+배열을 그대로 매핑한다.
+
+- 수치/불리언 필드: NumPy 배열 (None 은 0, 웨이팅만 -1 = 정보 없음)
+- 맛 프로필: 중첩 모델(broth/noodle/expert_rating)의 정수 점수를 모은 (행 × 항목) 행렬
+- 특징 플래그: 간장/자가제면/고명 여부를 모은 (행 × 항목) 불리언 행렬
+- 좌표: (행 × [위도, 경도]) 실수 행렬 (없으면 NaN)
+- 영업시간: (행 × WEEK_BYTES) 주간 영업 비트맵, (행 × 휴무 종류) 공휴일/명절 휴무 플래그 (hours.py)
+- 열거형 필드: 코드 배열 + 어휘(vocab)
+- 다중 값 열거형(recommended_for): CSR (offsets + 코드)
+- 사이드 메뉴: CSR (offsets + 가격/시그니처/페어링 팁 여부) (pairings.py)
+- 이름/slug: 문자열 튜플 (None 허용)
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+import numpy as np
+
+from ..models import (
+    BrothBase,
+    ExperienceLevel,
+    Lineage,
+    NoodleStyle,
+    NoodleThickness,
+    Region,
+    Restaurant,
+)
+from .hours import compile_hours
+
+
+@dataclass(frozen=True, slots=True)
+class CodeColumn:
+    """열거형 열 (코드 → vocab[코드])"""
+
+    codes: np.ndarray
+    vocab: tuple[Any, ...]
+
+    @classmethod
+    def encode(cls, values: Sequence[Any], enum: type[Enum]) -> "CodeColumn":
+        vocab = tuple(enum)
+        lookup = {v: i for i, v in enumerate(vocab)}
+        codes = np.fromiter((lookup[v] for v in values), dtype=np.int16, count=len(values))
+        return cls(codes, vocab)
+
+
+@dataclass(frozen=True, slots=True)
+class MultiCodeColumn:
+    """다중 값 열거형 열 (행 i 의 코드 = codes[offsets[i]:offsets[i+1]])"""
+
+    offsets: np.ndarray
+    codes: np.ndarray
+    vocab: tuple[Any, ...]
+
+    @classmethod
+    def encode(cls, rows: Sequence[Sequence[Any]], enum: type[Enum]) -> "MultiCodeColumn":
+        vocab = tuple(enum)
+        lookup = {v: i for i, v in enumerate(vocab)}
+        lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        codes = np.fromiter(
+            (lookup[v] for row in rows for v in row), dtype=np.int16, count=int(offsets[-1])
+        )
+        return cls(offsets, codes, vocab)
+
+    def rows(self) -> np.ndarray:
+        """codes 각 원소의 행 번호"""
+        return np.repeat(np.arange(len(self.offsets) - 1), np.diff(self.offsets))
+
+
+@dataclass(frozen=True, slots=True)
+class SideMenuColumn:
+    """사이드 메뉴 열 (행 i 의 메뉴 = offsets[i]:offsets[i+1], 순서는 Restaurant.side_menus)"""
+
+    offsets: np.ndarray
+    price: np.ndarray
+    signature: np.ndarray
+    pairing: np.ndarray
+
+    @classmethod
+    def encode(cls, restaurants: Sequence[Restaurant]) -> "SideMenuColumn":
+        menus = [m for r in restaurants for m in r.side_menus]
+        lengths = np.fromiter(
+            (len(r.side_menus) for r in restaurants), dtype=np.int64, count=len(restaurants)
+        )
+        offsets = np.zeros(len(restaurants) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(
+            offsets,
+            np.fromiter((m.price for m in menus), dtype=np.int32, count=len(menus)),
+            np.fromiter((m.is_signature for m in menus), dtype=np.bool_, count=len(menus)),
+            np.fromiter((bool(m.pairing_note) for m in menus), dtype=np.bool_, count=len(menus)),
+        )
+
+
+# 맛 프로필 행렬의 열 (이름 → 값 추출)
+TASTE_FIELDS: dict[str, Any] = {
+    "clarity": lambda r: r.broth.clarity_level,
+    "depth": lambda r: r.broth.depth_level,
+    "saltiness": lambda r: r.broth.saltiness_level,
+    "beef_aroma": lambda r: r.broth.beef_aroma_level,
+    "buckwheat_ratio": lambda r: r.noodle.buckwheat_ratio,
+    "broth_clarity": lambda r: r.expert_rating.broth_clarity,
+    "broth_depth": lambda r: r.expert_rating.broth_depth,
+    "noodle_aroma": lambda r: r.expert_rating.noodle_aroma,
+    "noodle_texture": lambda r: r.expert_rating.noodle_texture,
+    "temperature": lambda r: r.expert_rating.temperature,
+    "overall_balance": lambda r: r.expert_rating.overall_balance,
+    "authenticity": lambda r: r.expert_rating.authenticity_score,
+}
+TASTE_INDEX = {name: i for i, name in enumerate(TASTE_FIELDS)}
+
+# 특징 플래그 행렬의 열 (이름 → 값 추출)
+FLAG_FIELDS: dict[str, Any] = {
+    "uses_soy_sauce": lambda r: r.broth.uses_soy_sauce,
+    "homemade": lambda r: r.noodle.homemade,
+    "pyeonyuk": lambda r: r.toppings.has_pyeonyuk,
+    "egg": lambda r: r.toppings.has_egg,
+    "cucumber": lambda r: r.toppings.has_cucumber,
+    "pear": lambda r: r.toppings.has_pear,
+    "dongchimi_mu": lambda r: r.toppings.has_dongchimi_mu,
+    "red_pepper_powder": lambda r: r.toppings.has_red_pepper_powder,
+}
+
+# 열거형 열 (이름 → (열거형, 값 추출))
+CODE_FIELDS: dict[str, tuple[type[Enum], Any]] = {
+    "region": (Region, lambda r: r.region),
+    "lineage": (Lineage, lambda r: r.lineage),
+    "broth_base": (BrothBase, lambda r: r.broth.base),
+    "noodle_style": (NoodleStyle, lambda r: r.noodle.style),
+    "noodle_thickness": (NoodleThickness, lambda r: r.noodle.thickness),
+}
+
+
+def _is_michelin(r: Restaurant) -> bool:
+    return any(c.type.value.startswith("michelin") for c in r.certifications)
+
+
+# 웨이팅 정보가 있는 맛집이 하나도 없을 때의 예상 웨이팅 (분)
+DEFAULT_WAIT_MINUTES = 20
+
+
+@dataclass(frozen=True, slots=True)
+class RestaurantColumns:
+    """필터/정렬용 열 (행 = 스냅샷 내 위치)
+
+    typical_wait 는 웨이팅 정보가 있는 맛집의 중앙값으로, 정보가 없는 맛집의 예상 웨이팅이다.
+    """
+
+    id: np.ndarray
+    tier: np.ndarray
+    rating: np.ndarray
+    price: np.ndarray
+    wait: np.ndarray
+    has_slush_ice: np.ndarray
+    dongchimi: np.ndarray
+    michelin: np.ndarray
+    taste: np.ndarray
+    flags: np.ndarray
+    location: np.ndarray
+    hours: np.ndarray
+    holiday_closed: np.ndarray
+    region: CodeColumn
+    lineage: CodeColumn
+    broth_base: CodeColumn
+    noodle_style: CodeColumn
+    noodle_thickness: CodeColumn
+    recommended_for: MultiCodeColumn
+    side_menus: SideMenuColumn
+    slug: tuple[str | None, ...]
+    name: tuple[str, ...]
+    name_english: tuple[str | None, ...]
+    name_hanja: tuple[str | None, ...]
+    typical_wait: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        known = self.wait[self.wait >= 0]
+        typical = int(np.median(known)) if len(known) else DEFAULT_WAIT_MINUTES
+        object.__setattr__(self, "typical_wait", typical)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def taste_column(self, field: str) -> np.ndarray:
+        """맛 프로필 항목 하나 (행렬이 열 우선이므로 연속 메모리 뷰)"""
+        return self.taste[:, TASTE_INDEX[field]]
+
+    def expected_wait(self, positions: np.ndarray) -> np.ndarray:
+        """위치별 예상 웨이팅 (분, 정보가 없으면 typical_wait)"""
+        wait = self.wait[positions].astype(np.int64)
+        return np.where(wait >= 0, wait, self.typical_wait)
+
+    @classmethod
+    def from_restaurants(cls, restaurants: Sequence[Restaurant]) -> "RestaurantColumns":
+        """검증된 레코드에서 열 추출"""
+        n = len(restaurants)
+
+        def column(get: Any, dtype: Any) -> np.ndarray:
+            return np.fromiter((get(r) for r in restaurants), dtype=dtype, count=n)
+
+        taste = np.empty((n, len(TASTE_FIELDS)), dtype=np.int16, order="F")
+        for i, get in enumerate(TASTE_FIELDS.values()):
+            taste[:, i] = column(get, np.int16)
+        flags = np.empty((n, len(FLAG_FIELDS)), dtype=np.bool_, order="F")
+        for i, get in enumerate(FLAG_FIELDS.values()):
+            flags[:, i] = column(get, np.bool_)
+        location = np.full((n, 2), np.nan, dtype=np.float64, order="F")
+        for i, r in enumerate(restaurants):
+            if r.latitude is not None and r.longitude is not None:
+                location[i] = (r.latitude, r.longitude)
+        hours, holiday_closed = compile_hours(restaurants)
+
+        return cls(
+            id=column(lambda r: r.id, np.int64),
+            tier=column(lambda r: r.tier, np.int8),
+            rating=column(lambda r: r.rating_score or 0, np.float64),
+            price=column(lambda r: r.naengmyeon_price, np.int32),
+            wait=column(
+                lambda r: -1 if r.average_wait_minutes is None else r.average_wait_minutes,
+                np.int32,
+            ),
+            has_slush_ice=column(lambda r: r.broth.has_slush_ice, np.bool_),
+            dongchimi=column(lambda r: r.broth.dongchimi, np.bool_),
+            michelin=column(_is_michelin, np.bool_),
+            taste=taste,
+            flags=flags,
+            location=location,
+            hours=hours,
+            holiday_closed=holiday_closed,
+            **{
+                name: CodeColumn.encode([get(r) for r in restaurants], enum)
+                for name, (enum, get) in CODE_FIELDS.items()
+            },
+            recommended_for=MultiCodeColumn.encode(
+                [r.recommended_for for r in restaurants], ExperienceLevel
+            ),
+            side_menus=SideMenuColumn.encode(restaurants),
+            slug=tuple(r.slug for r in restaurants),
+            name=tuple(r.name for r in restaurants),
+            name_english=tuple(r.name_english for r in restaurants),
+            name_hanja=tuple(r.name_hanja for r in restaurants),
+        )
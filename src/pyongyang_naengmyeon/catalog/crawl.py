@@ -0,0 +1,289 @@
+"""냉면 투어 경로 계획 (plan_crawl)
+
+후보 맛집 중 stops 곳을 골라 방문 순서를 정한다.
+점수 = Σ 가치 − MINUTE_COST × 소요 시간(분). 가치는 평점 + 최상위 등급 가산점,
+소요 시간은 출발부터 마지막 식사를 마칠 때까지 (이동 + 웨이팅 + 개점 대기 + 식사).
+
+- 이동: 하버사인 거리 × DETOUR / TRAVEL_KMH + 환승 고정 시간
+- 웨이팅: average_wait_minutes (없으면 카탈로그 중앙값 typical_wait — 0 으로 두면 정보가
+  없는 곳을 줄이 없는 곳으로 보고 우선하게 된다). 줄을 선 뒤 영업 중일 때 착석하며,
+  브레이크타임이나 개점 전이면 MAX_IDLE_MINUTES 까지 기다린다 (영업 비트맵, hours.py)
+- 후보가 많으면 출발 위치 기준 점수로 상위 CANDIDATE_LIMIT 곳만 남긴다 (벡터 연산)
+- 선택: 최근접 이웃식 탐욕 구성 → 한 곳씩 교체하는 지역 탐색 (시간 예산 안에서)
+- 순서: 고른 곳에 대해 (방문 집합, 마지막 맛집) 별 가장 이른 종료 시각 DP.
+  착석 시각은 도착 시각에 대해 단조이므로 k ≤ MAX_STOPS 에서 최소 소요 순서를 찾는다
+"""
+
+import math
+import os
+import time
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import numpy as np
+
+from .columns import RestaurantColumns
+from .geo import haversine
+from .hours import DAY_MINUTES, SLOT_MINUTES, WEEK_BYTES, WEEK_SLOTS, OpenAt
+
+MAX_STOPS = 8
+# 정렬 후 남길 후보 수
+CANDIDATE_LIMIT = 40
+# 점수: 1분 = 평점 0.01 (웨이팅 1시간 ≈ 평점 0.6)
+MINUTE_COST = 0.01
+TIER_BONUS = 0.3
+# 이동 시간 추정 (도심 대중교통/도보 평균)
+TRAVEL_KMH = 20.0
+DETOUR = 1.3
+TRANSFER_MINUTES = 10.0
+MAX_IDLE_MINUTES = 90
+# 지역 탐색 시간 예산
+BUDGET_SECONDS = float(os.environ.get("NAENGMYEON_CRAWL_BUDGET_MS", "50")) / 1000
+
+_NEVER = np.iinfo(np.int32).max
+
+
+class Stop(NamedTuple):
+    """방문 한 곳 (시각은 출발 주 월요일 0시 기준 분)"""
+
+    position: int
+    distance: float  # 직전 위치에서 (미터)
+    travel: float  # 이동 시간 (분)
+    arrive: float
+    wait: int  # 웨이팅 (분)
+    idle: float  # 개점/브레이크 대기 (분)
+    seat: float
+    leave: float
+
+
+class CrawlPlan(NamedTuple):
+    """투어 계획"""
+
+    stops: list[Stop]
+    start: float
+    score: float
+    candidates: int  # 고려한 후보 수
+
+    @property
+    def finish(self) -> float:
+        return self.stops[-1].leave if self.stops else self.start
+
+
+def travel_minutes(meters: np.ndarray) -> np.ndarray:
+    """직선 거리 (미터 배열) → 이동 시간 추정 (분)"""
+    return meters * DETOUR / (TRAVEL_KMH * 1000 / 60) + TRANSFER_MINUTES
+
+
+class _Problem:
+    """후보 M곳에 대한 계획 문제 (거리/이동 시간 행렬, 개점 시각 표)"""
+
+    def __init__(
+        self,
+        columns: RestaurantColumns,
+        positions: np.ndarray,
+        origin: tuple[float, float] | None,
+        start: float,
+        meal: int,
+    ):
+        self.positions = positions
+        self.start = start
+        self.meal = meal
+        lats, lons = columns.location[positions, 0], columns.location[positions, 1]
+        self.value = columns.rating[positions] + TIER_BONUS * (columns.tier[positions] == 1)
+        self.wait = columns.expected_wait(positions)
+        self.distance = haversine(lats[:, None], lons[:, None], lats[None, :], lons[None, :])
+        self.travel = travel_minutes(self.distance)
+        np.fill_diagonal(self.travel, 0.0)
+        if origin is None:
+            # 출발 위치가 없으면 첫 맛집에서 시작
+            self.start_distance: np.ndarray = np.zeros(len(positions))
+            self.start_travel: np.ndarray = np.zeros(len(positions))
+        else:
+            self.start_distance = haversine(origin[0], origin[1], lats, lons)
+            self.start_travel = travel_minutes(self.start_distance)
+
+        # next_open[c, s] = s 이후 처음 영업 중인 칸 (두 주 분량, 없으면 _NEVER)
+        open_bits = np.unpackbits(columns.hours[positions], axis=1).astype(bool)
+        open_bits = np.concatenate([open_bits, open_bits], axis=1)
+        slots = np.where(open_bits, np.arange(2 * WEEK_SLOTS, dtype=np.int32), _NEVER)
+        self.next_open = np.minimum.accumulate(slots[:, ::-1], axis=1)[:, ::-1]
+
+    def seat(self, c: int, ready: float) -> float:
+        """웨이팅을 마친 시각 ready 이후 착석 시각 (불가능하면 inf)"""
+        slot = int(ready) // SLOT_MINUTES
+        if slot >= 2 * WEEK_SLOTS:
+            return math.inf
+        opens = int(self.next_open[c, slot])
+        if opens == _NEVER:
+            return math.inf
+        seat = max(ready, float(opens * SLOT_MINUTES))
+        return seat if seat - ready <= MAX_IDLE_MINUTES else math.inf
+
+    def _hop(self, prev: int | None, c: int) -> float:
+        return float(self.start_travel[c] if prev is None else self.travel[prev, c])
+
+    def evaluate(self, route: Sequence[int]) -> float:
+        """경로 점수 (불가능하면 -inf)"""
+        t, prev = self.start, None
+        for c in route:
+            seat = self.seat(c, t + self._hop(prev, c) + self.wait[c])
+            if seat == math.inf:
+                return -math.inf
+            t, prev = seat + self.meal, c
+        return float(self.value[list(route)].sum()) - MINUTE_COST * (t - self.start)
+
+    def stops(self, route: Sequence[int]) -> list[Stop]:
+        out: list[Stop] = []
+        t, prev = self.start, None
+        for c in route:
+            distance = self.start_distance[c] if prev is None else self.distance[prev, c]
+            arrive = t + self._hop(prev, c)
+            ready = arrive + self.wait[c]
+            seat = self.seat(c, ready)
+            out.append(Stop(
+                int(self.positions[c]), float(distance), float(self._hop(prev, c)), arrive,
+                int(self.wait[c]), seat - ready, seat, seat + self.meal,
+            ))
+            t, prev = seat + self.meal, c
+        return out
+
+    def greedy(self, k: int) -> list[int]:
+        """최근접 이웃식 구성: 현재 위치/시각에서 한 곳을 더했을 때 점수 증가가 가장 큰 곳"""
+        m = len(self.positions)
+        used = np.zeros(m, dtype=bool)
+        route: list[int] = []
+        t, hop = self.start, self.start_travel
+        rows = np.arange(m)
+        for _ in range(k):
+            ready = t + hop + self.wait
+            slots = ready.astype(np.int64) // SLOT_MINUTES
+            valid = ~used & (slots < 2 * WEEK_SLOTS)
+            opens = np.full(m, _NEVER, dtype=np.int64)
+            opens[valid] = self.next_open[rows[valid], slots[valid]]
+            seat = np.maximum(ready, opens.astype(np.float64) * SLOT_MINUTES)
+            ok = valid & (opens != _NEVER) & (seat - ready <= MAX_IDLE_MINUTES)
+            if not ok.any():
+                break
+            gain = np.where(ok, self.value - MINUTE_COST * (seat + self.meal - t), -np.inf)
+            c = int(np.argmax(gain))
+            route.append(c)
+            used[c] = True
+            t, hop = float(seat[c]) + self.meal, self.travel[c]
+        return route
+
+    def best_order(self, chosen: Sequence[int]) -> list[int]:
+        """고른 곳의 최소 소요 순서 (집합 × 마지막 맛집 DP)"""
+        k = len(chosen)
+        full = (1 << k) - 1
+        # 내부 반복용 파이썬 값
+        travel = self.travel[np.ix_(chosen, chosen)].tolist()
+        ready_offset = [float(self.wait[c]) for c in chosen]
+        opens = [self.next_open[c].tolist() for c in chosen]
+        meal = self.meal
+
+        def leave_at(j: int, ready: float) -> float:
+            # seat() 과 같은 계산 (파이썬 리스트 조회)
+            slot = int(ready) // SLOT_MINUTES
+            if slot >= 2 * WEEK_SLOTS or opens[j][slot] == _NEVER:
+                return math.inf
+            seat = max(ready, float(opens[j][slot] * SLOT_MINUTES))
+            return seat + meal if seat - ready <= MAX_IDLE_MINUTES else math.inf
+
+        # finish[mask][i] = mask 를 방문하고 chosen[i] 에서 마친 가장 이른 시각
+        finish = [[math.inf] * k for _ in range(1 << k)]
+        parent = [[-1] * k for _ in range(1 << k)]
+        for i, c in enumerate(chosen):
+            finish[1 << i][i] = leave_at(i, self.start + self.start_travel[c] + ready_offset[i])
+        for mask in range(1, full + 1):
+            row = finish[mask]
+            for i in range(k):
+                done = row[i]
+                if done == math.inf:
+                    continue
+                hops = travel[i]
+                for j in range(k):
+                    if mask >> j & 1:
+                        continue
+                    leave = leave_at(j, done + hops[j] + ready_offset[j])
+                    nxt = mask | 1 << j
+                    if leave < finish[nxt][j]:
+                        finish[nxt][j] = leave
+                        parent[nxt][j] = i
+        i = min(range(k), key=lambda i: finish[full][i])
+        if finish[full][i] == math.inf:
+            return list(chosen)
+        order, mask = [], full
+        while i != -1:
+            order.append(chosen[i])
+            mask, i = mask ^ (1 << i), parent[mask][i]
+        return order[::-1]
+
+    def improve(self, route: list[int], deadline: float) -> list[int]:
+        """한 곳씩 후보로 바꿔 보고, 나아지면 순서를 다시 최적화 (시간 예산 안에서)"""
+        route = self.best_order(route)
+        best = self.evaluate(route)
+        others = [c for c in np.argsort(-self.value, kind="stable").tolist() if c not in route]
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = False
+            for i in range(len(route)):
+                for j, c in enumerate(others):
+                    trial = route[:i] + [c] + route[i + 1:]
+                    score = self.evaluate(trial)
+                    if score <= best:
+                        continue
+                    trial = self.best_order(trial)
+                    others[j] = route[i]
+                    route, best, improved = trial, self.evaluate(trial), True
+                    break
+                if time.perf_counter() >= deadline:
+                    break
+        return route
+
+
+def plan_crawl(
+    columns: RestaurantColumns,
+    mask: np.ndarray | None,
+    origin: tuple[float, float] | None,
+    when: OpenAt,
+    stops: int,
+    meal_minutes: int,
+    budget: float = BUDGET_SECONDS,
+) -> CrawlPlan:
+    """mask 후보 중 stops 곳의 투어 계획 (후보가 부족하면 가능한 만큼)
+
+    origin 이 없으면 첫 맛집에서 출발한다. 좌표가 없거나 when 날짜의 공휴일
+    휴무인 맛집, 계획 시간대에 영업하지 않는 맛집은 제외한다.
+    """
+    deadline = time.perf_counter() + budget
+    start = float(when.weekday * DAY_MINUTES + when.minute)
+    stops = min(stops, MAX_STOPS)
+
+    eligible = ~np.isnan(columns.location).any(axis=1)
+    if mask is not None:
+        eligible &= mask
+    if when.holidays:
+        eligible &= ~columns.holiday_closed[:, when.holidays].any(axis=1)
+    # 계획 시간대(최대 하루)에 영업하는 곳 (바이트 단위 근사)
+    horizon = min(stops * (meal_minutes + MAX_IDLE_MINUTES + 60), DAY_MINUTES)
+    first = int(start) // SLOT_MINUTES // 8
+    window = np.arange(first, first + horizon // SLOT_MINUTES // 8 + 1) % WEEK_BYTES
+    eligible &= columns.hours[:, window].any(axis=1)
+    positions = np.flatnonzero(eligible)
+
+    if len(positions) > CANDIDATE_LIMIT:
+        # 출발 위치와 웨이팅을 반영한 가치 상위만
+        rank = columns.rating[positions] + TIER_BONUS * (columns.tier[positions] == 1)
+        rank = rank - MINUTE_COST * columns.expected_wait(positions)
+        if origin is not None:
+            lats, lons = columns.location[positions, 0], columns.location[positions, 1]
+            rank = rank - MINUTE_COST * travel_minutes(haversine(origin[0], origin[1], lats, lons))
+        top = np.argpartition(-rank, CANDIDATE_LIMIT - 1)[:CANDIDATE_LIMIT]
+        positions = np.sort(positions[top])
+
+    problem = _Problem(columns, positions, origin, start, meal_minutes)
+    route = problem.greedy(stops)
+    if route:
+        route = problem.improve(route, deadline)
+    score = problem.evaluate(route) if route else 0.0
+    return CrawlPlan(problem.stops(route), start, score, len(positions))
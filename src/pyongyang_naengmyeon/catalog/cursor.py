@@ -0,0 +1,46 @@
+"""검색 결과 페이지 커서
+
+커서는 (스냅샷 버전, 검색 조건 지문, 오프셋)을 담은 불투명 토큰이다.
+정렬 순서는 스냅샷 안에서 결정적이므로 오프셋만으로 안정적인 페이지를
+가리킬 수 있고, 조건이나 스냅샷이 바뀌면 커서를 거부한다.
+"""
+
+import base64
+import hashlib
+import json
+from typing import Any
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없거나 다른 조건/스냅샷의 커서"""
+
+
+def fingerprint(conditions: dict[str, Any]) -> str:
+    """검색 조건 지문"""
+    canonical = json.dumps(conditions, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:12]
+
+
+def encode_cursor(version: str, conditions_fp: str, offset: int) -> str:
+    """커서 토큰 생성"""
+    raw = json.dumps({"v": version, "f": conditions_fp, "o": offset}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, version: str, conditions_fp: str) -> int:
+    """커서 토큰 → 오프셋"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        offset = int(data["o"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("잘못된 cursor 입니다.") from e
+    if data.get("v") != version:
+        raise InvalidCursorError(
+            "데이터가 갱신되어 cursor 가 만료되었습니다. 검색을 다시 시작하세요."
+        )
+    if data.get("f") != conditions_fp:
+        raise InvalidCursorError("검색 조건이 달라 cursor 를 사용할 수 없습니다.")
+    if offset < 0:
+        raise InvalidCursorError("잘못된 cursor 입니다.")
+    return offset
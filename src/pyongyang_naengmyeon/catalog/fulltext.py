@@ -0,0 +1,176 @@
+"""한국어 전문 검색 (BM25)
+
+search_restaurants 의 query 필드를 처리한다.
+
+- 토큰화: 한글은 음절 n-gram (unigram + bigram), 영문/숫자는 단어 단위
+- 역색인: 스냅샷 로드 시 한 번 구축. 용어별 (문서 위치, BM25 가중치) 배열을
+  미리 계산해 두므로 질의 시에는 가중치 합산과 top-k 선택만 한다.
+"""
+
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+
+from ..models import Restaurant
+
+# BM25 파라미터
+K1 = 1.2
+B = 0.75
+
+_WORD = re.compile(r"[가-힣]+|[a-z0-9]+")
+
+
+def _is_hangul(word: str) -> bool:
+    return "가" <= word[0] <= "힣"
+
+
+def tokenize(text: str, *, index: bool = False) -> Iterator[str]:
+    """텍스트 → 검색 용어
+
+    index=True 이면 한글 단어의 unigram 도 함께 만든다 (한 글자 질의용).
+    """
+    for word in _WORD.findall(text.casefold()):
+        if not _is_hangul(word) or len(word) == 1:
+            yield word
+            continue
+        for i in range(len(word) - 1):
+            yield word[i:i + 2]
+        if index:
+            yield from word
+
+
+def document_text(r: Restaurant) -> str:
+    """검색 대상 필드 결합"""
+    parts = [
+        r.broth.description,
+        r.noodle.description,
+        *r.noodle.texture_keywords,
+        *r.tags,
+        *r.features,
+        *r.special_notes,
+        r.expert_rating.reviewer_note,
+    ]
+    return "\n".join(p for p in parts if p)
+
+
+class FullTextIndex:
+    """BM25 역색인 (불변)"""
+
+    def __init__(self, restaurants: Sequence[Restaurant]):
+        self.size = len(restaurants)
+        docs: dict[str, list[int]] = defaultdict(list)
+        freqs: dict[str, list[int]] = defaultdict(list)
+        lengths = np.zeros(self.size, dtype=np.float32)
+
+        for pos, r in enumerate(restaurants):
+            counts = Counter(tokenize(document_text(r), index=True))
+            lengths[pos] = sum(counts.values())
+            for term, tf in counts.items():
+                docs[term].append(pos)
+                freqs[term].append(tf)
+
+        avgdl = float(lengths.mean()) if self.size else 0.0
+        norm = K1 * (1 - B + B * lengths / avgdl) if avgdl else lengths
+
+        # 용어별 BM25 가중치 사전 계산: idf * tf(k1+1) / (tf + k1(1-b+b·dl/avgdl))
+        self._postings: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for term, positions in docs.items():
+            pos_arr = np.asarray(positions, dtype=np.int32)
+            tfs = np.asarray(freqs[term], dtype=np.float32)
+            df = len(positions)
+            idf = np.log(1 + (self.size - df + 0.5) / (df + 0.5))
+            weights = (idf * tfs * (K1 + 1) / (tfs + norm[pos_arr])).astype(np.float32)
+            self._postings[term] = (pos_arr, weights)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        size: int,
+        terms: Sequence[str],
+        offsets: np.ndarray,
+        positions: np.ndarray,
+        weights: np.ndarray,
+    ) -> "FullTextIndex":
+        """미리 계산된 포스팅 배열로 생성 (컴파일된 카탈로그용)
+
+        용어 i 의 포스팅은 positions/weights[offsets[i]:offsets[i+1]] 이다.
+        """
+        index = cls.__new__(cls)
+        index.size = size
+        bounds = offsets.tolist()
+        index._postings = {
+            term: (positions[start:stop], weights[start:stop])
+            for term, start, stop in zip(terms, bounds, bounds[1:])
+        }
+        return index
+
+    def to_arrays(self) -> tuple[list[str], np.ndarray, np.ndarray, np.ndarray]:
+        """(용어, offsets, positions, weights) — from_arrays 의 역"""
+        terms = list(self._postings)
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum([len(self._postings[t][0]) for t in terms], out=offsets[1:])
+        if not terms:
+            return terms, offsets, np.zeros(0, np.int32), np.zeros(0, np.float32)
+        positions = np.concatenate([self._postings[t][0] for t in terms])
+        weights = np.concatenate([self._postings[t][1] for t in terms])
+        return terms, offsets, positions, weights
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def scores(self, query: str) -> np.ndarray:
+        """전체 문서 BM25 점수 벡터"""
+        scores = np.zeros(self.size, dtype=np.float32)
+        for term, qtf in Counter(tokenize(query)).items():
+            posting = self._postings.get(term)
+            if posting is not None:
+                positions, weights = posting
+                scores[positions] += weights * qtf
+        return scores
+
+    def _masked_scores(self, query: str, candidates: np.ndarray | None) -> np.ndarray:
+        scores = self.scores(query)
+        if candidates is not None:
+            scores[~candidates] = 0
+        return scores
+
+    @staticmethod
+    def _top(scores: np.ndarray, matched: np.ndarray, k: int | None) -> np.ndarray:
+        """점수 상위 k 위치 (점수 내림차순, 동점은 위치 순)"""
+        if k is not None and k < len(matched):
+            # k번째 점수 경계에서 동점은 위치가 작은 것부터 (페이지 경계 안정성)
+            matched_scores = scores[matched]
+            kth = np.partition(matched_scores, len(matched) - k)[len(matched) - k]
+            above = matched[matched_scores > kth]
+            ties = matched[matched_scores == kth][:k - len(above)]
+            matched = np.sort(np.concatenate([above, ties]))
+        return matched[np.argsort(-scores[matched], kind="stable")]
+
+    def search(
+        self,
+        query: str,
+        k: int | None = None,
+        candidates: np.ndarray | None = None,
+    ) -> list[tuple[int, float]]:
+        """질의와 일치하는 (위치, 점수) 목록 (점수 높은 순)
+
+        candidates(구조화 필터 불리언 마스크)가 주어지면 해당 위치로 한정한다.
+        """
+        scores = self._masked_scores(query, candidates)
+        matched = self._top(scores, np.flatnonzero(scores), k)
+        return [(int(pos), float(scores[pos])) for pos in matched]
+
+    def page(
+        self,
+        query: str,
+        offset: int,
+        limit: int,
+        candidates: np.ndarray | None = None,
+    ) -> tuple[int, list[int]]:
+        """(전체 일치 건수, 관련도 순 offset 부터 limit 건의 위치)"""
+        scores = self._masked_scores(query, candidates)
+        matched = np.flatnonzero(scores)
+        top = self._top(scores, matched, offset + limit)
+        return len(matched), [int(pos) for pos in top[offset:]]
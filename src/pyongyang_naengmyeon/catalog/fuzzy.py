@@ -0,0 +1,191 @@
+"""오타/초성 허용 이름 검색
+
+정확/부분 일치로 맛집을 찾지 못했을 때 resolver 가 사용한다.
+
+- 한글은 자모 단위로 분해해 비교한다 ("을밀데" → "을밀대" 는 ㅔ/ㅐ 한 글자 차이)
+- 초성만 입력한 질의("ㅇㄹㅇ")는 이름의 초성 문자열로 정확/접두 일치
+- 편집 거리 후보는 SymSpell 방식의 삭제 사전으로 찾는다. 키마다 앞부분
+  PREFIX_LEN 글자에서 최대 MAX_DISTANCE 글자를 지운 변형을 미리 색인해 두고,
+  질의도 같은 변형을 만들어 사전에서 후보 키를 모은 뒤 실제 거리로 검증한다.
+  질의 비용은 카탈로그 크기가 아니라 변형 수와 후보 수에 비례한다.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = ("", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+_SYLLABLE_FIRST, _SYLLABLE_COUNT = 0xAC00, 11172
+# 호환 자모 자음 범위 (ㄱ ~ ㅎ)
+_CONSONANTS = frozenset(chr(c) for c in range(0x3131, 0x314F))
+
+MAX_DISTANCE = 2
+PREFIX_LEN = 7
+# 초성 접두 일치 후보 상한 (정확 일치는 모두 포함)
+MAX_PREFIX_MATCHES = 50
+
+
+# 음절 → 자모 변환표 (str.translate 용)
+_JAMO = {
+    _SYLLABLE_FIRST + code: CHOSUNG[code // 588] + JUNGSUNG[code % 588 // 28] + JONGSUNG[code % 28]
+    for code in range(_SYLLABLE_COUNT)
+}
+
+
+def decompose(text: str) -> str:
+    """한글 음절 → 초성/중성/종성 자모 (그 외 문자는 그대로)"""
+    return text.translate(_JAMO)
+
+
+def chosung(text: str) -> str:
+    """한글 음절의 초성만 (한글이 아닌 문자는 버림)"""
+    out = []
+    for ch in text:
+        code = ord(ch) - _SYLLABLE_FIRST
+        if 0 <= code < _SYLLABLE_COUNT:
+            out.append(CHOSUNG[code // 588])
+        elif ch in _CONSONANTS:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_chosung_query(text: str) -> bool:
+    """초성(자음)만으로 된 질의인지"""
+    return bool(text) and all(ch in _CONSONANTS for ch in text)
+
+
+def max_distance(length: int) -> int:
+    """질의 길이(자모 수)별 허용 편집 거리"""
+    if length < 4:
+        return 0
+    return 1 if length < 8 else MAX_DISTANCE
+
+
+def _deletes(word: str, distance: int) -> set[str]:
+    """word 에서 최대 distance 글자를 지운 변형 (word 자신 포함)"""
+    variants = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """인접 전치를 포함한 편집 거리 (limit 초과 시 limit + 1)
+
+    공통 접두/접미를 떼고 대각선 ±limit 띠 안의 칸만 계산한다.
+    """
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    over = limit + 1
+    prev2: list[int] = []
+    prev = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        cur = [over] * (len(b) + 1)
+        if i <= limit:
+            cur[0] = i
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            cost = a[i - 1] != b[j - 1]
+            value = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, prev2[j - 2] + 1)
+            cur[j] = value
+        if min(cur) > limit:
+            return over
+        prev2, prev = prev, cur
+    return min(prev[-1], over)
+
+
+class FuzzyNameIndex:
+    """자모 편집 거리 + 초성 색인 (불변)
+
+    names[pos] 는 맛집 하나의 정규화된 이름들 (이름, 영문명, 한자명, slug).
+    """
+
+    def __init__(self, names: Sequence[Iterable[str]], korean: Sequence[str]):
+        self._keys: list[str] = []
+        self._key_positions: list[list[int]] = []
+        key_ids: dict[str, int] = {}
+        for pos, row in enumerate(names):
+            for name in row:
+                key = decompose(name)
+                key_id = key_ids.get(key)
+                if key_id is None:
+                    key_id = key_ids[key] = len(self._keys)
+                    self._keys.append(key)
+                    self._key_positions.append([])
+                self._key_positions[key_id].append(pos)
+
+        # 접두 → 길이 → 키 번호. 지점명 등으로 접두가 같은 키가 많아 접두 단위로 색인한다
+        self._by_prefix: dict[str, dict[int, list[int]]] = defaultdict(lambda: defaultdict(list))
+        for key_id, key in enumerate(self._keys):
+            self._by_prefix[key[:PREFIX_LEN]][len(key)].append(key_id)
+        # 삭제 변형 → 접두
+        deletes: dict[str, list[str]] = defaultdict(list)
+        for prefix in self._by_prefix:
+            for variant in _deletes(prefix, MAX_DISTANCE):
+                deletes[variant].append(prefix)
+        self._deletes = dict(deletes)
+
+        # (초성 문자열, 위치) 정렬 목록 — 정확/접두 일치를 이분 탐색
+        self._chosung = sorted((chosung(name), pos) for pos, name in enumerate(korean) if name)
+        self._chosung_keys = [c for c, _ in self._chosung]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def typo_matches(self, query: str) -> dict[int, int]:
+        """편집 거리 허용 범위 안의 {위치: 거리}"""
+        query = decompose(query)
+        limit = max_distance(len(query))
+        if not limit:
+            return {}
+        prefixes = {
+            p for v in _deletes(query[:PREFIX_LEN], limit) for p in self._deletes.get(v, ())
+        }
+        found: dict[int, int] = {}
+        for prefix in prefixes:
+            by_length = self._by_prefix[prefix]
+            # 길이 차가 limit 을 넘는 키는 볼 필요 없음
+            for length in range(len(query) - limit, len(query) + limit + 1):
+                for key_id in by_length.get(length, ()):
+                    distance = edit_distance(query, self._keys[key_id], limit)
+                    if distance > limit:
+                        continue
+                    for pos in self._key_positions[key_id]:
+                        if distance < found.get(pos, limit + 1):
+                            found[pos] = distance
+        return found
+
+    def chosung_matches(self, query: str) -> dict[int, int]:
+        """초성 정확 일치는 0, 접두 일치는 1 인 {위치: 순위}"""
+        found: dict[int, int] = {}
+        prefix = 0
+        # 정렬 순서상 정확 일치가 접두 일치보다 앞에 온다
+        for i in range(bisect_left(self._chosung_keys, query), len(self._chosung)):
+            initials, pos = self._chosung[i]
+            if not initials.startswith(query):
+                break
+            if initials != query:
+                prefix += 1
+                if prefix > MAX_PREFIX_MATCHES:
+                    break
+            found[pos] = min(found.get(pos, 1), int(initials != query))
+        return found
+
+    def matches(self, query: str) -> dict[int, int]:
+        """정규화된 질의 → {위치: 거리}"""
+        if is_chosung_query(query):
+            return self.chosung_matches(query)
+        return self.typo_matches(query)
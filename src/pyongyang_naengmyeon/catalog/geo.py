@@ -0,0 +1,154 @@
+"""위치 기반 검색 (search_nearby)
+
+스냅샷 로드 시 좌표가 있는 맛집을 위경도 격자 칸(CELL_DEGREES)으로 묶어
+칸 번호 순으로 정렬해 둔다. 반경 질의는 반경을 덮는 칸 범위를 행(위도 칸)마다
+searchsorted 두 번으로 잘라 후보를 모으고, 후보만 하버사인 거리로 검증한다.
+k-최근접은 반경을 두 배씩 넓혀 가며 k 건이 모이면 멈춘다 (반경 안의 상위 k 건이
+전체 상위 k 건과 같다). 질의 비용은 전국 규모에서도 주변 칸의 맛집 수에 비례한다.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from .resolver import normalize
+
+EARTH_RADIUS_M = 6_371_008.8
+# 격자 칸 크기 (위도 0.01° ≈ 1.1 km)
+CELL_DEGREES = 0.01
+# 칸 번호 = 위도 칸 * _ROW + 경도 칸 (경도 칸은 0 ~ 36000)
+_ROW = 100_000
+# k-최근접 첫 탐색 반경 / 최대 반경
+NEAREST_START_M = 1_000.0
+NEAREST_MAX_M = 1_000_000.0
+
+
+class Place(NamedTuple):
+    """기준 위치 (역/랜드마크)"""
+
+    name: str
+    latitude: float
+    longitude: float
+
+
+def haversine(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """(lat, lon) 에서 각 점까지의 대원 거리 (미터)"""
+    lat1, lon1 = np.radians(lat), np.radians(lon)
+    lat2, lon2 = np.radians(lats), np.radians(lons)
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return np.asarray(2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0))), dtype=np.float64)
+
+
+def _cells(lats: np.ndarray, lons: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    rows = np.floor((lats + 90) / CELL_DEGREES).astype(np.int64)
+    cols = np.floor((lons + 180) / CELL_DEGREES).astype(np.int64)
+    return rows, cols
+
+
+def load_places(data: Mapping[str, Any]) -> Mapping[str, Place]:
+    """places.json → {정규화된 이름/별칭: Place}
+
+    "○○역" 은 "○○" 로도 찾을 수 있다.
+    """
+    places: dict[str, Place] = {}
+    for entry in data.get("places", []):
+        place = Place(entry["name"], float(entry["latitude"]), float(entry["longitude"]))
+        names = [entry["name"], *entry.get("aliases", [])]
+        if entry["name"].endswith("역"):
+            names.append(entry["name"][:-1])
+        for name in names:
+            places.setdefault(normalize(name), place)
+    return MappingProxyType(places)
+
+
+def find_place(places: Mapping[str, Place], name: str) -> Place | None:
+    """이름/별칭으로 기준 위치 조회 (대소문자/공백 무시)"""
+    return places.get(normalize(name))
+
+
+class GeoIndex:
+    """위경도 격자 색인 (불변)"""
+
+    def __init__(self, location: np.ndarray):
+        """location: (행 × [위도, 경도]) 배열, 좌표가 없는 행은 NaN"""
+        self.size = len(location)
+        located = np.flatnonzero(~np.isnan(location).any(axis=1))
+        rows, cols = _cells(location[located, 0], location[located, 1])
+        keys = rows * _ROW + cols
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._positions = located[order]
+        self._lats = location[self._positions, 0]
+        self._lons = location[self._positions, 1]
+
+    def __len__(self) -> int:
+        """좌표가 있는 맛집 수"""
+        return len(self._positions)
+
+    def _candidates(self, lat: float, lon: float, radius: float) -> np.ndarray:
+        """반경을 덮는 칸에 속한 항목 번호 (정렬 배열 기준)"""
+        dlat = np.degrees(radius / EARTH_RADIUS_M)
+        # 고위도 쪽 경계에서 경도 1° 가 가장 짧으므로 그 기준으로 넓힘
+        edge = min(abs(lat) + dlat, 89.9)
+        dlon = min(np.degrees(radius / (EARTH_RADIUS_M * np.cos(np.radians(edge)))), 180.0)
+        (row0, row1), (col0, col1) = _cells(
+            np.array([lat - dlat, lat + dlat]), np.array([lon - dlon, lon + dlon])
+        )
+        rows = np.arange(row0, row1 + 1)
+        if dlon >= 180.0 or col0 < 0 or col1 >= 360 / CELL_DEGREES:
+            # 날짜변경선에 걸치면 경도 방향은 전체
+            bounds = np.stack([rows * _ROW, rows * _ROW + _ROW - 1], axis=1)
+        else:
+            bounds = np.stack([rows * _ROW + col0, rows * _ROW + col1], axis=1)
+        starts = np.searchsorted(self._keys, bounds[:, 0], side="left")
+        stops = np.searchsorted(self._keys, bounds[:, 1], side="right")
+        if len(starts) == 1:
+            return np.arange(starts[0], stops[0])
+        return np.concatenate([np.arange(a, b) for a, b in zip(starts, stops)])
+
+    def within(
+        self,
+        lat: float,
+        lon: float,
+        radius: float,
+        mask: np.ndarray | None = None,
+        limit: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """반경(미터) 안의 (위치, 거리) 가까운 순 (거리가 같으면 위치 순)
+
+        mask 를 주면 조건을 만족하는 맛집만, limit 을 주면 상위 limit 건만.
+        """
+        items = self._candidates(lat, lon, radius)
+        positions = self._positions[items]
+        if mask is not None:
+            keep = mask[positions]
+            items, positions = items[keep], positions[keep]
+        distances = haversine(lat, lon, self._lats[items], self._lons[items])
+        inside = distances <= radius
+        positions, distances = positions[inside], distances[inside]
+        if limit is not None and limit < len(distances):
+            # 상위 limit 건만 정렬
+            top = np.argpartition(distances, limit - 1)[:limit]
+            positions, distances = positions[top], distances[top]
+        order = np.lexsort((positions, distances))
+        return positions[order], distances[order]
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int,
+        mask: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """가까운 순 상위 k 건 (위치, 거리)"""
+        radius = NEAREST_START_M
+        while True:
+            positions, distances = self.within(lat, lon, radius, mask, k)
+            if len(positions) >= k or radius >= NEAREST_MAX_M:
+                return positions, distances
+            radius *= 2
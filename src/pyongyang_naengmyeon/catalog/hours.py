@@ -0,0 +1,310 @@
+"""영업시간 해석 / "지금 영업 중" 필터
+
+스냅샷 로드 시 맛집마다 영업시간 문자열을 한 번만 해석해 주간 비트맵으로 만든다.
+일주일을 SLOT_MINUTES 분 칸(WEEK_SLOTS 개)으로 나누고 영업 중인 칸을 1 로 표시해
+WEEK_BYTES 바이트로 압축한다 (np.packbits, 월요일 0시가 첫 비트).
+질의는 시각 → 칸 번호 → 열 하나의 비트 검사라 문자열을 다시 해석하지 않는다.
+
+- 영업시간: hours.weekday / hours.weekend (요일 표기가 없으면 각각 월–금 / 토–일),
+  둘 다 해석하지 못하면 hours_string (요일 표기가 없으면 매일)
+- "(브레이크타임 15:00–17:00)" 는 빼고, "(일 ~21:00)" 은 그 요일만 일찍 닫음,
+  라스트오더는 무시. 자정을 넘기는 영업은 다음 날 칸으로 이어진다
+- 휴무일: closed_days (비어 있으면 closed_days_string). 요일 휴무는 그 요일 칸을 비우고,
+  공휴일/명절 휴무는 HOLIDAY_KINDS 별 플래그로 두어 날짜가 주어진 질의에서만 적용
+- 공휴일 표: holidays.json (스냅샷과 함께 리로드). 표에 없는 날짜는 요일 기준으로만 판단
+- 해석하지 못한 항목은 로드 시 경고로 남긴다 (영업시간을 모르는 맛집은 영업 중으로 보지 않음)
+"""
+
+import logging
+import re
+from collections.abc import Mapping, Sequence
+from datetime import date, datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from ..models import Restaurant
+
+logger = logging.getLogger(__name__)
+
+DAYS = "월화수목금토일"  # date.weekday() 순서
+DAY_MINUTES = 24 * 60
+SLOT_MINUTES = 5
+DAY_SLOTS = DAY_MINUTES // SLOT_MINUTES
+WEEK_SLOTS = 7 * DAY_SLOTS
+WEEK_BYTES = WEEK_SLOTS // 8
+
+WEEKDAYS = (0, 1, 2, 3, 4)
+WEEKEND = (5, 6)
+EVERY_DAY = tuple(range(7))
+
+KST = timezone(timedelta(hours=9), "KST")
+
+# 휴무 플래그 열 순서
+HOLIDAY_KINDS = ("public", "seollal", "seollal_day", "chuseok", "chuseok_day")
+_HOLIDAY_INDEX = {kind: i for i, kind in enumerate(HOLIDAY_KINDS)}
+# 공휴일 표가 없을 때 (요일 기준으로만 판단)
+NO_HOLIDAYS: Mapping[date, str] = MappingProxyType({})
+# 상위 종류를 함께 가짐 (설 당일 → 설 연휴 → 공휴일)
+_IMPLIES = {
+    "public": (),
+    "seollal": ("public",),
+    "seollal_day": ("seollal", "public"),
+    "chuseok": ("public",),
+    "chuseok_day": ("chuseok", "public"),
+}
+
+_DASH = r"\s*[-–—~]\s*"
+_TIME = r"(\d{1,2}):(\d{2})"
+_RANGE = re.compile(_TIME + _DASH + _TIME)
+_DAY_SPEC = re.compile(rf"\s*(?:(매일)|([{DAYS}])(?:요일)?(?:{_DASH}([{DAYS}])(?:요일)?)?)\s+")
+_BREAK = re.compile(r"브레이크(?:\s*타임)?\s*" + _TIME + _DASH + _TIME)
+_EARLY_CLOSE = re.compile(rf"([{DAYS}])(?:요일)?\s*~\s*{_TIME}")
+_PAREN = re.compile(r"\([^)]*\)")
+_CLOSED_DAY = re.compile(rf"(?:매주\s*)?([{DAYS}])요일")
+# 날짜를 특정할 수 없는 휴무 (무시)
+_IRREGULAR = ("비정기", "변동", "연중무휴")
+
+
+class OpenAt(NamedTuple):
+    """영업 여부를 확인할 시각 (date 가 없으면 요일/시각만, holiday 는 그날의 공휴일 종류)"""
+
+    weekday: int
+    minute: int
+    day: date | None = None
+    holiday: str | None = None
+
+    @property
+    def slot(self) -> int:
+        """주간 비트맵의 칸 번호"""
+        return self.weekday * DAY_SLOTS + self.minute // SLOT_MINUTES
+
+    @property
+    def holidays(self) -> list[int]:
+        """그날 해당하는 휴무 플래그 열 번호 (공휴일이 아니면 빈 목록)"""
+        if self.holiday is None:
+            return []
+        return [_HOLIDAY_INDEX[k] for k in (self.holiday, *_IMPLIES[self.holiday])]
+
+    def label(self) -> str:
+        hhmm = f"{self.minute // 60:02d}:{self.minute % 60:02d}"
+        if self.day is None:
+            return f"{DAYS[self.weekday]}요일 {hhmm}"
+        return f"{self.day.isoformat()} ({DAYS[self.weekday]}) {hhmm}"
+
+
+def load_holidays(data: Mapping[str, Any], today: date | None = None) -> Mapping[date, str]:
+    """holidays.json → {날짜: 공휴일 종류}
+
+    종류를 알 수 없는 항목은 건너뛰고, 오늘이 표의 연도 범위 밖이면 경고한다
+    (표를 갱신하기 전까지 공휴일 휴무가 적용되지 않음).
+    """
+    holidays: dict[date, str] = {}
+    for entry in data.get("holidays", []):
+        kind = entry.get("kind", "public")
+        if kind not in _IMPLIES:
+            logger.warning("알 수 없는 공휴일 종류를 건너뜁니다: %s %s", entry.get("date"), kind)
+            continue
+        holidays[date.fromisoformat(entry["date"])] = kind
+    year = (today or datetime.now(KST).date()).year
+    if year not in {day.year for day in holidays}:
+        logger.warning(
+            "공휴일 표(holidays.json)에 %d년이 없어 공휴일 휴무를 적용하지 않습니다", year
+        )
+    return MappingProxyType(holidays)
+
+
+def parse_open_at(
+    text: str,
+    now: datetime | None = None,
+    holidays: Mapping[date, str] = NO_HOLIDAYS,
+) -> OpenAt:
+    """"now" / "지금", ISO 날짜시각, "HH:MM" (오늘), "토 12:30" (요일) → OpenAt
+
+    날짜/시각은 한국 시간 기준이다. holidays 는 공휴일 표 (load_holidays).
+    해석하지 못하면 ValueError.
+    """
+    text = text.strip()
+    now = now or datetime.now(KST)
+    if text.lower() in ("now", "지금"):
+        moment = now
+    elif m := re.fullmatch(rf"([{DAYS}])(?:요일)?\s+{_TIME}", text):
+        return OpenAt(DAYS.index(m[1]), _minutes(m[2], m[3], upper=DAY_MINUTES - 1))
+    elif m := re.fullmatch(_TIME, text):
+        minute = _minutes(m[1], m[2], upper=DAY_MINUTES - 1)
+        moment = now.replace(hour=minute // 60, minute=minute % 60)
+    else:
+        moment = datetime.fromisoformat(text)
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(KST)
+    day = moment.date()
+    return OpenAt(moment.weekday(), moment.hour * 60 + moment.minute, day, holidays.get(day))
+
+
+def pin_clock(text: str, now: datetime | None = None) -> str:
+    """상대 시각 ("now" / "지금" / "HH:MM") → 분 단위 ISO 날짜시각 (그 밖의 입력은 그대로)
+
+    응답 캐시 키용: 같은 "now" 라도 시각이 바뀌면 다른 키가 된다.
+    """
+    stripped = text.strip()
+    if stripped.lower() not in ("now", "지금") and not re.fullmatch(_TIME, stripped):
+        return text
+    try:
+        when = parse_open_at(stripped, now)
+    except ValueError:
+        return text
+    assert when.day is not None
+    return f"{when.day.isoformat()}T{when.minute // 60:02d}:{when.minute % 60:02d}"
+
+
+def _minutes(hour: str, minute: str, upper: int = DAY_MINUTES) -> int:
+    value = int(hour) * 60 + int(minute)
+    if int(minute) >= 60 or value > upper:
+        raise ValueError(f"잘못된 시각: {hour}:{minute}")
+    return value
+
+
+def _mark(week: np.ndarray, day: int, start: int, end: int, value: bool) -> None:
+    """day 의 start ~ end 분 칸을 value 로 (end <= start 면 다음 날로 넘어감)"""
+    if end <= start:
+        end += DAY_MINUTES
+    first = day * DAY_SLOTS + start // SLOT_MINUTES
+    last = day * DAY_SLOTS + end // SLOT_MINUTES
+    week[first:min(last, WEEK_SLOTS)] = value
+    if last > WEEK_SLOTS:
+        # 일요일 밤 → 월요일 새벽
+        week[:last - WEEK_SLOTS] = value
+
+
+def _parse_hours(text: str, default_days: Sequence[int], week: np.ndarray) -> bool:
+    """영업시간 문자열 하나를 week 에 표시 (해석하지 못하면 False, week 는 그대로)"""
+    main, _, note = text.partition("(")
+    days = default_days
+    if spec := _DAY_SPEC.match(main):
+        main = main[spec.end():]
+        if not spec[1]:
+            first = DAYS.index(spec[2])
+            span = (DAYS.index(spec[3]) - first) % 7 if spec[3] else 0
+            days = [(first + i) % 7 for i in range(span + 1)]
+        else:
+            days = EVERY_DAY
+    found = _RANGE.search(main)
+    if found is None:
+        return False
+    try:
+        start, end = _minutes(found[1], found[2]), _minutes(found[3], found[4])
+        breaks = [(_minutes(m[1], m[2]), _minutes(m[3], m[4])) for m in _BREAK.finditer(note)]
+        early = [(DAYS.index(m[1]), _minutes(m[2], m[3])) for m in _EARLY_CLOSE.finditer(note)]
+    except ValueError:
+        return False
+
+    for day in days:
+        _mark(week, day, start, end, True)
+        for b0, b1 in breaks:
+            _mark(week, day, b0, b1, False)
+    for day, close in early:
+        if day in days and close != end:
+            _mark(week, day, close, end, False)
+    return True
+
+
+def _holiday_kinds(token: str) -> tuple[str, ...] | None:
+    if "공휴일" in token:
+        return ("public",)
+    if "명절" in token:
+        return ("seollal", "chuseok")
+    if token.startswith("설"):
+        return ("seollal_day",) if "당일" in token else ("seollal",)
+    if token.startswith("추석"):
+        return ("chuseok_day",) if "당일" in token else ("chuseok",)
+    return None
+
+
+class Schedule(NamedTuple):
+    """맛집 하나의 해석 결과"""
+
+    week: np.ndarray  # (WEEK_SLOTS,) 불리언
+    closed_on: np.ndarray  # (len(HOLIDAY_KINDS),) 불리언
+    problems: list[str]
+
+
+def compile_schedule(r: Restaurant) -> Schedule:
+    """영업시간/휴무일 문자열 → 주간 영업 칸 + 휴무 플래그"""
+    week = np.zeros(WEEK_SLOTS, dtype=bool)
+    closed_on = np.zeros(len(HOLIDAY_KINDS), dtype=bool)
+    problems: list[str] = []
+
+    parsed = False
+    if r.hours is not None:
+        for field, text, days in (
+            ("hours.weekday", r.hours.weekday, WEEKDAYS),
+            ("hours.weekend", r.hours.weekend, WEEKEND),
+        ):
+            if not text:
+                continue
+            if _parse_hours(text, days, week):
+                parsed = True
+            else:
+                problems.append(f"{field}: {text}")
+    if not parsed and r.hours_string:
+        if _parse_hours(r.hours_string, EVERY_DAY, week):
+            parsed = True
+        else:
+            problems.append(f"hours_string: {r.hours_string}")
+    if not parsed and not problems:
+        problems.append("영업시간 정보 없음")
+
+    entries = r.closed_days or ([r.closed_days_string] if r.closed_days_string else [])
+    for entry in entries:
+        for token in re.split(r"[,·/]", _PAREN.sub("", entry)):
+            token = token.strip()
+            if not token or any(word in token for word in _IRREGULAR):
+                continue
+            if m := _CLOSED_DAY.fullmatch(token):
+                day = DAYS.index(m[1])
+                week[day * DAY_SLOTS:(day + 1) * DAY_SLOTS] = False
+            elif (kinds := _holiday_kinds(token)) is not None:
+                closed_on[[_HOLIDAY_INDEX[k] for k in kinds]] = True
+            else:
+                problems.append(f"closed_days: {token}")
+    return Schedule(week, closed_on, problems)
+
+
+# (weekday/weekend 영업시간, hours_string, closed_days, closed_days_string)
+_ScheduleKey = tuple[
+    tuple[str | None, str | None] | None, str | None, tuple[str, ...], str | None
+]
+
+
+def _schedule_key(r: Restaurant) -> _ScheduleKey:
+    hours = (r.hours.weekday, r.hours.weekend) if r.hours is not None else None
+    return hours, r.hours_string, tuple(r.closed_days), r.closed_days_string
+
+
+def compile_hours(restaurants: Sequence[Restaurant]) -> tuple[np.ndarray, np.ndarray]:
+    """(행 × WEEK_BYTES) 영업 비트맵, (행 × 휴무 종류) 휴무 플래그
+
+    같은 영업시간/휴무일 문자열은 한 번만 해석한다 (체인점, 공통 표기).
+    해석하지 못한 항목은 맛집별로 경고를 남긴다.
+    """
+    n = len(restaurants)
+    hours = np.empty((n, WEEK_BYTES), dtype=np.uint8, order="F")
+    closed = np.empty((n, len(HOLIDAY_KINDS)), dtype=np.bool_, order="F")
+    compiled: dict[_ScheduleKey, tuple[np.ndarray, np.ndarray, list[str]]] = {}
+    unparsed = 0
+    for i, r in enumerate(restaurants):
+        key = _schedule_key(r)
+        entry = compiled.get(key)
+        if entry is None:
+            schedule = compile_schedule(r)
+            entry = compiled[key] = (
+                np.packbits(schedule.week), schedule.closed_on, schedule.problems
+            )
+        hours[i], closed[i], problems = entry
+        if problems:
+            unparsed += 1
+            logger.warning("영업시간 해석 실패 [%s %s] %s", r.id, r.name, "; ".join(problems))
+    if unparsed:
+        logger.warning("영업시간/휴무일을 일부 해석하지 못한 맛집 %d곳", unparsed)
+    return hours, closed
@@ -0,0 +1,187 @@
+"""레스토랑 필터/정렬 인덱스
+
+스냅샷 로드 시 한 번 구축하며, search_restaurants / recommend 필터를
+행 단위 속성 접근 대신 열(RestaurantColumns) 위의 벡터 연산으로 처리한다.
+
+- 필터: 열 비교로 만든 불리언 마스크 (여러 조건은 논리곱)
+- 다중 값 열거형(recommended_for): 행 × 값 불리언 행렬의 열 하나가 마스크
+- 영업 중: 주간 영업 비트맵에서 시각에 해당하는 비트 하나 (공휴일이면 휴무 플래그 제외)
+- 정렬 순서: rating_score / (tier, rating_score) 순서와 순위를 미리 계산
+- 페이지: 전체를 정렬하지 않고 순위 기준 argpartition 으로 상위 offset + limit 건만 정렬
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from ..models import Restaurant
+from .columns import TASTE_INDEX, CodeColumn, MultiCodeColumn, RestaurantColumns
+from .hours import OpenAt
+
+Mask = np.ndarray
+
+
+def _rank_of(order: np.ndarray) -> np.ndarray:
+    """위치 → 정렬 순위"""
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    return rank
+
+
+def _membership(column: MultiCodeColumn) -> np.ndarray:
+    """다중 값 열 → (행 × 값) 불리언 행렬"""
+    matrix = np.zeros((len(column.offsets) - 1, len(column.vocab)), dtype=bool)
+    matrix[column.rows(), column.codes] = True
+    return matrix
+
+
+class RestaurantIndex:
+    """레스토랑 필터/정렬 인덱스 (불변)
+
+    columns 를 주면 레코드를 읽지 않고 열만으로 구축한다.
+    """
+
+    def __init__(
+        self,
+        restaurants: Sequence[Restaurant],
+        columns: RestaurantColumns | None = None,
+    ):
+        self.restaurants = restaurants
+        if columns is None:
+            columns = RestaurantColumns.from_restaurants(restaurants)
+        self.columns = columns
+        self.size = len(columns)
+        self._membership = {"recommended_for": _membership(columns.recommended_for)}
+
+        # 미리 계산한 정렬 순서 (sorted()와 같은 안정 정렬)
+        self.rating_order = np.argsort(-columns.rating, kind="stable")
+        self.rating_rank = _rank_of(self.rating_order)
+        self.tier_rating_order = np.lexsort((-columns.rating, columns.tier))
+        self.tier_rating_rank = _rank_of(self.tier_rating_order)
+
+    # ------------------------------------------------------------
+    # 마스크
+    # ------------------------------------------------------------
+
+    def _values(self, field: str) -> np.ndarray:
+        column: np.ndarray | None = getattr(self.columns, field, None)
+        if column is None:
+            return self.columns.taste_column(field)
+        return column
+
+    def eq(self, field: str, value: Any) -> Mask:
+        """field == value (열거형 열은 vocab 값으로 비교)"""
+        column = getattr(self.columns, field)
+        if isinstance(column, CodeColumn):
+            try:
+                code = column.vocab.index(value)
+            except ValueError:
+                return np.zeros(self.size, dtype=bool)
+            return np.asarray(column.codes == code, dtype=bool)
+        return np.asarray(column == value, dtype=bool)
+
+    def has(self, field: str, value: Any) -> Mask:
+        """다중 값 field 에 value 포함"""
+        column: MultiCodeColumn = getattr(self.columns, field)
+        try:
+            code = column.vocab.index(value)
+        except ValueError:
+            return np.zeros(self.size, dtype=bool)
+        return np.asarray(self._membership[field][:, code], dtype=bool)
+
+    def at_most(self, field: str, value: float) -> Mask:
+        """field <= value (수치 열 또는 맛 프로필 열)"""
+        return np.asarray(self._values(field) <= value, dtype=bool)
+
+    def at_least(self, field: str, value: float) -> Mask:
+        """field >= value"""
+        return np.asarray(self._values(field) >= value, dtype=bool)
+
+    def flag(self, field: str) -> Mask:
+        """불리언 열"""
+        return np.asarray(getattr(self.columns, field), dtype=bool)
+
+    def open_at(self, when: OpenAt) -> Mask:
+        """when 에 영업 중 (영업시간을 해석하지 못한 맛집은 제외)"""
+        byte, bit = divmod(when.slot, 8)
+        mask: Mask = (self.columns.hours[:, byte] & (0x80 >> bit)) != 0
+        holidays = when.holidays
+        if holidays:
+            mask &= ~self.columns.holiday_closed[:, holidays].any(axis=1)
+        return mask
+
+    def combine(self, masks: Sequence[Mask]) -> Mask | None:
+        """마스크 논리곱 (조건이 없으면 None)"""
+        if not masks:
+            return None
+        if len(masks) == 1:
+            return masks[0]
+        return np.asarray(np.logical_and.reduce(masks), dtype=bool)
+
+    # ------------------------------------------------------------
+    # 선택 / 페이지
+    # ------------------------------------------------------------
+
+    def select(
+        self,
+        masks: Sequence[Mask],
+        order: np.ndarray,
+        rank: np.ndarray,
+    ) -> list[Restaurant]:
+        """조건을 모두 만족하는 레코드를 order 순서로 반환"""
+        return self.page(masks, order, rank, 0, self.size)[1]
+
+    def page(
+        self,
+        masks: Sequence[Mask],
+        order: np.ndarray,
+        rank: np.ndarray,
+        offset: int,
+        limit: int,
+    ) -> tuple[int, list[Restaurant]]:
+        """(전체 건수, order 순서의 offset 부터 limit 건)
+
+        전체를 정렬하지 않고 offset + limit 건까지만 부분 정렬한다.
+        """
+        mask = self.combine(masks)
+        if mask is None:
+            page = order[offset:offset + limit]
+            return self.size, [self.restaurants[pos] for pos in page.tolist()]
+
+        hits = np.flatnonzero(mask)
+        k = offset + limit
+        if k < len(hits):
+            hits_top = hits[np.argpartition(rank[hits], k - 1)[:k]]
+        else:
+            hits_top = hits
+        top = hits_top[np.argsort(rank[hits_top])]
+        return len(hits), [self.restaurants[pos] for pos in top[offset:].tolist()]
+
+    # ------------------------------------------------------------
+    # 비교
+    # ------------------------------------------------------------
+
+    def situation_picks(self, positions: Sequence[int]) -> dict[str, int]:
+        """상황별 추천 (입문자/매니아/가성비) 위치
+
+        후보 전체를 열 단위로 한 번에 점수화한다. 동점이면 앞선 후보.
+        - 입문자: 육향 + (5 - 간)
+        - 매니아: 정통성 점수
+        - 가성비: 전체 밸런스 × 10000 / 가격
+        """
+        rows = np.asarray(positions)
+        taste = self.columns.taste[rows]
+        beginner = taste[:, TASTE_INDEX["beef_aroma"]] + (5 - taste[:, TASTE_INDEX["saltiness"]])
+        mania = taste[:, TASTE_INDEX["authenticity"]]
+        price = self.columns.price[rows].astype(np.float64)
+        value = np.divide(
+            taste[:, TASTE_INDEX["overall_balance"]] * 10000.0,
+            price,
+            out=np.zeros(len(rows)),
+            where=price != 0,
+        )
+        return {
+            name: positions[int(np.argmax(scores))]
+            for name, scores in (("beginner", beginner), ("mania", mania), ("value", value))
+        }
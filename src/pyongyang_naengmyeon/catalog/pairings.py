@@ -0,0 +1,117 @@
+"""예산 맞춤 사이드 메뉴 구성 (get_side_pairings)
+
+맛집별 사이드 메뉴 가격/시그니처/페어링 여부는 로드 시 정수 열(SideMenuColumn)로,
+side_menus.json 의 코스 예산 문자열은 정수 범위(Course)로 미리 바꿔 둔다.
+
+구성은 인원수만큼 냉면을 먼저 담고 남은 예산으로 사이드 가치 합을 최대화하는
+0/1 배낭 문제다. 한 메뉴는 SHARE 명당 한 접시까지, 같은 메뉴의 c번째 접시 가치는
+1/c 로 줄어든다 (가치가 줄어드므로 최적해는 항상 앞 접시부터 고른다).
+가격은 PRICE_UNIT 원 단위로 세며, DP 는 예산 칸 배열 위의 벡터 연산이다.
+"""
+
+import math
+import re
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from .columns import SideMenuColumn
+
+PRICE_UNIT = 500
+# 사이드 한 접시를 나눠 먹는 인원
+SHARE = 3
+BASE_VALUE = 1.0
+SIGNATURE_VALUE = 2.0
+PAIRING_VALUE = 1.0
+# 예산을 읽을 수 없는 코스의 상한 (이전 동작과 같음)
+UNKNOWN_BUDGET = 100_000
+
+
+class Course(NamedTuple):
+    """코스 예시 (예산은 전체 인원 기준 원)"""
+
+    min_budget: int
+    max_budget: int
+    party_size: int
+    data: Mapping[str, Any]
+
+    @property
+    def per_person(self) -> int:
+        """1인당 최대 예산"""
+        return self.max_budget // self.party_size
+
+
+def load_courses(data: Mapping[str, Any]) -> tuple[Course, ...]:
+    """side_menus.json course_examples → Course ("₩50,000 ~ ₩60,000", "₩150,000 내외")"""
+    courses = []
+    for course in data.get("course_examples", []):
+        budget = course.get("budget", "")
+        amounts = [int(a.replace(",", "")) for a in re.findall(r"\d[\d,]*", budget)]
+        party = re.search(r"(\d+)\s*인", course.get("name", ""))
+        courses.append(Course(
+            min(amounts, default=UNKNOWN_BUDGET),
+            max(amounts, default=UNKNOWN_BUDGET),
+            int(party[1]) if party else 1,
+            course,
+        ))
+    return tuple(courses)
+
+
+class SideCourse(NamedTuple):
+    """예산 맞춤 구성"""
+
+    sides: list[tuple[int, int]]  # (맛집 사이드 메뉴 번호, 접시 수)
+    naengmyeon: int  # 냉면 값 합계
+    total: int
+    value: float
+
+
+def optimize_sides(
+    column: SideMenuColumn,
+    pos: int,
+    naengmyeon_price: int,
+    party_size: int,
+    budget: int,
+) -> SideCourse | None:
+    """맛집 pos 에서 전체 예산 budget 안의 최고 가치 구성 (냉면 값도 안 되면 None)"""
+    bowls = naengmyeon_price * party_size
+    if budget < bowls:
+        return None
+    start, stop = int(column.offsets[pos]), int(column.offsets[pos + 1])
+    prices = column.price[start:stop].astype(np.int64)
+    values = (
+        BASE_VALUE
+        + SIGNATURE_VALUE * column.signature[start:stop]
+        + PAIRING_VALUE * column.pairing[start:stop]
+    )
+
+    # 0/1 항목으로 펼침: 메뉴 i 의 c번째 접시
+    copies = max(1, math.ceil(party_size / SHARE))
+    menu = np.repeat(np.arange(stop - start), copies)
+    nth = np.tile(np.arange(1, copies + 1), stop - start)
+    weights = -(-prices[menu] // PRICE_UNIT)
+    gains = values[menu] / nth
+    # 모든 접시를 사도 남는 예산은 볼 필요 없음
+    capacity = int(min((budget - bowls) // PRICE_UNIT, weights.sum()))
+
+    best = np.zeros(capacity + 1)
+    taken = np.zeros((len(menu), capacity + 1), dtype=bool)
+    for k, (w, v) in enumerate(zip(weights.tolist(), gains.tolist())):
+        if w > capacity:
+            continue
+        candidate = best[:capacity + 1 - w] + v
+        better = candidate > best[w:] + 1e-9
+        taken[k, w:] = better
+        best[w:] = np.where(better, candidate, best[w:])
+
+    # 가치가 같으면 가장 싼 구성
+    c = int(np.argmax(best >= best[-1] - 1e-9))
+    counts: dict[int, int] = {}
+    for k in range(len(menu) - 1, -1, -1):
+        if taken[k, c]:
+            counts[int(menu[k])] = counts.get(int(menu[k]), 0) + 1
+            c -= int(weights[k])
+    sides = sorted(counts.items())
+    total = bowls + sum(int(prices[i]) * n for i, n in sides)
+    return SideCourse(sides, bowls, total, float(best[-1]))
@@ -0,0 +1,60 @@
+"""렌더 캐시
+
+스냅샷에 속한 렌더 결과 캐시. 레코드는 스냅샷 안에서 바뀌지 않으므로
+무효화는 스냅샷 교체로만 일어난다 (새 스냅샷은 빈 캐시로 시작).
+
+- maxsize=None: 무제한 (최초 접근 시 렌더, prerender 로 로드 시 일괄 렌더)
+- maxsize=N: LRU 로 최대 N건 유지 (대규모 카탈로그용)
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class RenderCache(Generic[T]):
+    """키별 렌더 결과 캐시 (선택적 LRU)"""
+
+    def __init__(
+        self,
+        render: Callable[[T], str],
+        key: Callable[[T], Hashable],
+        maxsize: int | None = None,
+    ):
+        self._render = render
+        self._key = key
+        self.maxsize = maxsize
+        self._pages: OrderedDict[Hashable, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def get(self, item: T) -> str:
+        """캐시된 렌더 결과 (없으면 렌더 후 저장)"""
+        key = self._key(item)
+        page = self._pages.get(key)
+        if page is not None:
+            self.hits += 1
+            if self.maxsize is not None:
+                self._pages.move_to_end(key)
+            return page
+
+        self.misses += 1
+        page = self._render(item)
+        self._pages[key] = page
+        if self.maxsize is not None and len(self._pages) > self.maxsize:
+            self._pages.popitem(last=False)
+            self.evictions += 1
+        return page
+
+    def prerender(self, items: Iterable[T]) -> None:
+        """일괄 렌더 (무제한 모드에서 로드 시 사용)"""
+        for item in items:
+            key = self._key(item)
+            if key not in self._pages:
+                self._pages[key] = self._render(item)
@@ -0,0 +1,194 @@
+"""맛집 식별자/이름 해석기
+
+get_restaurant, compare, get_eating_guide, get_side_pairings 가 공유한다.
+
+- id / slug: 해시 맵 (O(1))
+- 이름(name, name_english, name_hanja): 문자 n-gram 포스팅으로 부분 문자열 후보를
+  좁힌 뒤 검증한다. 후보가 여럿이면 목록 순서가 아니라 일치 품질로 결정한다.
+- 그래도 없으면 오타/초성 색인(fuzzy.py)으로 찾는다. 가장 가까운 후보가 하나뿐이면
+  그 맛집으로 해석하고, 아니면 suggest() 로 "혹시 이 맛집?" 후보만 돌려준다.
+"""
+
+import heapq
+from collections import defaultdict
+from collections.abc import Sequence
+
+from ..models import Restaurant
+from .columns import RestaurantColumns
+from .fuzzy import FuzzyNameIndex
+
+EMPTY: frozenset[int] = frozenset()
+# 일치 품질 (작을수록 우선)
+EXACT, PREFIX, SUBSTRING = 0, 1, 2
+# suggest() 기본 후보 수
+SUGGESTIONS = 5
+
+# 이름 일치 정렬 키 (일치 품질, 이름 길이, tier, -평점, id)
+_RankKey = tuple[int, int, int, float, int]
+
+
+def normalize(text: str) -> str:
+    """비교용 정규화 (대소문자/공백 무시)"""
+    return "".join(text.casefold().split())
+
+
+def _grams(text: str) -> set[str]:
+    """부분 문자열 후보 검색용 n-gram (1글자는 unigram, 그 외 bigram)"""
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class RestaurantResolver:
+    """맛집 id/slug/이름 해석기 (불변)"""
+
+    def __init__(
+        self,
+        restaurants: Sequence[Restaurant],
+        columns: RestaurantColumns | None = None,
+    ):
+        self.restaurants = restaurants
+        if columns is None:
+            columns = RestaurantColumns.from_restaurants(restaurants)
+        self._tier: list[int] = columns.tier.tolist()
+        self._rating: list[float] = columns.rating.tolist()
+        self._id: list[int] = columns.id.tolist()
+        self.by_id: dict[int, int] = {}
+        self.by_slug: dict[str, int] = {}
+        for pos, (id_, slug) in enumerate(zip(self._id, columns.slug)):
+            self.by_id.setdefault(id_, pos)
+            if slug:
+                self.by_slug.setdefault(normalize(slug), pos)
+
+        # 이름 포스팅은 첫 이름 검색 때 구축 (콜드 스타트 단축)
+        self._name_columns = (columns.name, columns.name_english, columns.name_hanja)
+        self._name_index: tuple[list[tuple[str, ...]], dict[str, frozenset[int]]] | None = None
+        self._slugs = columns.slug
+        self._fuzzy: FuzzyNameIndex | None = None
+
+    def _build_name_index(self) -> tuple[list[tuple[str, ...]], dict[str, frozenset[int]]]:
+        names: list[tuple[str, ...]] = []
+        postings: dict[str, set[int]] = defaultdict(set)
+        for pos, row in enumerate(zip(*self._name_columns)):
+            normalized = tuple(normalize(n) for n in row if n)
+            names.append(normalized)
+            for name in normalized:
+                for gram in set(name) | _grams(name):
+                    postings[gram].add(pos)
+        return names, {gram: frozenset(p) for gram, p in postings.items()}
+
+    def _build_fuzzy(self) -> FuzzyNameIndex:
+        names = [
+            {*row, normalize(slug)} if slug else set(row)
+            for row, slug in zip(self._names, self._slugs)
+        ]
+        return FuzzyNameIndex(names, [normalize(n) for n in self._name_columns[0]])
+
+    def warm(self) -> None:
+        """이름 포스팅/오타 색인 미리 구축 (pre-fork 전 등)"""
+        self._ensure_name_index()
+        self._ensure_fuzzy()
+
+    def _ensure_name_index(self) -> tuple[list[tuple[str, ...]], dict[str, frozenset[int]]]:
+        if self._name_index is None:
+            self._name_index = self._build_name_index()
+        return self._name_index
+
+    def _ensure_fuzzy(self) -> FuzzyNameIndex:
+        # 오타 색인은 이름 검색도 실패했을 때만 필요하므로 따로 지연 구축
+        if self._fuzzy is None:
+            self._fuzzy = self._build_fuzzy()
+        return self._fuzzy
+
+    @property
+    def _names(self) -> list[tuple[str, ...]]:
+        return self._ensure_name_index()[0]
+
+    @property
+    def _postings(self) -> dict[str, frozenset[int]]:
+        return self._ensure_name_index()[1]
+
+    def _lookup(self, key: str | int) -> int | None:
+        if isinstance(key, int) or key.strip().isdecimal():
+            return self.by_id.get(int(key))
+        return self.by_slug.get(normalize(key))
+
+    def get(self, key: str | int) -> Restaurant | None:
+        """id 또는 slug 정확 조회"""
+        pos = self._lookup(key)
+        return self.restaurants[pos] if pos is not None else None
+
+    def _rank_key(self, pos: int, query: str) -> _RankKey | None:
+        """이름 일치 정렬 키 (일치 품질, 이름 길이, tier, -평점, id)"""
+        best: tuple[int, int] | None = None
+        for name in self._names[pos]:
+            if name == query:
+                kind = EXACT
+            elif name.startswith(query):
+                kind = PREFIX
+            elif query in name:
+                kind = SUBSTRING
+            else:
+                continue
+            if best is None or (kind, len(name)) < best:
+                best = (kind, len(name))
+        if best is None:
+            return None
+        return (*best, self._tier[pos], -self._rating[pos], self._id[pos])
+
+    def _search_positions(self, query: str, limit: int | None = None) -> list[int]:
+        query = normalize(query)
+        if not query:
+            return []
+        postings = [self._postings.get(g, EMPTY) for g in _grams(query)]
+        smallest, *rest = sorted(postings, key=len)
+        ranked: list[tuple[_RankKey, int]] = []
+        for pos in smallest:
+            if all(pos in p for p in rest):
+                key = self._rank_key(pos, query)
+                if key is not None:
+                    ranked.append((key, pos))
+        ranked = heapq.nsmallest(limit, ranked) if limit is not None else sorted(ranked)
+        return [pos for _, pos in ranked]
+
+    def search_names(self, query: str, limit: int | None = None) -> list[Restaurant]:
+        """이름 부분 일치 후보 (일치 품질 순)"""
+        return [self.restaurants[pos] for pos in self._search_positions(query, limit)]
+
+    def _fuzzy_positions(self, query: str) -> list[tuple[int, int]]:
+        """오타/초성 후보 (거리, 위치) — 거리, tier, 평점, id 순"""
+        query = normalize(query)
+        if not query:
+            return []
+        found = self._ensure_fuzzy().matches(query)
+        ranked = sorted(
+            (distance, self._tier[pos], -self._rating[pos], self._id[pos], pos)
+            for pos, distance in found.items()
+        )
+        return [(distance, pos) for distance, *_, pos in ranked]
+
+    def suggest(self, query: str | int | None, limit: int = SUGGESTIONS) -> list[Restaurant]:
+        """찾지 못한 질의에 대한 "혹시 이 맛집?" 후보"""
+        if not isinstance(query, str):
+            return []
+        return [self.restaurants[pos] for _, pos in self._fuzzy_positions(query)[:limit]]
+
+    def locate(self, query: str | int | None) -> int | None:
+        """resolve 와 같은 순서로 해석한 스냅샷 내 위치"""
+        if query is None or query == "":
+            return None
+        pos = self._lookup(query)
+        if pos is None and isinstance(query, str):
+            matches = self._search_positions(query, limit=1)
+            pos = matches[0] if matches else None
+        if pos is None and isinstance(query, str):
+            # 가장 가까운 후보가 하나뿐일 때만 해석 (동률이면 suggest 로 안내)
+            fuzzy = self._fuzzy_positions(query)
+            if fuzzy and (len(fuzzy) == 1 or fuzzy[0][0] < fuzzy[1][0]):
+                pos = fuzzy[0][1]
+        return pos
+
+    def resolve(self, query: str | int | None) -> Restaurant | None:
+        """id → slug → 이름 → 오타/초성 순으로 해석"""
+        pos = self.locate(query)
+        return self.restaurants[pos] if pos is not None else None
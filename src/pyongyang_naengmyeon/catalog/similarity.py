@@ -0,0 +1,139 @@
+"""맛 유사도 최근접 이웃 인덱스
+
+find_similar 가 사용한다. 스냅샷 로드 시 열(RestaurantColumns)만으로 맛집마다
+특징 벡터를 한 번 만들고, 질의는 기준 맛집과 나머지 전체의 거리를 한 번의
+행렬-벡터 곱으로 계산한 뒤 argpartition 으로 상위 k 건만 정렬한다.
+
+벡터 구성 (그룹별로 최대 거리가 비슷해지도록 정규화):
+- 육수: 맑기/깊이/간/육향, 살얼음/동치미/간장, 베이스 원-핫
+- 면: 메밀 함량, 자가제면, 스타일/굵기 원-핫
+- 고명: 편육/달걀/오이/배/동치미 무/고춧가루
+- 매니아 평가: 6개 항목 + 정통성 점수
+- 계보 원-핫
+
+특징이 40차원 안팎이라 KD-tree 같은 공간 분할 트리는 대부분의 리프를 방문하게
+되어 이득이 없다. 전수 비교를 BLAS 한 번으로 처리하는 편이 수만 건에서도 빠르다.
+"""
+
+import numpy as np
+
+from .columns import FLAG_FIELDS, CodeColumn, RestaurantColumns
+
+# 그룹 가중치 (그룹 안의 특징 수와 무관하게 그룹끼리의 영향력을 맞춤)
+GROUP_WEIGHTS = {
+    "broth": 1.0,
+    "noodle": 1.0,
+    "toppings": 0.5,
+    "expert": 1.0,
+    "lineage": 1.0,
+}
+
+# 후보 비율이 1/_SPARSE 미만이면 후보 행만 골라 곱함
+_SPARSE = 4
+
+_FLAG = {name: i for i, name in enumerate(FLAG_FIELDS)}
+_TOPPINGS = ("pyeonyuk", "egg", "cucumber", "pear", "dongchimi_mu", "red_pepper_powder")
+_EXPERT = (
+    "broth_clarity",
+    "broth_depth",
+    "noodle_aroma",
+    "noodle_texture",
+    "temperature",
+    "overall_balance",
+)
+
+
+def _one_hot(column: CodeColumn) -> np.ndarray:
+    """코드 열 → 원-핫 (서로 다른 값의 거리가 1이 되도록 1/√2 배)"""
+    matrix = np.zeros((len(column.codes), len(column.vocab)), dtype=np.float32)
+    matrix[np.arange(len(column.codes)), column.codes] = np.sqrt(0.5)
+    return matrix
+
+
+def embed(columns: RestaurantColumns) -> np.ndarray:
+    """열 → (행 × 특징) float32 행렬 (각 특징은 0~1 범위)"""
+
+    def level(field: str) -> np.ndarray:
+        return (columns.taste_column(field).astype(np.float32) - 1) / 4
+
+    def flag(name: str) -> np.ndarray:
+        return columns.flags[:, _FLAG[name]].astype(np.float32)
+
+    groups = {
+        "broth": [
+            *(level(f)[:, None] for f in ("clarity", "depth", "saltiness", "beef_aroma")),
+            columns.has_slush_ice.astype(np.float32)[:, None],
+            columns.dongchimi.astype(np.float32)[:, None],
+            flag("uses_soy_sauce")[:, None],
+            _one_hot(columns.broth_base),
+        ],
+        "noodle": [
+            (columns.taste_column("buckwheat_ratio").astype(np.float32) / 100)[:, None],
+            flag("homemade")[:, None],
+            _one_hot(columns.noodle_style),
+            _one_hot(columns.noodle_thickness),
+        ],
+        "toppings": [flag(name)[:, None] for name in _TOPPINGS],
+        "expert": [
+            *(level(f)[:, None] for f in _EXPERT),
+            (columns.taste_column("authenticity").astype(np.float32) / 100)[:, None],
+        ],
+        "lineage": [_one_hot(columns.lineage)],
+    }
+
+    blocks = []
+    for name, parts in groups.items():
+        block = np.hstack(parts)
+        # 특징(원-핫은 한 묶음) 수로 나눠 그룹의 최대 거리를 가중치와 같게 맞춤
+        blocks.append(block * (GROUP_WEIGHTS[name] / np.sqrt(len(parts))))
+    return np.ascontiguousarray(np.hstack(blocks), dtype=np.float32)
+
+
+class SimilarityIndex:
+    """맛 특징 벡터 최근접 이웃 인덱스 (불변)"""
+
+    def __init__(self, columns: RestaurantColumns):
+        self.vectors = embed(columns)
+        self.size = len(self.vectors)
+        self._norms = np.einsum("ij,ij->i", self.vectors, self.vectors)
+        # 이론상 최대 거리 (유사도 % 환산용)
+        self.max_distance = float(np.sqrt(sum(w * w for w in GROUP_WEIGHTS.values())))
+
+    def nearest(
+        self,
+        pos: int,
+        k: int,
+        mask: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """pos 와 가까운 순으로 (위치, 거리) 상위 k 건 (자기 자신 제외)
+
+        mask 를 주면 조건을 만족하는 행 중에서만 찾는다. 거리가 같으면 위치 순.
+        """
+        query = self.vectors[pos]
+        # |a-q|² = |a|² - 2a·q + |q|² 에서 |q|² 는 순서에 영향이 없으므로 마지막에 더함
+        if mask is not None and np.count_nonzero(mask) * _SPARSE < self.size:
+            # 후보가 적으면 해당 행만 곱함
+            candidates = np.flatnonzero(mask)
+            scores = self.vectors[candidates] @ query
+            scores *= -2
+            scores += self._norms[candidates]
+            scores[candidates == pos] = np.inf
+        else:
+            candidates = None
+            scores = self.vectors @ query
+            scores *= -2
+            scores += self._norms
+            if mask is not None:
+                scores = np.where(mask, scores, np.inf)
+            scores[pos] = np.inf
+
+        top = np.argpartition(scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+        top = top[np.isfinite(scores[top])]
+        rows = candidates[top] if candidates is not None else top
+        order = np.lexsort((rows, scores[top]))
+        distances = np.sqrt(np.maximum(scores[top][order] + self._norms[pos], 0))
+        return rows[order], distances
+
+    def similarity(self, distance: float) -> float:
+        """거리 → 유사도 (0~100)"""
+        return max(0.0, 1 - distance / self.max_distance) * 100
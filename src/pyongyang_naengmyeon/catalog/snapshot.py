@@ -0,0 +1,337 @@
+"""카탈로그 스냅샷
+
+restaurants.json / lineages.json / eating_guides.json / side_menus.json / places.json /
+holidays.json 을 한 번만 파싱·검증해 불변 스냅샷으로 만들고, 프로세스 전체에서 참조로 공유한다.
+build_catalog() 로 미리 컴파일해 두면 catalog.bin 을 mmap 으로 열어 검증 없이 로드한다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+from ..models import Restaurant
+from ..render import render_compare_section, render_restaurant_detail
+from .binary import (
+    CATALOG_FILE,
+    CompiledCatalog,
+    InvalidCatalogError,
+    schema_fingerprint,
+    write_catalog,
+)
+from .columns import RestaurantColumns
+from .fulltext import FullTextIndex
+from .geo import GeoIndex, Place, load_places
+from .hours import load_holidays
+from .indexes import RestaurantIndex
+from .pairings import Course, load_courses
+from .render_cache import RenderCache
+from .resolver import RestaurantResolver
+from .similarity import SimilarityIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# 상세 페이지 렌더 캐시 설정 (0 = 무제한)
+RENDER_CACHE_SIZE = int(os.environ.get("NAENGMYEON_RENDER_CACHE_SIZE", "0"))
+PRERENDER = os.environ.get("NAENGMYEON_PRERENDER", "") == "1"
+
+# 비교 섹션 캐시 크기 (맛집 조합 × 섹션, LRU, 0 = 무제한)
+COMPARE_CACHE_SIZE = int(os.environ.get("NAENGMYEON_COMPARE_CACHE_SIZE", "4096"))
+
+# 컴파일된 카탈로그(catalog.bin) 사용 여부 (0 = 항상 JSON 에서 로드)
+USE_COMPILED = os.environ.get("NAENGMYEON_COMPILED_CATALOG", "1") != "0"
+
+DATA_FILES = (
+    "restaurants.json",
+    "lineages.json",
+    "eating_guides.json",
+    "side_menus.json",
+    "places.json",
+    "holidays.json",
+)
+
+
+# restaurants.json 에서 파생되는 필드 (파일이 바뀌지 않았으면 이전 스냅샷 것을 재사용)
+RESTAURANT_FIELDS = (
+    "restaurants",
+    "index",
+    "resolver",
+    "fulltext",
+    "similarity",
+    "geo",
+    "detail_pages",
+    "compare_sections",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogSnapshot:
+    """불변 카탈로그 스냅샷
+
+    모든 세션의 DataProvider가 같은 인스턴스를 참조한다.
+    컬렉션은 tuple / MappingProxyType 으로 고정되어 있으므로 수정하지 않는다.
+    """
+
+    restaurants: Sequence[Restaurant]
+    lineages: tuple[dict[str, Any], ...]
+    eating_guides: tuple[dict[str, Any], ...]
+    side_menus: Mapping[str, Any]
+    courses: tuple[Course, ...]
+    places: Mapping[str, Place]
+    holidays: Mapping[date, str]
+    index: RestaurantIndex
+    resolver: RestaurantResolver
+    fulltext: FullTextIndex
+    similarity: SimilarityIndex
+    geo: GeoIndex
+    detail_pages: RenderCache[Restaurant]
+    compare_sections: RenderCache[tuple[tuple[int, ...], str]]
+    data_dir: Path
+    file_hashes: Mapping[str, str]
+    version: str
+    load_seconds: float
+    compiled: bool = False
+
+
+def _read_files(data_dir: Path) -> dict[str, bytes | None]:
+    """데이터 파일 원본 (없으면 None)"""
+    contents = {}
+    for name in DATA_FILES:
+        path = data_dir / name
+        contents[name] = path.read_bytes() if path.exists() else None
+    return contents
+
+
+def _file_stats(data_dir: Path) -> dict[str, list[int] | None]:
+    """데이터 파일 (mtime_ns, 크기) — 컴파일된 카탈로그 신선도 빠른 확인용"""
+    stats: dict[str, list[int] | None] = {}
+    for name in DATA_FILES:
+        try:
+            stat = (data_dir / name).stat()
+        except FileNotFoundError:
+            stats[name] = None
+        else:
+            stats[name] = [stat.st_mtime_ns, stat.st_size]
+    return stats
+
+
+def _hash(content: bytes | None) -> str:
+    return hashlib.sha256(content).hexdigest() if content is not None else ""
+
+
+def _version(file_hashes: Mapping[str, str]) -> str:
+    digest = hashlib.sha256()
+    for name in DATA_FILES:
+        digest.update(name.encode())
+        digest.update(file_hashes[name].encode())
+    return digest.hexdigest()[:16]
+
+
+def _parse(content: bytes | None) -> dict[str, Any]:
+    if content is None:
+        return {}
+    data: dict[str, Any] = json.loads(content)
+    return data
+
+
+def compute_version(data_dir: Path) -> str:
+    """데이터 파일 내용 해시 (스냅샷 버전)"""
+    return _version({name: _hash(c) for name, c in _read_files(data_dir).items()})
+
+
+def _restaurant_fields(
+    restaurants: Sequence[Restaurant],
+    columns: RestaurantColumns,
+    fulltext: FullTextIndex,
+    render_cache_size: int,
+    prerender: bool,
+) -> dict[str, Any]:
+    """레코드 + 인덱스 + 렌더 캐시"""
+    # 상세 페이지 캐시: 크기 제한이 있으면 LRU, 없으면 전부 캐시
+    detail_pages = RenderCache(
+        render_restaurant_detail,
+        key=lambda r: r.id,
+        maxsize=render_cache_size or None,
+    )
+    if prerender and not render_cache_size:
+        detail_pages.prerender(restaurants)
+
+    index = RestaurantIndex(restaurants, columns)
+
+    def render_compare(item: tuple[tuple[int, ...], str]) -> str:
+        positions, section = item
+        picks = {}
+        if section in ("picks", "value"):
+            picks = {k: restaurants[p] for k, p in index.situation_picks(positions).items()}
+        return render_compare_section(section, [restaurants[p] for p in positions], picks)
+
+    # 비교 섹션 캐시: (맛집 위치 순서, 섹션) → Markdown
+    compare_sections = RenderCache(
+        render_compare,
+        key=lambda item: item,
+        maxsize=COMPARE_CACHE_SIZE or None,
+    )
+
+    return {
+        "restaurants": restaurants,
+        "index": index,
+        "resolver": RestaurantResolver(restaurants, columns),
+        "fulltext": fulltext,
+        "similarity": SimilarityIndex(columns),
+        "geo": GeoIndex(columns.location),
+        "detail_pages": detail_pages,
+        "compare_sections": compare_sections,
+    }
+
+
+def _open_compiled(data_dir: Path) -> CompiledCatalog | None:
+    """최신 상태의 컴파일된 카탈로그 (없거나 오래됐으면 None → JSON 로드)"""
+    path = data_dir / CATALOG_FILE
+    if not path.exists():
+        return None
+    try:
+        compiled = CompiledCatalog(path)
+    except (OSError, InvalidCatalogError) as e:
+        logger.warning("컴파일된 카탈로그를 열 수 없어 JSON 으로 로드합니다: %s", e)
+        return None
+    if compiled.schema != schema_fingerprint():
+        logger.warning("모델/열 생성 코드가 바뀌어 컴파일된 카탈로그를 쓰지 않습니다: %s", path)
+        return None
+    # (mtime, 크기)가 같으면 내용 해시 계산 생략
+    if compiled.file_stats == _file_stats(data_dir):
+        return compiled
+    hashes = {name: _hash(c) for name, c in _read_files(data_dir).items()}
+    if compiled.file_hashes == hashes:
+        return compiled
+    logger.warning("컴파일된 카탈로그가 데이터 파일보다 오래되어 JSON 으로 로드합니다: %s", path)
+    return None
+
+
+def load_snapshot(
+    data_dir: Path | None = None,
+    render_cache_size: int | None = None,
+    prerender: bool | None = None,
+    previous: CatalogSnapshot | None = None,
+    use_compiled: bool | None = None,
+) -> CatalogSnapshot:
+    """데이터 디렉터리에서 스냅샷 생성
+
+    최신 상태의 catalog.bin 이 있으면 mmap 으로 열어 레코드를 지연 디코딩하고,
+    없거나 오래됐으면 JSON 파싱 + Pydantic 검증으로 로드한다.
+    render_cache_size / prerender / use_compiled 를 생략하면 환경변수 설정을 따른다.
+    previous 가 주어지면 내용 해시가 같은 파일은 다시 파싱하지 않고 재사용한다.
+    """
+    data_dir = data_dir or DEFAULT_DATA_DIR
+    render_cache_size = RENDER_CACHE_SIZE if render_cache_size is None else render_cache_size
+    prerender = PRERENDER if prerender is None else prerender
+    started = time.perf_counter()
+
+    use_compiled = USE_COMPILED if use_compiled is None else use_compiled
+    compiled = _open_compiled(data_dir) if use_compiled else None
+    if compiled is not None:
+        file_hashes = dict(compiled.file_hashes)
+        source: Callable[[str], bytes | None] = compiled.source
+    else:
+        contents = _read_files(data_dir)
+        file_hashes = {name: _hash(content) for name, content in contents.items()}
+        source = contents.__getitem__
+
+    def unchanged(name: str) -> bool:
+        return previous is not None and previous.file_hashes.get(name) == file_hashes[name]
+
+    if unchanged("restaurants.json"):
+        restaurant_fields = {f: getattr(previous, f) for f in RESTAURANT_FIELDS}
+    elif compiled is not None:
+        restaurant_fields = _restaurant_fields(
+            compiled.restaurants(),
+            compiled.columns(),
+            compiled.fulltext(),
+            render_cache_size,
+            prerender,
+        )
+    else:
+        restaurants = tuple(
+            Restaurant(**r) for r in _parse(source("restaurants.json")).get("restaurants", [])
+        )
+        restaurant_fields = _restaurant_fields(
+            restaurants,
+            RestaurantColumns.from_restaurants(restaurants),
+            FullTextIndex(restaurants),
+            render_cache_size,
+            prerender,
+        )
+
+    if unchanged("lineages.json"):
+        lineages = previous.lineages  # type: ignore[union-attr]
+    else:
+        lineages = tuple(_parse(source("lineages.json")).get("lineages", []))
+
+    if unchanged("eating_guides.json"):
+        eating_guides = previous.eating_guides  # type: ignore[union-attr]
+    else:
+        eating_guides = tuple(_parse(source("eating_guides.json")).get("eating_guides", []))
+
+    if unchanged("side_menus.json"):
+        side_menus = previous.side_menus  # type: ignore[union-attr]
+        courses = previous.courses  # type: ignore[union-attr]
+    else:
+        side_menus = MappingProxyType(_parse(source("side_menus.json")))
+        courses = load_courses(side_menus)
+
+    if unchanged("places.json"):
+        places = previous.places  # type: ignore[union-attr]
+    else:
+        places = load_places(_parse(source("places.json")))
+
+    if unchanged("holidays.json"):
+        holidays = previous.holidays  # type: ignore[union-attr]
+    else:
+        holidays = load_holidays(_parse(source("holidays.json")))
+
+    return CatalogSnapshot(
+        **restaurant_fields,
+        lineages=lineages,
+        eating_guides=eating_guides,
+        side_menus=side_menus,
+        courses=courses,
+        places=places,
+        holidays=holidays,
+        data_dir=data_dir,
+        file_hashes=MappingProxyType(file_hashes),
+        version=_version(file_hashes),
+        load_seconds=time.perf_counter() - started,
+        compiled=compiled is not None,
+    )
+
+
+def build_catalog(data_dir: Path | None = None, output: Path | None = None) -> Path:
+    """데이터 파일 → 컴파일된 카탈로그 (JSON 에서 검증 후 저장)"""
+    data_dir = data_dir or DEFAULT_DATA_DIR
+    output = output or data_dir / CATALOG_FILE
+    # 통계를 먼저 읽어야 빌드 중 파일이 바뀌면 다음 로드 때 해시로 다시 확인한다
+    stats = _file_stats(data_dir)
+    contents = _read_files(data_dir)
+    snapshot = load_snapshot(data_dir, render_cache_size=1, prerender=False, use_compiled=False)
+    write_catalog(output, snapshot, contents, stats)
+    return output
+
+
+# ============================================================
+# 프로세스 전역 공유 스냅샷
+# ============================================================
+
+
+def get_shared_snapshot() -> CatalogSnapshot:
+    """프로세스 전역 스냅샷 (최초 호출 시 한 번만 로드, 이후 리로드로만 교체)"""
+    from .store import shared_store
+
+    return shared_store.current
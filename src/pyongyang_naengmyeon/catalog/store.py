@@ -0,0 +1,171 @@
+"""카탈로그 핫 리로드
+
+현재 스냅샷을 보관하고, 데이터 파일이 바뀌면 이벤트 루프 밖(스레드)에서 새
+스냅샷을 만든 뒤 참조 하나만 교체한다. 도구 핸들러는 계산 도중 await 하지 않으므로
+처리 중인 요청은 시작할 때의 스냅샷으로 끝나고, 다음 요청부터 새 스냅샷을 본다.
+
+리로드 트리거:
+- SIGHUP (sse_server 가 등록, pre-fork 모드에서는 부모가 워커로 전달)
+- POST /admin/reload (NAENGMYEON_ADMIN_TOKEN 설정 시)
+- 데이터 디렉터리 폴링 (NAENGMYEON_WATCH_DATA=1)
+
+파싱/검증에 실패하면 이전 스냅샷을 그대로 유지하고 오류만 기록한다.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from .snapshot import DATA_FILES, CatalogSnapshot, load_snapshot
+
+logger = logging.getLogger(__name__)
+
+# 데이터 디렉터리 감시 설정 (환경변수로 조정)
+WATCH_DATA = os.environ.get("NAENGMYEON_WATCH_DATA", "") == "1"
+WATCH_INTERVAL = float(os.environ.get("NAENGMYEON_WATCH_INTERVAL", "5"))
+
+# 데이터 파일별 (mtime_ns, 크기) (없으면 None)
+_FileSignature = tuple[tuple[int, int] | None, ...]
+
+
+@dataclass
+class ReloadResult:
+    """리로드 결과"""
+
+    changed: bool
+    version: str
+    seconds: float
+    error: str | None = None
+
+
+class CatalogStore:
+    """현재 스냅샷 보관 + 원자적 교체"""
+
+    def __init__(self, data_dir: Path | None = None, snapshot: CatalogSnapshot | None = None):
+        self._data_dir = data_dir
+        self._snapshot = snapshot
+        self._init_lock = threading.Lock()
+        self._reload_lock: asyncio.Lock | None = None
+        self._watcher: asyncio.Task[None] | None = None
+        self.reloads = 0
+        self.reload_failures = 0
+        self.last_reload_at: float | None = None
+        self.last_error: str | None = None
+
+    @property
+    def current(self) -> CatalogSnapshot:
+        """현재 스냅샷 (최초 접근 시 한 번만 로드)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._init_lock:
+                if self._snapshot is None:
+                    self._snapshot = load_snapshot(self._data_dir)
+                snapshot = self._snapshot
+        return snapshot
+
+    def reload_sync(self) -> ReloadResult:
+        """동기 리로드 (이벤트 루프가 없는 곳에서 사용)"""
+        previous = self.current
+        try:
+            snapshot = load_snapshot(previous.data_dir, previous=previous)
+        except Exception as e:
+            return self._failed(previous, e)
+        return self._swap(previous, snapshot)
+
+    async def reload(self) -> ReloadResult:
+        """파싱은 스레드에서, 교체는 이벤트 루프에서 수행"""
+        if self._reload_lock is None:
+            self._reload_lock = asyncio.Lock()
+        async with self._reload_lock:
+            previous = self.current
+            try:
+                snapshot = await asyncio.to_thread(
+                    load_snapshot, previous.data_dir, previous=previous
+                )
+            except Exception as e:
+                return self._failed(previous, e)
+            return self._swap(previous, snapshot)
+
+    def _swap(self, previous: CatalogSnapshot, snapshot: CatalogSnapshot) -> ReloadResult:
+        self.last_reload_at = time.time()
+        self.last_error = None
+        if snapshot.version == previous.version:
+            return ReloadResult(False, previous.version, snapshot.load_seconds)
+        self._snapshot = snapshot
+        self.reloads += 1
+        logger.info(
+            "카탈로그 리로드: %s → %s (%.3fs)",
+            previous.version,
+            snapshot.version,
+            snapshot.load_seconds,
+        )
+        return ReloadResult(True, snapshot.version, snapshot.load_seconds)
+
+    def _failed(self, previous: CatalogSnapshot, error: Exception) -> ReloadResult:
+        self.reload_failures += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        logger.error("카탈로그 리로드 실패, 이전 스냅샷 유지: %s", self.last_error)
+        return ReloadResult(False, previous.version, 0.0, self.last_error)
+
+    # ------------------------------------------------------------
+    # 데이터 디렉터리 감시 (폴링)
+    # ------------------------------------------------------------
+
+    def _file_signature(self) -> _FileSignature:
+        data_dir = self.current.data_dir
+        signature: list[tuple[int, int] | None] = []
+        for name in DATA_FILES:
+            try:
+                stat = (data_dir / name).stat()
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    async def _watch_loop(self, interval: float, signature: _FileSignature) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            current = self._file_signature()
+            if current == signature:
+                continue
+            signature = current
+            # 내용이 같으면 (touch 등) load_snapshot 이 파일별 해시로 걸러낸다
+            await self.reload()
+
+    def ensure_watcher(self, interval: float = WATCH_INTERVAL) -> None:
+        """감시 태스크 시작 (이미 실행 중이면 무시)"""
+        if self._watcher is None or self._watcher.done():
+            signature = self._file_signature()
+            self._watcher = asyncio.get_running_loop().create_task(
+                self._watch_loop(interval, signature)
+            )
+
+    async def stop_watcher(self) -> None:
+        if self._watcher is not None:
+            self._watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._watcher
+            self._watcher = None
+
+    def stats(self) -> dict[str, object]:
+        """지표 (헬스 체크/모니터링용)"""
+        snapshot = self.current
+        return {
+            "version": snapshot.version,
+            "restaurants": len(snapshot.restaurants),
+            "load_seconds": round(snapshot.load_seconds, 4),
+            "reloads": self.reloads,
+            "reload_failures": self.reload_failures,
+            "last_reload_at": self.last_reload_at,
+            "last_error": self.last_error,
+        }
+
+
+# 프로세스 전역 스토어 (기본 데이터 디렉터리)
+shared_store = CatalogStore()
@@ -0,0 +1,179 @@
+"""운영 지표 (Prometheus 텍스트 형식)
+
+- 도구 호출: 결과별 건수, 지연 히스토그램, 응답 크기 히스토그램 (call_tool 계측)
+- 게이지/캐시/카탈로그 지표: 스크레이프 시점에 수집기(collector)가 읽음
+
+계측 비용은 호출당 perf_counter 두 번과 버킷 이분 탐색 두 번 정도다.
+멀티 워커 모드에서는 워커마다 별도 지표를 가진다.
+"""
+
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+
+# 지연(초) / 응답 크기(바이트) 버킷 상한
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+PREFIX = "naengmyeon"
+
+# (이름 접미사, 레이블, 값) — 히스토그램만 _bucket / _sum / _count 접미사를 쓴다
+Sample = tuple[str, dict[str, str], float]
+
+
+@dataclass(frozen=True, slots=True)
+class MetricFamily:
+    """같은 이름의 지표 묶음"""
+
+    name: str
+    kind: str  # counter | gauge | histogram
+    help: str
+    samples: Sequence[Sample]
+
+    @classmethod
+    def single(
+        cls, name: str, kind: str, help: str, value: float, labels: dict[str, str] | None = None
+    ) -> "MetricFamily":
+        """값 하나짜리 지표"""
+        return cls(f"{PREFIX}_{name}", kind, help, [("", labels or {}, value)])
+
+    @classmethod
+    def labeled(
+        cls, name: str, kind: str, help: str, values: Iterable[tuple[dict[str, str], float]]
+    ) -> "MetricFamily":
+        """레이블별 값 여러 개"""
+        samples: list[Sample] = [("", labels, value) for labels, value in values]
+        return cls(f"{PREFIX}_{name}", kind, help, samples)
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (le 는 상한 포함)"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # 마지막 = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self, labels: dict[str, str]) -> list[Sample]:
+        """_bucket (누적) / _sum / _count"""
+        out: list[Sample] = []
+        cumulative = 0
+        for bound, n in zip((*self.bounds, float("inf")), self.counts):
+            cumulative += n
+            le = "+Inf" if bound == float("inf") else _number(bound)
+            out.append(("_bucket", {**labels, "le": le}, cumulative))
+        out.append(("_sum", labels, self.sum))
+        out.append(("_count", labels, self.count))
+        return out
+
+
+class Gauge:
+    """증감 게이지"""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self) -> None:
+        self.value += 1
+
+    def dec(self) -> None:
+        self.value -= 1
+
+
+@dataclass
+class ToolMetrics:
+    """도구 하나의 호출 지표"""
+
+    calls: dict[str, int] = field(default_factory=lambda: {"ok": 0, "error": 0})
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    response_bytes: Histogram = field(default_factory=lambda: Histogram(SIZE_BUCKETS))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
+
+
+def _format(name: str, labels: dict[str, str], value: float) -> str:
+    if labels:
+        body = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+        name = f"{name}{{{body}}}"
+    return f"{name} {_number(value)}"
+
+
+class MetricsRegistry:
+    """프로세스 지표 저장소"""
+
+    def __init__(self) -> None:
+        self.tools: dict[str, ToolMetrics] = {}
+        self.started_at = time.time()
+        self._collectors: list[Callable[[], Iterable[MetricFamily]]] = []
+
+    def observe_call(self, tool: str, seconds: float, size: int, ok: bool) -> None:
+        """call_tool 한 건 기록"""
+        metrics = self.tools.get(tool)
+        if metrics is None:
+            metrics = self.tools[tool] = ToolMetrics()
+        metrics.calls["ok" if ok else "error"] += 1
+        metrics.latency.observe(seconds)
+        metrics.response_bytes.observe(size)
+
+    def add_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """스크레이프 시 호출할 수집기 등록"""
+        self._collectors.append(collector)
+
+    def _tool_families(self) -> list[MetricFamily]:
+        calls, latency, size = [], [], []
+        for tool, m in sorted(self.tools.items()):
+            for outcome, n in m.calls.items():
+                calls.append(({"tool": tool, "outcome": outcome}, n))
+            latency.extend(m.latency.samples({"tool": tool}))
+            size.extend(m.response_bytes.samples({"tool": tool}))
+        return [
+            MetricFamily.labeled("tool_calls_total", "counter", "도구 호출 수", calls),
+            MetricFamily(
+                f"{PREFIX}_tool_latency_seconds", "histogram", "도구 처리 시간 (초)", latency
+            ),
+            MetricFamily(
+                f"{PREFIX}_tool_response_bytes", "histogram", "도구 응답 크기 (UTF-8 바이트)", size
+            ),
+        ]
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines: list[str] = []
+        families = [
+            MetricFamily.single(
+                "process_start_time_seconds", "gauge", "프로세스 시작 시각", self.started_at
+            ),
+            *self._tool_families(),
+        ]
+        for collector in self._collectors:
+            families.extend(collector())
+
+        for family in families:
+            lines.append(f"# HELP {family.name} {family.help}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for suffix, labels, value in family.samples:
+                lines.append(_format(family.name + suffix, labels, value))
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전역 지표
+metrics = MetricsRegistry()
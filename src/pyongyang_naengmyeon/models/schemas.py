@@ -128,6 +128,8 @@ class Restaurant(BaseModel):
     region_code: Optional[str] = Field(default=None)
     address: str
     address_detail: Optional[str] = Field(default=None, description="상세주소")
+    latitude: Optional[float] = Field(default=None, ge=-90, le=90, description="위도 (WGS84)")
+    longitude: Optional[float] = Field(default=None, ge=-180, le=180, description="경도 (WGS84)")
     phone: Optional[str] = None
     hours: Optional[Hours] = Field(default=None, description="영업시간")
     hours_string: Optional[str] = Field(default=None, description="영업시간 문자열")
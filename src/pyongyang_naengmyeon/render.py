@@ -0,0 +1,206 @@
+"""맛집 상세 페이지 / 비교표 렌더링"""
+
+from collections.abc import Callable, Mapping, Sequence
+
+from .models import Restaurant
+
+
+def render_restaurant_detail(r: Restaurant) -> str:
+    """get_restaurant 상세 Markdown"""
+    tier_badge = "⭐ Tier 1" if r.tier == 1 else "Tier 2"
+    output = f"# {r.name} ({tier_badge})\n\n"
+
+    output += "## 기본 정보\n"
+    output += f"- 주소: {r.address}\n"
+    if r.address_detail:
+        output += f"- 상세주소: {r.address_detail}\n"
+    output += f"- 전화: {r.phone or '정보없음'}\n"
+    output += f"- 영업시간: {r.hours_string or '정보없음'}\n"
+    output += f"- 휴무: {r.closed_days_string or ', '.join(r.closed_days) or '정보없음'}\n"
+    output += f"- 물냉면 가격: {r.naengmyeon_price:,}원\n"
+    if r.accessibility:
+        output += f"- 접근성: {r.accessibility}\n"
+    if r.parking:
+        output += f"- 주차: {r.parking}\n"
+    if r.rating_score:
+        output += f"- 평점: {r.rating_score}\n"
+    output += "\n"
+
+    output += "## 계보와 역사\n"
+    output += f"- 계보: {r.lineage.value}\n"
+    if r.founded_year:
+        output += f"- 창업: {r.founded_year}년\n"
+    if r.generation:
+        output += f"- 현재: {r.generation}대째 운영\n"
+    if r.origin_story:
+        output += f"- 유래: {r.origin_story}\n"
+    if r.history and r.history.story:
+        output += f"- 역사: {r.history.story}\n"
+    output += "\n"
+
+    output += "## 맛 프로필\n"
+    output += "### 육수\n"
+    if r.broth.description:
+        output += f"{r.broth.description}\n"
+    output += f"- 베이스: {r.broth.base.value}\n"
+    output += f"- 맑기: {'★' * r.broth.clarity_level}{'☆' * (5 - r.broth.clarity_level)}\n"
+    output += f"- 깊이: {'★' * r.broth.depth_level}{'☆' * (5 - r.broth.depth_level)}\n"
+    output += f"- 육향: {'★' * r.broth.beef_aroma_level}{'☆' * (5 - r.broth.beef_aroma_level)}\n"
+    output += (
+        f"- 간: {'★' * r.broth.saltiness_level}{'☆' * (5 - r.broth.saltiness_level)}"
+        f" ({r.broth.saltiness or '보통'})\n"
+    )
+    output += f"- 살얼음: {'있음' if r.broth.has_slush_ice else '없음'}\n"
+    if r.broth.dongchimi:
+        output += "- 동치미: 사용\n"
+    output += "\n"
+
+    output += "### 면\n"
+    if r.noodle.description:
+        output += f"{r.noodle.description}\n"
+    output += f"- 스타일: {r.noodle.style.value}\n"
+    output += f"- 메밀 함량: {r.noodle.buckwheat_ratio}%\n"
+    output += f"- 굵기: {r.noodle.thickness.value}\n"
+    if r.noodle.texture_keywords:
+        output += f"- 식감: {', '.join(r.noodle.texture_keywords)}\n"
+    if r.noodle.homemade:
+        output += "- 자가제면: 예\n"
+    output += "\n"
+
+    output += "## 매니아 평가\n"
+    output += f"정통성 점수: {r.expert_rating.authenticity_score}/100\n"
+    if r.expert_rating.reviewer_note:
+        output += f"> {r.expert_rating.reviewer_note}\n"
+    output += "\n"
+
+    if r.certifications:
+        output += "## 인증/수상\n"
+        for cert in r.certifications:
+            output += f"- {cert.year}년 {cert.type.value}: {cert.detail or ''}\n"
+        output += "\n"
+
+    if r.side_menus:
+        output += "## 사이드 메뉴\n"
+        for menu in r.side_menus:
+            sig = "⭐" if menu.is_signature else ""
+            output += f"- {menu.name} {sig}: {menu.price:,}원\n"
+            if menu.pairing_note:
+                output += f"  └ {menu.pairing_note}\n"
+        output += "\n"
+
+    if r.features:
+        output += "## 특징\n"
+        for f in r.features:
+            output += f"- {f}\n"
+        output += "\n"
+
+    if r.special_notes:
+        output += "## 방문 팁\n"
+        for note in r.special_notes:
+            output += f"- {note}\n"
+
+    return output
+
+
+# ============================================================
+# 맛집 비교 (compare / compare_many)
+# ============================================================
+
+def _stars(n: int) -> str:
+    return "★" * n
+
+
+def _value_score(r: Restaurant) -> str:
+    if not r.naengmyeon_price:
+        return "-"
+    return f"{r.expert_rating.overall_balance * 10000 / r.naengmyeon_price:.1f}"
+
+
+# 비교표 섹션: 키 → (제목, ((항목, 값 추출), ...)) — 모듈 로드 시 한 번 구성
+COMPARE_TABLES: dict[str, tuple[str, tuple[tuple[str, Callable[[Restaurant], object]], ...]]] = {
+    "basic": ("기본 정보", (
+        ("등급", lambda r: f"Tier {r.tier}"),
+        ("계보", lambda r: r.lineage.value),
+        ("가격", lambda r: f"{r.naengmyeon_price:,}원"),
+        ("창업", lambda r: f"{r.founded_year or '정보없음'}년"),
+        ("평점", lambda r: r.rating_score or "-"),
+    )),
+    "broth": ("육수 비교", (
+        ("베이스", lambda r: r.broth.base.value),
+        ("맑기", lambda r: _stars(r.broth.clarity_level)),
+        ("깊이", lambda r: _stars(r.broth.depth_level)),
+        ("육향", lambda r: _stars(r.broth.beef_aroma_level)),
+        ("간", lambda r: _stars(r.broth.saltiness_level)),
+        ("살얼음", lambda r: "O" if r.broth.has_slush_ice else "X"),
+    )),
+    "noodle": ("면 비교", (
+        ("스타일", lambda r: r.noodle.style.value),
+        ("메밀 함량", lambda r: f"{r.noodle.buckwheat_ratio}%"),
+        ("굵기", lambda r: r.noodle.thickness.value),
+    )),
+    "rating": ("매니아 평가", (
+        ("정통성 점수", lambda r: f"{r.expert_rating.authenticity_score}/100"),
+        ("전체 밸런스", lambda r: _stars(r.expert_rating.overall_balance)),
+    )),
+    "value": ("가성비", (
+        ("가격", lambda r: f"{r.naengmyeon_price:,}원"),
+        ("전체 밸런스", lambda r: _stars(r.expert_rating.overall_balance)),
+        ("가성비 점수", _value_score),
+    )),
+}
+
+# 상황별 추천 문구 (추천 키 → (라벨, 설명))
+PICK_LINES = {
+    "beginner": ("입문자", " (육향이 진하고 친숙한 맛)"),
+    "mania": ("매니아", " (정통성 점수 높음)"),
+    "value": ("가성비", ""),
+}
+
+# 섹션 출력 순서
+COMPARE_SECTIONS = ("basic", "broth", "noodle", "rating", "value", "picks")
+
+# focus_on 값 → 섹션 (지정하지 않으면 DEFAULT_FOCUS)
+FOCUS_SECTIONS: dict[str, tuple[str, ...]] = {
+    "broth": ("broth",),
+    "noodle": ("noodle",),
+    "overall": ("basic", "rating", "picks"),
+    "value": ("value",),
+}
+DEFAULT_FOCUS = ("basic", "broth", "noodle", "rating", "picks")
+
+
+def compare_sections(focus_on: str | None) -> tuple[str, ...] | None:
+    """focus_on ("broth,noodle" 처럼 쉼표 구분) → 출력 순서의 섹션 (알 수 없는 값이면 None)"""
+    if not focus_on or not focus_on.strip():
+        return DEFAULT_FOCUS
+    wanted: set[str] = set()
+    for focus in focus_on.split(","):
+        sections = FOCUS_SECTIONS.get(focus.strip().casefold())
+        if sections is None:
+            return None
+        wanted.update(sections)
+    return tuple(s for s in COMPARE_SECTIONS if s in wanted)
+
+
+def render_compare_section(
+    section: str,
+    restaurants: Sequence[Restaurant],
+    picks: Mapping[str, Restaurant],
+) -> str:
+    """비교 섹션 하나 (맛집마다 열 하나)"""
+    if section == "picks":
+        output = "## 상황별 추천\n"
+        for key, (label, note) in PICK_LINES.items():
+            output += f"- **{label}**: {picks[key].name}{note}\n"
+        return output
+
+    title, rows = COMPARE_TABLES[section]
+    output = f"## {title}\n"
+    output += "| 항목 | " + " | ".join(r.name for r in restaurants) + " |\n"
+    output += "|------|" + "--------|" * len(restaurants) + "\n"
+    for label, get in rows:
+        output += f"| {label} | " + " | ".join(str(get(r)) for r in restaurants) + " |\n"
+    if section == "value":
+        label, note = PICK_LINES["value"]
+        output += f"\n- **{label}**: {picks['value'].name}{note}\n"
+    return output + "\n"
@@ -1,98 +1,215 @@
 """평양냉면 MCP 서버 엔트리포인트"""
 
 import asyncio
-import json
+from collections.abc import Mapping, Sequence
 from pathlib import Path
+from typing import Any
+
+import numpy as np
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
+from .catalog import (
+    CatalogSnapshot,
+    CatalogStore,
+    FullTextIndex,
+    RestaurantIndex,
+    RestaurantResolver,
+    shared_store,
+)
+from .catalog.cursor import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    fingerprint,
+)
+from .catalog.geo import find_place
+from .catalog.crawl import plan_crawl
+from .catalog.hours import DAY_MINUTES, OpenAt, parse_open_at
+from .catalog.pairings import optimize_sides
+from .render import FOCUS_SECTIONS, compare_sections
 from .tools.definitions import register_tools
 from .models import Restaurant, SearchFilters, LineageInfo, EatingGuide
 
 
+UNKNOWN_FOCUS = (
+    "알 수 없는 비교 초점입니다: '{}' (" + ", ".join(FOCUS_SECTIONS) + " 중 선택, 쉼표로 여러 개)"
+)
+UNKNOWN_OPEN_AT = "시각을 해석할 수 없습니다: '{}' (예: now, 2026-05-01T12:30, 12:30, 토 12:30)"
+
+
+def _suggestions(resolver: RestaurantResolver, query: str) -> str:
+    """오타/초성 후보 목록 ("혹시 이 맛집?")"""
+    return ", ".join(f"{r.name}({r.slug or r.id})" for r in resolver.suggest(query))
+
+
+def _format_distance(meters: float) -> str:
+    """350m / 1.2km"""
+    return f"{meters:.0f}m" if meters < 1000 else f"{meters / 1000:.1f}km"
+
+
+def not_found(resolver: RestaurantResolver, query: str) -> str:
+    """맛집을 찾지 못했을 때 메시지 (비슷한 이름이 있으면 함께 안내)"""
+    message = f"'{query}' 맛집을 찾을 수 없습니다."
+    suggestions = _suggestions(resolver, query)
+    if suggestions:
+        message += f"\n\n혹시 이 맛집을 찾으셨나요? {suggestions}"
+    return message
+
+
+def not_found_many(resolver: RestaurantResolver, queries: Sequence[str]) -> str:
+    """여러 맛집을 찾지 못했을 때 메시지 (질의별 후보 안내)"""
+    output = "맛집을 찾을 수 없습니다: " + ", ".join(f"'{q}'" for q in queries)
+    for query in queries:
+        suggestions = _suggestions(resolver, query)
+        if suggestions:
+            output += f"\n- '{query}' → 혹시: {suggestions}"
+    return output
+
+
+def _clock(minutes: float, start: float) -> str:
+    """주 기준 분 → HH:MM (출발일 이후면 +N일)"""
+    text = f"{int(minutes) % DAY_MINUTES // 60:02d}:{int(minutes) % 60:02d}"
+    days = int(minutes) // DAY_MINUTES - int(start) // DAY_MINUTES
+    return f"{text} (+{days}일)" if days else text
+
+
 class DataProvider:
-    """데이터 제공자 클래스"""
+    """데이터 제공자 클래스
+
+    데이터는 CatalogSnapshot 에 있고, 기본적으로 프로세스 전역 스토어의
+    스냅샷을 참조로 공유하므로 세션마다 생성해도 JSON 재파싱 비용이 없다.
+    리로드되면 다음 호출부터 새 스냅샷을 본다.
+    """
     
-    def __init__(self, data_dir: Path | None = None):
-        self.data_dir = data_dir or Path(__file__).parent / "data"
-        self.restaurants: list[Restaurant] = []
-        self.lineages: list[dict] = []
-        self.eating_guides: list[dict] = []
-        self.side_menus: dict = {}
-        self._load_data()
+    def __init__(
+        self,
+        data_dir: Path | None = None,
+        snapshot: CatalogSnapshot | None = None,
+        store: CatalogStore | None = None,
+    ):
+        if store is None:
+            store = CatalogStore(data_dir, snapshot) if data_dir or snapshot else shared_store
+        self.store = store
     
-    def _load_data(self):
-        """JSON 데이터 로드"""
-        # 레스토랑 데이터
-        restaurants_file = self.data_dir / "restaurants.json"
-        if restaurants_file.exists():
-            with open(restaurants_file, encoding="utf-8") as f:
-                data = json.load(f)
-                self.restaurants = [
-                    Restaurant(**r) for r in data.get("restaurants", [])
-                ]
-        
-        # 계보 데이터
-        lineages_file = self.data_dir / "lineages.json"
-        if lineages_file.exists():
-            with open(lineages_file, encoding="utf-8") as f:
-                data = json.load(f)
-                self.lineages = data.get("lineages", [])
-        
-        # 먹는 법 가이드
-        guides_file = self.data_dir / "eating_guides.json"
-        if guides_file.exists():
-            with open(guides_file, encoding="utf-8") as f:
-                data = json.load(f)
-                self.eating_guides = data.get("eating_guides", [])
-        
-        # 사이드 메뉴
-        side_file = self.data_dir / "side_menus.json"
-        if side_file.exists():
-            with open(side_file, encoding="utf-8") as f:
-                self.side_menus = json.load(f)
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        return self.store.current
     
-    async def search_restaurants(self, params) -> str:
-        """맛집 검색"""
-        results = self.restaurants
+    def pinned(self) -> "DataProvider":
+        """현재 스냅샷에 고정된 제공자 (batch 처럼 여러 호출을 같은 데이터로 처리)"""
+        return DataProvider(snapshot=self.snapshot)
+    
+    @property
+    def data_dir(self) -> Path:
+        return self.snapshot.data_dir
+    
+    @property
+    def restaurants(self) -> Sequence[Restaurant]:
+        return self.snapshot.restaurants
+    
+    @property
+    def lineages(self) -> tuple[dict, ...]:
+        return self.snapshot.lineages
+    
+    @property
+    def eating_guides(self) -> tuple[dict, ...]:
+        return self.snapshot.eating_guides
+    
+    @property
+    def side_menus(self) -> Mapping[str, Any]:
+        return self.snapshot.side_menus
+    
+    @property
+    def index(self) -> RestaurantIndex:
+        return self.snapshot.index
+    
+    @property
+    def resolver(self) -> RestaurantResolver:
+        return self.snapshot.resolver
+    
+    @property
+    def fulltext(self) -> FullTextIndex:
+        return self.snapshot.fulltext
+    
+    @staticmethod
+    def _search_filters(index: RestaurantIndex, params) -> list:
+        """search_restaurants / search_nearby 공통 구조화 필터"""
+        filters = []
         
-        # 필터 적용
+        # 필터 마스크 (열 단위 벡터 비교)
         if params.region:
-            results = [r for r in results if r.region == params.region]
+            filters.append(index.eq("region", params.region))
         
         if params.lineage:
-            results = [r for r in results if r.lineage == params.lineage]
+            filters.append(index.eq("lineage", params.lineage))
         
         if params.max_price:
-            results = [r for r in results if r.naengmyeon_price <= params.max_price]
+            filters.append(index.at_most("price", params.max_price))
         
         if params.experience_level:
-            results = [
-                r for r in results 
-                if params.experience_level in r.recommended_for
-            ]
+            filters.append(index.has("recommended_for", params.experience_level))
         
         if params.michelin_only:
-            results = [
-                r for r in results
-                if any(c.type.value.startswith("michelin") for c in r.certifications)
-            ]
+            filters.append(index.flag("michelin"))
         
         if params.has_slush_ice is not None:
-            results = [r for r in results if r.broth.has_slush_ice == params.has_slush_ice]
+            filters.append(index.eq("has_slush_ice", params.has_slush_ice))
         
         # tier 필터 추가
         if hasattr(params, 'tier') and params.tier is not None:
-            results = [r for r in results if r.tier == params.tier]
+            filters.append(index.eq("tier", params.tier))
+        
+        return filters
+    
+    async def search_restaurants(self, params) -> str:
+        """맛집 검색"""
+        # 한 요청 안에서는 같은 스냅샷을 사용 (리로드와 무관하게 커서/결과 일관)
+        snapshot = self.snapshot
+        index = snapshot.index
+        filters = self._search_filters(index, params)
+        
+        # 영업 중 필터 (주간 비트맵 비트 검사)
+        when: OpenAt | None = None
+        if params.open_at:
+            try:
+                when = parse_open_at(params.open_at, holidays=snapshot.holidays)
+            except ValueError:
+                return UNKNOWN_OPEN_AT.format(params.open_at)
+            filters.append(index.open_at(when))
         
-        # rating_score로 정렬 (높은 순)
-        results = sorted(results, key=lambda r: r.rating_score or 0, reverse=True)
+        # 페이지 커서 (스냅샷 버전 + 검색 조건에 묶임)
+        conditions = fingerprint(params.model_dump(mode="json", exclude={"limit", "cursor"}))
+        offset = 0
+        if params.cursor:
+            try:
+                offset = decode_cursor(params.cursor, snapshot.version, conditions)
+            except InvalidCursorError as e:
+                return str(e)
+        limit = params.limit
+        
+        if params.query:
+            # 자연어 검색: BM25 관련도 순 (구조화 필터 결과로 한정)
+            candidates = index.combine(filters)
+            total, positions = snapshot.fulltext.page(params.query, offset, limit, candidates)
+            results = [snapshot.restaurants[pos] for pos in positions]
+        else:
+            # rating_score 순서 (높은 순, 미리 계산됨)
+            total, results = index.page(
+                filters, index.rating_order, index.rating_rank, offset, limit
+            )
         
-        # 결과 포맷팅
-        if not results:
+        # 결과 포맷팅 (현재 페이지만)
+        if not total:
             return "조건에 맞는 맛집을 찾지 못했습니다."
+        if not results:
+            return f"더 이상 결과가 없습니다. (전체 {total}곳)"
         
-        output = f"## 검색 결과 ({len(results)}곳)\n\n"
+        output = f"## 검색 결과 ({total}곳)\n\n"
+        if when:
+            output += f"_{when.label()} 영업 중_\n\n"
+        if total > limit or offset:
+            output += f"_{offset + 1}–{offset + len(results)}번째 결과_\n\n"
         for r in results:
             tier_badge = "⭐" if r.tier == 1 else ""
             output += f"### {r.name} {tier_badge}\n"
@@ -106,6 +223,10 @@ class DataProvider:
                 output += f"- 특징: {desc}{'...' if len(r.broth.description) > 50 else ''}\n"
             output += "\n"
         
+        if offset + len(results) < total:
+            next_cursor = encode_cursor(snapshot.version, conditions, offset + len(results))
+            output += f"next_cursor: {next_cursor}\n"
+        
         return output
     
     async def get_restaurant(self, params) -> str:
@@ -113,111 +234,15 @@ class DataProvider:
         restaurant = None
         
         if params.id:
-            # id가 문자열로 올 수 있으므로 변환
-            try:
-                target_id = int(params.id)
-            except ValueError:
-                target_id = params.id
-            restaurant = next((r for r in self.restaurants if r.id == target_id), None)
+            # id 또는 slug
+            restaurant = self.resolver.get(params.id)
         elif params.name:
-            restaurant = next(
-                (r for r in self.restaurants if params.name in r.name), None
-            )
+            restaurant = self.resolver.resolve(params.name)
         
         if not restaurant:
-            return f"'{params.id or params.name}' 맛집을 찾을 수 없습니다."
-        
-        r = restaurant
-        tier_badge = "⭐ Tier 1" if r.tier == 1 else "Tier 2"
-        output = f"# {r.name} ({tier_badge})\n\n"
-        
-        output += f"## 기본 정보\n"
-        output += f"- 주소: {r.address}\n"
-        if r.address_detail:
-            output += f"- 상세주소: {r.address_detail}\n"
-        output += f"- 전화: {r.phone or '정보없음'}\n"
-        output += f"- 영업시간: {r.hours_string or '정보없음'}\n"
-        output += f"- 휴무: {r.closed_days_string or ', '.join(r.closed_days) or '정보없음'}\n"
-        output += f"- 물냉면 가격: {r.naengmyeon_price:,}원\n"
-        if r.accessibility:
-            output += f"- 접근성: {r.accessibility}\n"
-        if r.parking:
-            output += f"- 주차: {r.parking}\n"
-        if r.rating_score:
-            output += f"- 평점: {r.rating_score}\n"
-        output += "\n"
-        
-        output += f"## 계보와 역사\n"
-        output += f"- 계보: {r.lineage.value}\n"
-        if r.founded_year:
-            output += f"- 창업: {r.founded_year}년\n"
-        if r.generation:
-            output += f"- 현재: {r.generation}대째 운영\n"
-        if r.origin_story:
-            output += f"- 유래: {r.origin_story}\n"
-        if r.history and r.history.story:
-            output += f"- 역사: {r.history.story}\n"
-        output += "\n"
-        
-        output += f"## 맛 프로필\n"
-        output += f"### 육수\n"
-        if r.broth.description:
-            output += f"{r.broth.description}\n"
-        output += f"- 베이스: {r.broth.base.value}\n"
-        output += f"- 맑기: {'★' * r.broth.clarity_level}{'☆' * (5 - r.broth.clarity_level)}\n"
-        output += f"- 깊이: {'★' * r.broth.depth_level}{'☆' * (5 - r.broth.depth_level)}\n"
-        output += f"- 육향: {'★' * r.broth.beef_aroma_level}{'☆' * (5 - r.broth.beef_aroma_level)}\n"
-        output += f"- 간: {'★' * r.broth.saltiness_level}{'☆' * (5 - r.broth.saltiness_level)} ({r.broth.saltiness or '보통'})\n"
-        output += f"- 살얼음: {'있음' if r.broth.has_slush_ice else '없음'}\n"
-        if r.broth.dongchimi:
-            output += f"- 동치미: 사용\n"
-        output += "\n"
-        
-        output += f"### 면\n"
-        if r.noodle.description:
-            output += f"{r.noodle.description}\n"
-        output += f"- 스타일: {r.noodle.style.value}\n"
-        output += f"- 메밀 함량: {r.noodle.buckwheat_ratio}%\n"
-        output += f"- 굵기: {r.noodle.thickness.value}\n"
-        if r.noodle.texture_keywords:
-            output += f"- 식감: {', '.join(r.noodle.texture_keywords)}\n"
-        if r.noodle.homemade:
-            output += f"- 자가제면: 예\n"
-        output += "\n"
-        
-        output += f"## 매니아 평가\n"
-        output += f"정통성 점수: {r.expert_rating.authenticity_score}/100\n"
-        if r.expert_rating.reviewer_note:
-            output += f"> {r.expert_rating.reviewer_note}\n"
-        output += "\n"
-        
-        if r.certifications:
-            output += f"## 인증/수상\n"
-            for cert in r.certifications:
-                output += f"- {cert.year}년 {cert.type.value}: {cert.detail or ''}\n"
-            output += "\n"
-        
-        if r.side_menus:
-            output += f"## 사이드 메뉴\n"
-            for menu in r.side_menus:
-                sig = "⭐" if menu.is_signature else ""
-                output += f"- {menu.name} {sig}: {menu.price:,}원\n"
-                if menu.pairing_note:
-                    output += f"  └ {menu.pairing_note}\n"
-            output += "\n"
-        
-        if r.features:
-            output += f"## 특징\n"
-            for f in r.features:
-                output += f"- {f}\n"
-            output += "\n"
-        
-        if r.special_notes:
-            output += f"## 방문 팁\n"
-            for note in r.special_notes:
-                output += f"- {note}\n"
+            return not_found(self.resolver, params.id or params.name)
         
-        return output
+        return self.snapshot.detail_pages.get(restaurant)
     
     async def get_lineage_info(self, params) -> str:
         """계보 정보 조회"""
@@ -275,38 +300,49 @@ class DataProvider:
     
     async def recommend(self, params) -> str:
         """맛집 추천"""
-        results = self.restaurants
+        snapshot = self.snapshot
+        index = snapshot.index
         
         # 경험 수준 필터
-        results = [
-            r for r in results 
-            if params.experience_level in r.recommended_for
-        ]
+        filters = [index.has("recommended_for", params.experience_level)]
         
         # 육수 선호도 필터
         if params.broth_preference.value == "rich_beefy":
-            results = [r for r in results if r.broth.beef_aroma_level >= 4]
+            filters.append(index.at_least("beef_aroma", 4))
         elif params.broth_preference.value == "light_clean":
-            results = [r for r in results if r.broth.saltiness_level <= 2]
+            filters.append(index.at_most("saltiness", 2))
         elif params.broth_preference.value == "dongchimi_sour":
-            results = [r for r in results if r.broth.dongchimi]
+            filters.append(index.flag("dongchimi"))
         
         # 지역 필터
         if params.region:
-            results = [r for r in results if r.region == params.region]
+            filters.append(index.eq("region", params.region))
         
         # 웨이팅 회피
         if params.avoid_long_wait:
-            results = [r for r in results if (r.average_wait_minutes or 0) <= 20]
+            filters.append(index.at_most("wait", 20))
+        
+        # 영업 중
+        when: OpenAt | None = None
+        if params.open_at:
+            try:
+                when = parse_open_at(params.open_at, holidays=snapshot.holidays)
+            except ValueError:
+                return UNKNOWN_OPEN_AT.format(params.open_at)
+            filters.append(index.open_at(when))
         
-        # tier와 rating_score로 정렬
-        results = sorted(results, key=lambda r: (r.tier, -(r.rating_score or 0)))
+        # tier와 rating_score 순서 (미리 계산됨), 상위 3곳만 부분 정렬
+        _, results = index.page(
+            filters, index.tier_rating_order, index.tier_rating_rank, 0, 3
+        )
         
         if not results:
             return "조건에 맞는 추천 맛집을 찾지 못했습니다."
         
         output = f"## {params.experience_level.value} 맞춤 추천\n\n"
-        for r in results[:3]:
+        if when:
+            output += f"_{when.label()} 영업 중_\n\n"
+        for r in results:
             tier_badge = "⭐" if r.tier == 1 else ""
             output += f"### {r.name} {tier_badge}\n"
             output += f"- 계보: {r.lineage.value}\n"
@@ -317,93 +353,266 @@ class DataProvider:
         
         return output
     
+    def _render_comparison(
+        self, snapshot: CatalogSnapshot, positions: list[int], focus_on: str | None
+    ) -> str | None:
+        """요청한 섹션만 렌더 (섹션은 맛집 조합별로 캐시, focus_on 이 잘못되면 None)"""
+        sections = compare_sections(focus_on)
+        if sections is None:
+            return None
+        key = tuple(positions)
+        return "".join(snapshot.compare_sections.get((key, s)) for s in sections)
+    
     async def compare(self, params) -> str:
         """맛집 비교"""
-        # 맛집 찾기
-        def find_restaurant(query: str) -> Restaurant | None:
-            # ID로 검색
-            try:
-                target_id = int(query)
-                return next((r for r in self.restaurants if r.id == target_id), None)
-            except ValueError:
-                pass
-            # 이름으로 검색
-            return next((r for r in self.restaurants if query in r.name), None)
-        
-        r1 = find_restaurant(params.restaurant1)
-        r2 = find_restaurant(params.restaurant2)
-        
-        if not r1:
-            return f"'{params.restaurant1}' 맛집을 찾을 수 없습니다."
-        if not r2:
-            return f"'{params.restaurant2}' 맛집을 찾을 수 없습니다."
-        
-        output = f"# {r1.name} vs {r2.name} 비교\n\n"
-        
-        # 기본 정보
-        output += "## 기본 정보\n"
-        output += f"| 항목 | {r1.name} | {r2.name} |\n"
-        output += "|------|--------|--------|\n"
-        output += f"| 등급 | Tier {r1.tier} | Tier {r2.tier} |\n"
-        output += f"| 계보 | {r1.lineage.value} | {r2.lineage.value} |\n"
-        output += f"| 가격 | {r1.naengmyeon_price:,}원 | {r2.naengmyeon_price:,}원 |\n"
-        output += f"| 창업 | {r1.founded_year or '정보없음'}년 | {r2.founded_year or '정보없음'}년 |\n"
-        output += f"| 평점 | {r1.rating_score or '-'} | {r2.rating_score or '-'} |\n\n"
-        
-        # 육수 비교
-        output += "## 육수 비교\n"
-        output += f"| 항목 | {r1.name} | {r2.name} |\n"
-        output += "|------|--------|--------|\n"
-        output += f"| 베이스 | {r1.broth.base.value} | {r2.broth.base.value} |\n"
-        output += f"| 맑기 | {'★' * r1.broth.clarity_level} | {'★' * r2.broth.clarity_level} |\n"
-        output += f"| 깊이 | {'★' * r1.broth.depth_level} | {'★' * r2.broth.depth_level} |\n"
-        output += f"| 육향 | {'★' * r1.broth.beef_aroma_level} | {'★' * r2.broth.beef_aroma_level} |\n"
-        output += f"| 간 | {'★' * r1.broth.saltiness_level} | {'★' * r2.broth.saltiness_level} |\n"
-        output += f"| 살얼음 | {'O' if r1.broth.has_slush_ice else 'X'} | {'O' if r2.broth.has_slush_ice else 'X'} |\n\n"
-        
-        # 면 비교
-        output += "## 면 비교\n"
-        output += f"| 항목 | {r1.name} | {r2.name} |\n"
-        output += "|------|--------|--------|\n"
-        output += f"| 스타일 | {r1.noodle.style.value} | {r2.noodle.style.value} |\n"
-        output += f"| 메밀 함량 | {r1.noodle.buckwheat_ratio}% | {r2.noodle.buckwheat_ratio}% |\n"
-        output += f"| 굵기 | {r1.noodle.thickness.value} | {r2.noodle.thickness.value} |\n\n"
-        
-        # 평가 비교
-        output += "## 매니아 평가\n"
-        output += f"| 항목 | {r1.name} | {r2.name} |\n"
-        output += "|------|--------|--------|\n"
-        output += f"| 정통성 점수 | {r1.expert_rating.authenticity_score}/100 | {r2.expert_rating.authenticity_score}/100 |\n"
-        output += f"| 전체 밸런스 | {'★' * r1.expert_rating.overall_balance} | {'★' * r2.expert_rating.overall_balance} |\n\n"
-        
-        # 추천
-        output += "## 상황별 추천\n"
-        # 입문자
-        beginner_scores = [
-            (r1, r1.broth.beef_aroma_level + (5 - r1.broth.saltiness_level)),
-            (r2, r2.broth.beef_aroma_level + (5 - r2.broth.saltiness_level))
-        ]
-        beginner_pick = max(beginner_scores, key=lambda x: x[1])[0]
-        output += f"- **입문자**: {beginner_pick.name} (육향이 진하고 친숙한 맛)\n"
-        
-        # 매니아
-        mania_scores = [
-            (r1, r1.expert_rating.authenticity_score),
-            (r2, r2.expert_rating.authenticity_score)
-        ]
-        mania_pick = max(mania_scores, key=lambda x: x[1])[0]
-        output += f"- **매니아**: {mania_pick.name} (정통성 점수 높음)\n"
-        
-        # 가성비
-        value_scores = [
-            (r1, r1.expert_rating.overall_balance * 10000 / r1.naengmyeon_price if r1.naengmyeon_price else 0),
-            (r2, r2.expert_rating.overall_balance * 10000 / r2.naengmyeon_price if r2.naengmyeon_price else 0)
-        ]
-        value_pick = max(value_scores, key=lambda x: x[1])[0]
-        output += f"- **가성비**: {value_pick.name}\n"
+        snapshot = self.snapshot
+        
+        # 맛집 찾기 (ID/slug/이름)
+        pos1 = snapshot.resolver.locate(params.restaurant1)
+        pos2 = snapshot.resolver.locate(params.restaurant2)
+        
+        if pos1 is None:
+            return not_found(snapshot.resolver, params.restaurant1)
+        if pos2 is None:
+            return not_found(snapshot.resolver, params.restaurant2)
+        r1, r2 = snapshot.restaurants[pos1], snapshot.restaurants[pos2]
+        
+        # 기본 정보 / 육수 / 면 / 매니아 평가 / 상황별 추천 중 focus_on 섹션만
+        body = self._render_comparison(snapshot, [pos1, pos2], params.focus_on)
+        if body is None:
+            return UNKNOWN_FOCUS.format(params.focus_on)
+        return f"# {r1.name} vs {r2.name} 비교\n\n" + body
+    
+    async def compare_many(self, params) -> str:
+        """여러 맛집 한 번에 비교 (N개 열 비교표)"""
+        snapshot = self.snapshot
+        
+        # 한 번에 해석 (중복 제거, 입력 순서 유지)
+        positions: list[int] = []
+        missing: list[str] = []
+        for query in params.restaurants:
+            pos = snapshot.resolver.locate(query)
+            if pos is None:
+                missing.append(query)
+            elif pos not in positions:
+                positions.append(pos)
+        if missing:
+            return not_found_many(snapshot.resolver, missing)
+        if len(positions) < 2:
+            return "비교하려면 서로 다른 맛집이 2곳 이상 필요합니다."
+        
+        body = self._render_comparison(snapshot, positions, params.focus_on)
+        if body is None:
+            return UNKNOWN_FOCUS.format(params.focus_on)
+        return f"# {len(positions)}곳 비교\n\n" + body
+    
+    async def find_similar(self, params) -> str:
+        """맛이 비슷한 맛집 찾기"""
+        snapshot = self.snapshot
+        index = snapshot.index
+        
+        pos = snapshot.resolver.locate(params.restaurant)
+        if pos is None:
+            return not_found(snapshot.resolver, params.restaurant)
+        base = snapshot.restaurants[pos]
+        
+        filters = []
+        if params.region:
+            filters.append(index.eq("region", params.region))
+        if params.max_price:
+            filters.append(index.at_most("price", params.max_price))
+        if params.tier is not None:
+            filters.append(index.eq("tier", params.tier))
+        
+        # 특징 벡터 최근접 이웃 (로드 시 구축됨)
+        positions, distances = snapshot.similarity.nearest(
+            pos, params.limit, index.combine(filters)
+        )
+        if not len(positions):
+            return "조건에 맞는 비슷한 맛집을 찾지 못했습니다."
+        
+        output = f"## '{base.name}' 기준 비슷한 맛집\n\n"
+        output += (
+            f"_기준: {base.lineage.value} · 맑기 {base.broth.clarity_level} · "
+            f"육향 {base.broth.beef_aroma_level} · 간 {base.broth.saltiness_level} · "
+            f"메밀 {base.noodle.buckwheat_ratio}%_\n\n"
+        )
+        for rank, (p, distance) in enumerate(zip(positions.tolist(), distances.tolist()), 1):
+            r = snapshot.restaurants[p]
+            tier_badge = "⭐" if r.tier == 1 else ""
+            output += f"### {rank}. {r.name} {tier_badge}\n"
+            output += f"- 유사도: {snapshot.similarity.similarity(distance):.0f}%\n"
+            output += f"- 위치: {r.address}\n"
+            output += f"- 계보: {r.lineage.value}\n"
+            output += f"- 가격: {r.naengmyeon_price:,}원\n"
+            output += (
+                f"- 육수: 맑기 {r.broth.clarity_level} · 육향 {r.broth.beef_aroma_level} · "
+                f"간 {r.broth.saltiness_level}{' · 살얼음' if r.broth.has_slush_ice else ''}\n"
+            )
+            output += f"- 면: {r.noodle.style.value}, 메밀 {r.noodle.buckwheat_ratio}%\n\n"
         
         return output
     
+    @staticmethod
+    def _locate_point(
+        snapshot: CatalogSnapshot,
+        near: str | None,
+        latitude: float | None,
+        longitude: float | None,
+    ) -> tuple[str, float, float, int | None] | str:
+        """기준 위치 (이름, 위도, 경도, 기준 맛집 위치) — 좌표 → 역/랜드마크 → 맛집 순
+
+        찾지 못하면 오류 메시지.
+        """
+        if latitude is not None and longitude is not None:
+            return f"{latitude:.4f}, {longitude:.4f}", latitude, longitude, None
+        place = find_place(snapshot.places, near or "")
+        if place is not None:
+            return place.name, place.latitude, place.longitude, None
+        pos = snapshot.resolver.locate(near or "")
+        if pos is None:
+            return (
+                f"'{near}' 위치를 찾을 수 없습니다. "
+                "역/랜드마크 이름, 맛집 이름 또는 latitude/longitude 를 지정해 주세요."
+            )
+        base = snapshot.restaurants[pos]
+        if base.latitude is None or base.longitude is None:
+            return f"'{base.name}'의 좌표 정보가 없습니다."
+        return base.name, base.latitude, base.longitude, pos
+    
+    async def search_nearby(self, params) -> str:
+        """기준 위치 주변 맛집 (반경 / 가까운 순)"""
+        snapshot = self.snapshot
+        index = snapshot.index
+        
+        # 기준 위치: 좌표 → 역/랜드마크 → 맛집
+        if not params.near and (params.latitude is None or params.longitude is None):
+            return "기준 위치(near 또는 latitude/longitude)를 지정해 주세요."
+        located = self._locate_point(snapshot, params.near, params.latitude, params.longitude)
+        if isinstance(located, str):
+            return located
+        label, lat, lon, exclude = located
+        
+        filters = self._search_filters(index, params)
+        if params.query:
+            filters.append(snapshot.fulltext.scores(params.query) > 0)
+        mask = index.combine(filters)
+        if exclude is not None:
+            # 기준 맛집 자신은 제외 (combine 결과가 열 배열 자체일 수 있으므로 복사)
+            mask = np.ones(len(snapshot.restaurants), dtype=bool) if mask is None else mask.copy()
+            mask[exclude] = False
+        
+        # 위경도 격자 색인 (로드 시 구축됨)
+        if params.radius_km is not None:
+            positions, distances = snapshot.geo.within(
+                lat, lon, params.radius_km * 1000, mask, params.limit
+            )
+            scope = f"반경 {params.radius_km:g}km"
+            if not len(positions):
+                return f"'{label}' {scope} 안에 조건에 맞는 맛집이 없습니다."
+        else:
+            positions, distances = snapshot.geo.nearest(lat, lon, params.limit, mask)
+            scope = "가까운 순"
+            if not len(positions):
+                return "조건에 맞는 맛집을 찾지 못했습니다."
+        
+        output = f"## '{label}' 주변 맛집 ({scope}, {len(positions)}곳)\n\n"
+        for rank, (p, distance) in enumerate(zip(positions.tolist(), distances.tolist()), 1):
+            r = snapshot.restaurants[p]
+            tier_badge = "⭐" if r.tier == 1 else ""
+            output += f"### {rank}. {r.name} {tier_badge}\n"
+            output += f"- 거리: {_format_distance(distance)}\n"
+            output += f"- 위치: {r.address}\n"
+            output += f"- 계보: {r.lineage.value}\n"
+            output += f"- 가격: {r.naengmyeon_price:,}원\n"
+            if r.rating_score:
+                output += f"- 평점: {r.rating_score}\n"
+            output += "\n"
+        
+        return output
+    
+    async def plan_crawl(self, params) -> str:
+        """여러 곳 냉면 투어 계획 (웨이팅/영업시간/이동 거리 반영)"""
+        snapshot = self.snapshot
+        index = snapshot.index
+        try:
+            when = parse_open_at(params.start_time, holidays=snapshot.holidays)
+        except ValueError:
+            return UNKNOWN_OPEN_AT.format(params.start_time)
+        
+        # 출발 위치 (생략하면 첫 맛집에서 시작)
+        origin, label = None, None
+        if params.near or (params.latitude is not None and params.longitude is not None):
+            located = self._locate_point(snapshot, params.near, params.latitude, params.longitude)
+            if isinstance(located, str):
+                return located
+            label, lat, lon, _ = located
+            origin = (lat, lon)
+        
+        # 후보: 지정한 맛집 또는 검색 필터
+        filters = self._search_filters(index, params)
+        if params.restaurants:
+            chosen = np.zeros(len(snapshot.restaurants), dtype=bool)
+            missing = []
+            for query in params.restaurants:
+                pos = snapshot.resolver.locate(query)
+                if pos is None:
+                    missing.append(query)
+                else:
+                    chosen[pos] = True
+            if missing:
+                return not_found_many(snapshot.resolver, missing)
+            filters.append(chosen)
+        
+        plan = plan_crawl(
+            index.columns, index.combine(filters), origin, when, params.stops, params.meal_minutes
+        )
+        if not plan.stops:
+            return "출발 시각 이후 영업하는 조건에 맞는 맛집을 찾지 못했습니다."
+        
+        start = plan.start
+        output = (
+            f"## 평양냉면 투어 ({len(plan.stops)}곳, "
+            f"{_clock(start, start)} 출발 → {_clock(plan.finish, start)} 종료)\n\n"
+        )
+        output += f"_출발: {label or '첫 맛집'} · {when.label()}_\n\n"
+        if len(plan.stops) < params.stops:
+            output += f"_조건과 영업시간에 맞는 곳이 부족해 {len(plan.stops)}곳만 계획했습니다."
+            if params.restaurants:
+                planned = {stop.position for stop in plan.stops}
+                skipped = [
+                    snapshot.restaurants[pos].name
+                    for pos in np.flatnonzero(chosen).tolist() if pos not in planned
+                ]
+                output += f" (제외: {', '.join(skipped)})"
+            output += "_\n\n"
+        for rank, stop in enumerate(plan.stops, 1):
+            r = snapshot.restaurants[stop.position]
+            tier_badge = "⭐" if r.tier == 1 else ""
+            output += f"### {rank}. {r.name} {tier_badge}\n"
+            if rank > 1 or origin is not None:
+                output += (
+                    f"- 이동: {_format_distance(stop.distance)} (약 {stop.travel:.0f}분), "
+                    f"{_clock(stop.arrive, start)} 도착\n"
+                )
+            seat = f"- 착석: {_clock(stop.seat, start)} (웨이팅 약 {stop.wait}분"
+            if stop.idle >= 1:
+                seat += f", 영업 시작까지 {stop.idle:.0f}분"
+            output += seat + f") → {_clock(stop.leave, start)} 출발\n"
+            output += f"- 위치: {r.address}\n"
+            output += f"- 계보: {r.lineage.value} · 가격: {r.naengmyeon_price:,}원"
+            if r.rating_score:
+                output += f" · 평점: {r.rating_score}"
+            output += "\n\n"
+        
+        travel = sum(s.distance for s in plan.stops)
+        waiting = sum(s.wait + s.idle for s in plan.stops)
+        output += (
+            f"총 이동 {_format_distance(travel)} · 대기 {waiting:.0f}분 · "
+            f"소요 {(plan.finish - start) / 60:.1f}시간\n"
+        )
+        return output
+    
     async def get_eating_guide(self, params) -> str:
         """먹는 법 가이드"""
         if not self.eating_guides:
@@ -414,11 +623,7 @@ class DataProvider:
         # 특정 맛집용 가이드
         restaurant_note = ""
         if params.restaurant_id:
-            try:
-                target_id = int(params.restaurant_id)
-            except ValueError:
-                target_id = params.restaurant_id
-            restaurant = next((r for r in self.restaurants if r.id == target_id or params.restaurant_id in r.name), None)
+            restaurant = self.resolver.resolve(params.restaurant_id)
             if restaurant:
                 restaurant_note = f"\n\n## {restaurant.name} 특화 팁\n"
                 if restaurant.special_notes:
@@ -466,6 +671,34 @@ class DataProvider:
         
         return output
     
+    @staticmethod
+    def _side_course(snapshot: CatalogSnapshot, pos: int, restaurant: Restaurant, params) -> str:
+        """예산 맞춤 구성 (냉면 인원수 + 사이드 배낭 최적화)"""
+        party = params.party_size
+        budget = params.budget * party
+        output = f"## 1인 {params.budget:,}원 × {party}명 추천 구성\n\n"
+        course = optimize_sides(
+            snapshot.index.columns.side_menus, pos, restaurant.naengmyeon_price, party, budget
+        )
+        if course is None:
+            return output + (
+                f"예산 {budget:,}원으로는 냉면 {party}그릇"
+                f"({restaurant.naengmyeon_price * party:,}원)도 주문할 수 없습니다.\n"
+            )
+        
+        output += f"- 냉면 × {party}: {course.naengmyeon:,}원\n"
+        for i, count in course.sides:
+            menu = restaurant.side_menus[i]
+            sig = " ⭐" if menu.is_signature else ""
+            output += f"- {menu.name}{sig} × {count}: {menu.price * count:,}원\n"
+        if not course.sides:
+            output += "- 남는 예산으로 주문할 수 있는 사이드가 없습니다\n"
+        output += (
+            f"\n**합계 {course.total:,}원** (1인 {course.total // party:,}원, "
+            f"남는 예산 {budget - course.total:,}원)\n"
+        )
+        return output
+    
     async def get_side_pairings(self, params) -> str:
         """사이드 메뉴 추천"""
         if not self.side_menus:
@@ -475,13 +708,11 @@ class DataProvider:
         
         # 특정 맛집의 사이드 메뉴
         if params.restaurant_id:
-            try:
-                target_id = int(params.restaurant_id)
-            except ValueError:
-                target_id = params.restaurant_id
-            restaurant = next((r for r in self.restaurants if r.id == target_id or params.restaurant_id in r.name), None)
+            snapshot = self.snapshot
+            pos = snapshot.resolver.locate(params.restaurant_id)
+            restaurant = snapshot.restaurants[pos] if pos is not None else None
             
-            if restaurant and restaurant.side_menus:
+            if pos is not None and restaurant and restaurant.side_menus:
                 output += f"# {restaurant.name} 사이드 메뉴\n\n"
                 for menu in restaurant.side_menus:
                     sig = "⭐ 시그니처" if menu.is_signature else ""
@@ -490,6 +721,8 @@ class DataProvider:
                     if menu.pairing_note:
                         output += f"- 페어링 팁: {menu.pairing_note}\n"
                     output += "\n"
+                if params.budget:
+                    output += self._side_course(snapshot, pos, restaurant, params)
                 return output
         
         # 일반 사이드 메뉴 가이드
@@ -506,24 +739,17 @@ class DataProvider:
                 output += f"- 추천 맛집: {', '.join(dish['best_restaurants'])}\n"
             output += f"- 추천 상황: {dish['recommended_situations']}\n\n"
         
-        # 예산에 맞는 코스 추천
+        # 예산에 맞는 코스 추천 (코스 예산은 로드 시 해석됨, 1인당으로 비교)
         if params.budget:
-            output += f"\n## 예산 {params.budget:,}원 추천 코스\n"
-            courses = self.side_menus.get("course_examples", [])
-            for course in courses:
-                # 예산 파싱 (간단히)
-                budget_str = course.get("budget", "")
-                try:
-                    max_budget = int("".join(filter(str.isdigit, budget_str.split("~")[-1])))
-                except (ValueError, IndexError):
-                    max_budget = 100000
-                
-                if max_budget <= params.budget:
-                    output += f"\n### {course['name']}\n"
-                    output += f"- 예산: {course['budget']}\n"
-                    output += f"- 구성: {', '.join(course['dishes'])}\n"
-                    output += f"- 순서: {course['serving_order']}\n"
-                    output += f"- 팁: {course['tips']}\n"
+            output += f"\n## 1인 예산 {params.budget:,}원 추천 코스\n"
+            for course in self.snapshot.courses:
+                if course.per_person <= params.budget:
+                    data = course.data
+                    output += f"\n### {data['name']}\n"
+                    output += f"- 예산: {data['budget']} (1인 약 {course.per_person:,}원)\n"
+                    output += f"- 구성: {', '.join(data['dishes'])}\n"
+                    output += f"- 순서: {data['serving_order']}\n"
+                    output += f"- 팁: {data['tips']}\n"
         
         # 주류 포함 추천
         if params.include_alcohol:
@@ -535,10 +761,10 @@ class DataProvider:
         return output
 
 
-def create_server() -> Server:
-    """MCP 서버 생성"""
+def create_server(data_provider: DataProvider | None = None) -> Server:
+    """MCP 서버 생성 (공유 스냅샷 사용, 세션당 데이터 로드 없음)"""
     server = Server("pyongyang-naengmyeon")
-    data_provider = DataProvider()
+    data_provider = data_provider or DataProvider()
     register_tools(server, data_provider)
     return server
 
@@ -0,0 +1,185 @@
+"""Streamable HTTP 세션 수명 관리
+
+DELETE 없이 연결을 끊은 클라이언트의 transport / Server / run_session 태스크가
+영구히 남지 않도록 다음을 관리한다.
+
+- 마지막 활동 시각 추적 + 유휴 TTL 만료 (백그라운드 스위퍼)
+- 최대 세션 수 제한 (초과 시 가장 오래 사용하지 않은 세션부터 퇴출)
+- 활성/생성/퇴출/만료/종료 세션 지표
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+from mcp.server import Server
+from mcp.server.streamable_http import StreamableHTTPServerTransport
+
+logger = logging.getLogger(__name__)
+
+# 기본 설정 (환경변수로 조정)
+SESSION_IDLE_TTL = float(os.environ.get("NAENGMYEON_SESSION_IDLE_TTL", "1800"))
+MAX_SESSIONS = int(os.environ.get("NAENGMYEON_MAX_SESSIONS", "1000"))
+
+
+@dataclass
+class StreamableSession:
+    """Streamable HTTP 세션"""
+
+    transport: StreamableHTTPServerTransport
+    server: Server
+    task: asyncio.Task[None] | None = None
+    ready: asyncio.Event | None = None
+    created_at: float = field(default_factory=time.monotonic)
+    last_active: float = field(default_factory=time.monotonic)
+    in_flight: int = 0
+
+
+@dataclass
+class SessionStats:
+    """세션 지표"""
+
+    created: int = 0
+    evicted: int = 0
+    expired: int = 0
+    terminated: int = 0
+
+
+class SessionManager:
+    """Streamable HTTP 세션 저장소 (LRU 순서 유지)"""
+
+    def __init__(
+        self,
+        idle_ttl: float = SESSION_IDLE_TTL,
+        max_sessions: int = MAX_SESSIONS,
+        sweep_interval: float | None = None,
+    ):
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self.sweep_interval = sweep_interval or max(1.0, min(60.0, idle_ttl / 4))
+        self.stats = SessionStats()
+        self._sessions: OrderedDict[str, StreamableSession] = OrderedDict()
+        self._sweeper: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._sessions
+
+    def get(self, session_id: str | None) -> StreamableSession | None:
+        """세션 조회 (활동 시각 갱신)"""
+        if not session_id:
+            return None
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.last_active = time.monotonic()
+            self._sessions.move_to_end(session_id)
+        return session
+
+    async def add(self, session_id: str, session: StreamableSession) -> None:
+        """세션 등록 (최대 수 초과 시 LRU 퇴출)"""
+        self.ensure_sweeper()
+        self._sessions[session_id] = session
+        self.stats.created += 1
+        while len(self._sessions) > self.max_sessions:
+            victim_id = self._eviction_candidate(exclude=session_id)
+            if victim_id is None:
+                break
+            logger.info("세션 퇴출 (최대 %d개 초과): %s", self.max_sessions, victim_id)
+            await self._close(self._sessions.pop(victim_id))
+            self.stats.evicted += 1
+
+    def _eviction_candidate(self, exclude: str) -> str | None:
+        """퇴출 대상: 요청 처리 중이 아닌 가장 오래된 세션 (없으면 가장 오래된 세션)"""
+        fallback = None
+        for session_id, session in self._sessions.items():
+            if session_id == exclude:
+                continue
+            if session.in_flight == 0:
+                return session_id
+            fallback = fallback or session_id
+        return fallback
+
+    async def remove(self, session_id: str | None) -> bool:
+        """명시적 종료 (DELETE)"""
+        session = self._sessions.pop(session_id, None) if session_id else None
+        if session is None:
+            return False
+        await self._close(session)
+        self.stats.terminated += 1
+        return True
+
+    @contextlib.asynccontextmanager
+    async def activity(self, session: StreamableSession) -> AsyncIterator[None]:
+        """요청 처리 구간 표시 (처리 중인 세션은 만료시키지 않음)"""
+        session.in_flight += 1
+        try:
+            yield
+        finally:
+            session.in_flight -= 1
+            session.last_active = time.monotonic()
+
+    async def sweep(self) -> int:
+        """유휴 TTL 이 지난 세션 정리"""
+        deadline = time.monotonic() - self.idle_ttl
+        expired = [
+            session_id
+            for session_id, session in self._sessions.items()
+            if session.in_flight == 0 and session.last_active < deadline
+        ]
+        for session_id in expired:
+            session = self._sessions.pop(session_id, None)
+            if session is not None:
+                await self._close(session)
+                self.stats.expired += 1
+        if expired:
+            logger.info("유휴 세션 %d개 만료", len(expired))
+        return len(expired)
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.sweep()
+            except Exception:
+                logger.exception("세션 정리 실패")
+
+    def ensure_sweeper(self) -> None:
+        """스위퍼 태스크 시작 (이미 실행 중이면 무시)"""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep_loop())
+
+    async def close_all(self) -> None:
+        """스위퍼 중지 및 전체 세션 종료 (서버 종료 시)"""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweeper
+            self._sweeper = None
+        while self._sessions:
+            _, session = self._sessions.popitem(last=False)
+            await self._close(session)
+
+    @staticmethod
+    async def _close(session: StreamableSession) -> None:
+        await session.transport.terminate()
+        if session.task and not session.task.done():
+            session.task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await session.task
+
+    def snapshot_stats(self) -> dict[str, int]:
+        """지표 (헬스 체크/모니터링용)"""
+        return {
+            "active": len(self._sessions),
+            "created": self.stats.created,
+            "evicted": self.stats.evicted,
+            "expired": self.stats.expired,
+            "terminated": self.stats.terminated,
+        }
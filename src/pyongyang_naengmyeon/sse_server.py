@@ -1,40 +1,72 @@
 """평양냉면 MCP 서버 (SSE + Streamable HTTP 지원)"""
 
+import argparse
 import asyncio
+import contextlib
+import hmac
 import json
+import logging
 import os
+import signal
 import uuid
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
 from typing import Any
 
 from mcp.server import Server
 from mcp.server.sse import SseServerTransport
 from mcp.server.streamable_http import StreamableHTTPServerTransport
+from starlette.types import Message, Receive, Scope, Send
 
+from .catalog import shared_store
+from .catalog.store import WATCH_DATA
+from .metrics import Gauge, MetricFamily, metrics
 from .server import create_server
+from .sessions import SessionManager, StreamableSession
+from .tools.response_cache import response_cache
+from .workers import serve_prefork
 
-# 타입 정의
-Scope = dict[str, Any]
-Receive = Callable[[], Awaitable[dict[str, Any]]]
-Send = Callable[[dict[str, Any]], Awaitable[None]]
+logger = logging.getLogger(__name__)
 
 # SSE Transport 설정 (하위 호환성 유지)
 sse = SseServerTransport("/messages/")
 
 
-@dataclass
-class StreamableSession:
-    """Streamable HTTP 세션"""
+# Streamable HTTP Transport 세션 저장소 (유휴 TTL / 최대 세션 수 관리)
+session_manager = SessionManager()
 
-    transport: StreamableHTTPServerTransport
-    server: Server
-    task: asyncio.Task[None] | None = None
-    ready: asyncio.Event | None = None
+# Stateless 모드: /mcp 요청마다 공유 서버로 처리 (세션 없음, 어느 인스턴스로 가도 됨)
+STATELESS_HTTP = os.environ.get("NAENGMYEON_STATELESS_HTTP", "") == "1"
+_shared_server: Server | None = None
 
+# SSE 는 연결이 한 프로세스에 묶이므로 멀티 워커 모드에서는 비활성화
+SSE_ENABLED = True
 
-# Streamable HTTP Transport 세션 저장소
-streamable_sessions: dict[str, StreamableSession] = {}
+# 멀티 워커(pre-fork) 모드 여부 (관리 API 리로드를 부모에게 넘김)
+PREFORK = False
+
+# POST /admin/reload 인증 토큰 (미설정 시 엔드포인트 비활성화)
+ADMIN_TOKEN = os.environ.get("NAENGMYEON_ADMIN_TOKEN", "")
+
+
+def get_shared_server() -> Server:
+    """stateless 요청이 공유하는 서버 (프로세스당 1개)"""
+    global _shared_server
+    if _shared_server is None:
+        _shared_server = create_server()
+    return _shared_server
+
+
+async def _send_text_response(
+    send: Send, body: str, content_type: bytes, status: int = 200
+) -> None:
+    """텍스트 응답 전송 헬퍼"""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [[b"content-type", content_type]],
+        }
+    )
+    await send({"type": "http.response.body", "body": body.encode()})
 
 
 async def _send_json_response(send: Send, body: dict[str, Any], status: int = 200) -> None:
@@ -55,8 +87,142 @@ async def _send_json_response(send: Send, body: dict[str, Any], status: int = 20
     )
 
 
+async def _read_body(receive: Receive) -> bytes:
+    """요청 본문 전체 읽기"""
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay_body(body: bytes) -> Receive:
+    """이미 읽은 본문을 다시 전달하는 receive"""
+    sent = False
+
+    async def receive() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return {"type": "http.disconnect"}
+
+    return receive
+
+
+def _is_initialize_request(body: bytes) -> bool:
+    """JSON-RPC initialize 요청 여부 (배치 포함)"""
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return False
+    messages = payload if isinstance(payload, list) else [payload]
+    return any(isinstance(m, dict) and m.get("method") == "initialize" for m in messages)
+
+
+async def _wait_ready(session: StreamableSession) -> bool:
+    """세션 서버 준비 대기 (준비 전에 세션 태스크가 끝나면 False)"""
+    if session.ready is None or session.ready.is_set():
+        return True
+    if session.task is None:
+        await session.ready.wait()
+        return True
+    waiter = asyncio.ensure_future(session.ready.wait())
+    try:
+        await asyncio.wait({waiter, session.task}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        waiter.cancel()
+    if session.ready.is_set():
+        return True
+    if not session.task.cancelled() and session.task.exception() is not None:
+        logger.error("세션 시작 실패", exc_info=session.task.exception())
+    return False
+
+
+async def _serve_new_session(scope: Scope, receive: Receive, send: Send) -> None:
+    """새 세션 생성 후 첫 요청 처리
+
+    세션은 첫 요청을 처리하기 전에 등록된다. 클라이언트가 응답의
+    mcp-session-id 로 다음 요청을 바로 보내도 같은 세션을 찾고, 준비가 끝날
+    때까지 ready 이벤트에서 기다리므로 서버가 중복 생성되지 않는다.
+    준비 전에 세션 태스크가 실패하면 세션을 제거하고 500 으로 응답한다.
+    """
+    new_session_id = str(uuid.uuid4())
+    transport = StreamableHTTPServerTransport(
+        mcp_session_id=new_session_id,
+        is_json_response_enabled=True,
+    )
+    server = create_server()
+    ready_event = asyncio.Event()
+    session = StreamableSession(transport=transport, server=server, ready=ready_event)
+
+    async def run_session() -> None:
+        """세션에서 서버 실행"""
+        async with transport.connect() as streams:
+            ready_event.set()
+            await server.run(streams[0], streams[1], server.create_initialization_options())
+
+    async with session_manager.activity(session):
+        # 백그라운드 태스크 시작 후 세션 등록 (요청 처리 전)
+        session.task = asyncio.create_task(run_session())
+        await session_manager.add(new_session_id, session)
+
+        # 연결 준비 대기 (준비 전에 실패하면 세션 제거)
+        if not await _wait_ready(session):
+            await session_manager.remove(new_session_id)
+            await _send_json_response(send, {"error": "Session failed to start"}, 500)
+            return
+
+        # 요청 처리
+        await transport.handle_request(scope, receive, send)
+
+
+async def stateless_http_handler(scope: Scope, receive: Receive, send: Send) -> None:
+    """Stateless Streamable HTTP ASGI 핸들러
+
+    요청마다 임시 transport 를 만들어 공유 서버로 처리하고 바로 종료한다.
+    모든 도구가 정적 데이터 조회이므로 세션 상태가 필요 없다.
+    """
+    if scope.get("method", "GET") != "POST":
+        await _send_json_response(send, {"error": "Method not allowed"}, 405)
+        return
+
+    transport = StreamableHTTPServerTransport(
+        mcp_session_id=None,
+        is_json_response_enabled=True,
+    )
+    server = get_shared_server()
+    ready_event = asyncio.Event()
+
+    async def run_stateless() -> None:
+        async with transport.connect() as streams:
+            ready_event.set()
+            await server.run(
+                streams[0], streams[1], server.create_initialization_options(), stateless=True
+            )
+
+    task = asyncio.create_task(run_stateless())
+    try:
+        await ready_event.wait()
+        await transport.handle_request(scope, receive, send)
+    finally:
+        await transport.terminate()
+        if not task.done():
+            task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
 async def streamable_http_handler(scope: Scope, receive: Receive, send: Send) -> None:
     """Streamable HTTP ASGI 핸들러 (MCP 2025-03-26 스펙)"""
+    if STATELESS_HTTP:
+        await stateless_http_handler(scope, receive, send)
+        return
+
     # 세션 ID 확인
     headers = dict(scope.get("headers", []))
     session_id = headers.get(b"mcp-session-id", b"").decode() or None
@@ -64,66 +230,43 @@ async def streamable_http_handler(scope: Scope, receive: Receive, send: Send) ->
 
     if method == "POST":
         # 기존 세션이 있으면 사용
-        if session_id and session_id in streamable_sessions:
-            session = streamable_sessions[session_id]
-            if session.ready:
-                await session.ready.wait()
-            await session.transport.handle_request(scope, receive, send)
+        session = session_manager.get(session_id)
+        if session is not None:
+            if not await _wait_ready(session):
+                await _send_json_response(send, {"error": "Session failed to start"}, 500)
+                return
+            async with session_manager.activity(session):
+                await session.transport.handle_request(scope, receive, send)
             return
 
-        # 새 세션 생성
-        new_session_id = str(uuid.uuid4())
-        transport = StreamableHTTPServerTransport(
-            mcp_session_id=new_session_id,
-            is_json_response_enabled=True,
-        )
-        server = create_server()
-        ready_event = asyncio.Event()
-
-        async def run_session() -> None:
-            """세션에서 서버 실행"""
-            async with transport.connect() as streams:
-                ready_event.set()
-                await server.run(streams[0], streams[1], server.create_initialization_options())
-
-        # 백그라운드 태스크 시작
-        task = asyncio.create_task(run_session())
-
-        # 연결이 준비될 때까지 대기
-        await ready_event.wait()
+        # 알 수 없는(만료/퇴출된) 세션 ID: 새 세션을 만들지 않고 404
+        if session_id:
+            await _send_json_response(send, {"error": "Session not found"}, 404)
+            return
 
-        # 요청 처리
-        await transport.handle_request(scope, receive, send)
+        # 세션 ID 없이는 initialize 요청만 새 세션을 만든다
+        body = await _read_body(receive)
+        if not _is_initialize_request(body):
+            await _send_json_response(send, {"error": "Missing session ID"}, 400)
+            return
 
-        # 세션 저장
-        streamable_sessions[new_session_id] = StreamableSession(
-            transport=transport,
-            server=server,
-            task=task,
-            ready=ready_event,
-        )
+        await _serve_new_session(scope, _replay_body(body), send)
         return
 
     elif method == "GET":
-        if session_id and session_id in streamable_sessions:
-            session = streamable_sessions[session_id]
-            if session.ready:
-                await session.ready.wait()
-            await session.transport.handle_request(scope, receive, send)
+        session = session_manager.get(session_id)
+        if session is not None:
+            if not await _wait_ready(session):
+                await _send_json_response(send, {"error": "Session failed to start"}, 500)
+                return
+            async with session_manager.activity(session):
+                await session.transport.handle_request(scope, receive, send)
             return
         await _send_json_response(send, {"error": "Session not found"}, 404)
         return
 
     elif method == "DELETE":
-        if session_id and session_id in streamable_sessions:
-            session = streamable_sessions.pop(session_id)
-            session.transport.terminate()
-            if session.task and not session.task.done():
-                session.task.cancel()
-                try:
-                    await session.task
-                except asyncio.CancelledError:
-                    pass
+        if await session_manager.remove(session_id):
             await _send_json_response(send, {"status": "session terminated"}, 200)
             return
         await _send_json_response(send, {"error": "Session not found"}, 404)
@@ -139,16 +282,168 @@ async def health_check_handler(scope: Scope, receive: Receive, send: Send) -> No
         {
             "status": "ok",
             "service": "pyongyang-naengmyeon-mcp",
-            "transports": ["sse", "streamable-http"],
+            "transports": ["sse", "streamable-http"] if SSE_ENABLED else ["streamable-http"],
+            "streamable_http_mode": "stateless" if STATELESS_HTTP else "stateful",
+            "sessions": session_manager.snapshot_stats(),
+            "catalog": shared_store.stats(),
+            "response_cache": response_cache.snapshot_stats(),
         },
     )
 
 
+# 연결 중인 SSE 스트림 수
+sse_connections = Gauge()
+
+
+def _collect_server_metrics() -> list[MetricFamily]:
+    """세션/캐시/카탈로그 지표 (스크레이프 시점 값)"""
+    families = [
+        MetricFamily.single(
+            "sse_connections", "gauge", "연결 중인 SSE 스트림 수", sse_connections.value
+        ),
+    ]
+    sessions = session_manager.snapshot_stats()
+    families.append(
+        MetricFamily.single(
+            "streamable_sessions", "gauge", "활성 Streamable HTTP 세션 수", sessions["active"]
+        )
+    )
+    families.append(
+        MetricFamily.labeled(
+            "streamable_session_events_total",
+            "counter",
+            "Streamable HTTP 세션 생성/퇴출/만료/종료 수",
+            (({"event": k}, v) for k, v in sessions.items() if k != "active"),
+        )
+    )
+
+    cache = response_cache.snapshot_stats()
+    families.append(
+        MetricFamily.single(
+            "response_cache_entries", "gauge", "응답 캐시 항목 수", cache["entries"]
+        )
+    )
+    families.append(
+        MetricFamily.labeled(
+            "response_cache_events_total",
+            "counter",
+            "응답 캐시 적중/미스/대기 합류/퇴출/만료 수",
+            (
+                ({"event": k}, cache[k])
+                for k in ("hits", "misses", "coalesced", "evictions", "expirations")
+            ),
+        )
+    )
+
+    snapshot = shared_store.current
+    render_caches = {"detail": snapshot.detail_pages, "compare": snapshot.compare_sections}
+    families += [
+        MetricFamily.labeled(
+            "render_cache_events_total",
+            "counter",
+            "현재 스냅샷 렌더 캐시 적중/미스 수 (리로드 시 초기화)",
+            (
+                ({"cache": name, "event": event}, getattr(render_cache, event))
+                for name, render_cache in render_caches.items()
+                for event in ("hits", "misses")
+            ),
+        ),
+        MetricFamily.single(
+            "catalog_info",
+            "gauge",
+            "카탈로그 데이터 버전",
+            1,
+            {"version": snapshot.version, "compiled": str(snapshot.compiled).lower()},
+        ),
+        MetricFamily.single(
+            "catalog_restaurants", "gauge", "카탈로그 맛집 수", len(snapshot.restaurants)
+        ),
+        MetricFamily.single(
+            "catalog_load_seconds", "gauge", "현재 스냅샷 로드 시간 (초)", snapshot.load_seconds
+        ),
+        MetricFamily.single(
+            "catalog_reloads_total", "counter", "카탈로그 리로드 수", shared_store.reloads
+        ),
+        MetricFamily.single(
+            "catalog_reload_failures_total",
+            "counter",
+            "카탈로그 리로드 실패 수",
+            shared_store.reload_failures,
+        ),
+    ]
+    return families
+
+
+metrics.add_collector(_collect_server_metrics)
+
+
+async def metrics_handler(scope: Scope, receive: Receive, send: Send) -> None:
+    """Prometheus 지표 ASGI 핸들러"""
+    await _send_text_response(send, metrics.render(), b"text/plain; version=0.0.4; charset=utf-8")
+
+
+def _bearer_token(scope: Scope) -> str:
+    for name, value in scope.get("headers", []):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            return token.strip() if scheme.lower() == "bearer" else ""
+    return ""
+
+
+async def admin_reload_handler(scope: Scope, receive: Receive, send: Send) -> None:
+    """카탈로그 리로드 ASGI 핸들러 (POST /admin/reload)"""
+    if not ADMIN_TOKEN:
+        await _send_json_response(send, {"error": "Not found"}, 404)
+        return
+    if not hmac.compare_digest(_bearer_token(scope).encode(), ADMIN_TOKEN.encode()):
+        await _send_json_response(send, {"error": "Unauthorized"}, 401)
+        return
+    if scope.get("method") != "POST":
+        await _send_json_response(send, {"error": "Method not allowed"}, 405)
+        return
+
+    if PREFORK:
+        # 이 워커만 리로드하면 워커마다 데이터가 달라지므로 부모에게 SIGHUP 을 보내
+        # 부모(이후 fork 할 워커용)와 모든 워커가 함께 리로드하게 한다 (비동기)
+        os.kill(os.getppid(), signal.SIGHUP)
+        await _send_json_response(
+            send, {"forwarded": True, "version": shared_store.current.version}, 202
+        )
+        return
+
+    result = await shared_store.reload()
+    body = {
+        "changed": result.changed,
+        "version": result.version,
+        "load_seconds": round(result.seconds, 4),
+    }
+    if result.error:
+        # 이전 스냅샷으로 계속 서비스 중
+        await _send_json_response(send, {**body, "error": result.error}, 500)
+        return
+    await _send_json_response(send, body)
+
+
+async def _send_sse_disabled(send: Send) -> None:
+    await _send_json_response(
+        send,
+        {"error": "SSE transport is disabled in multi-worker mode; use /mcp (Streamable HTTP)"},
+        503,
+    )
+
+
 async def sse_handler(scope: Scope, receive: Receive, send: Send) -> None:
     """SSE ASGI 핸들러"""
+    if not SSE_ENABLED:
+        await _send_sse_disabled(send)
+        return
     server = create_server()
-    async with sse.connect_sse(scope, receive, send) as streams:
-        await server.run(streams[0], streams[1], server.create_initialization_options())
+    sse_connections.inc()
+    try:
+        async with sse.connect_sse(scope, receive, send) as streams:
+            await server.run(streams[0], streams[1], server.create_initialization_options())
+    finally:
+        sse_connections.dec()
 
 
 class MCPApp:
@@ -158,6 +453,9 @@ class MCPApp:
         self.sse_message_handler = sse.handle_post_message
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
         if scope["type"] != "http":
             return
 
@@ -168,20 +466,99 @@ class MCPApp:
             await health_check_handler(scope, receive, send)
         elif path == "/mcp":
             await streamable_http_handler(scope, receive, send)
+        elif path == "/metrics":
+            await metrics_handler(scope, receive, send)
+        elif path == "/admin/reload":
+            await admin_reload_handler(scope, receive, send)
         elif path == "/sse":
             await sse_handler(scope, receive, send)
         elif path.startswith("/messages"):
+            if not SSE_ENABLED:
+                await _send_sse_disabled(send)
+                return
             await self.sse_message_handler(scope, receive, send)
         else:
             await _send_json_response(send, {"error": "Not found"}, 404)
 
+    async def lifespan(self, receive: Receive, send: Send) -> None:
+        """ASGI lifespan: 세션 스위퍼·리로드 트리거 시작 / 종료 시 정리"""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                session_manager.ensure_sweeper()
+                _install_reload_signal()
+                if WATCH_DATA:
+                    shared_store.ensure_watcher()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await shared_store.stop_watcher()
+                await session_manager.close_all()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+_reload_tasks: set[asyncio.Task[Any]] = set()
+
+
+def _install_reload_signal() -> None:
+    """SIGHUP → 카탈로그 리로드 (메인 스레드의 유닉스 이벤트 루프에서만)"""
+    if not hasattr(signal, "SIGHUP"):
+        return
+    loop = asyncio.get_running_loop()
+
+    def on_sighup() -> None:
+        logger.info("SIGHUP 수신, 카탈로그 리로드")
+        task = loop.create_task(shared_store.reload())
+        _reload_tasks.add(task)
+        task.add_done_callback(_reload_tasks.discard)
+
+    with contextlib.suppress(NotImplementedError, RuntimeError, ValueError):
+        loop.add_signal_handler(signal.SIGHUP, on_sighup)
+
 
 # ASGI 앱 생성
 app = MCPApp()
 
 
-if __name__ == "__main__":
+def _preload() -> None:
+    """fork 전 사전 로드 (카탈로그 스냅샷 + 이름 색인 + stateless 공유 서버)"""
+    shared_store.current.resolver.warm()
+    get_shared_server()
+
+
+def main() -> None:
+    """HTTP 서버 실행 (SSE + Streamable HTTP)"""
+    global STATELESS_HTTP, SSE_ENABLED, PREFORK
+
+    parser = argparse.ArgumentParser(description="평양냉면 MCP HTTP 서버")
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8000)))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", 1)),
+        help="워커 프로세스 수 (2 이상이면 pre-fork 모드: /mcp stateless 강제, SSE 비활성화)",
+    )
+    args = parser.parse_args()
+
+    if args.workers > 1:
+        STATELESS_HTTP = True
+        SSE_ENABLED = False
+        PREFORK = True
+        serve_prefork(
+            app,
+            args.host,
+            args.port,
+            args.workers,
+            preload=_preload,
+            reload=shared_store.reload_sync,
+        )
+        return
+
     import uvicorn
 
-    port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)  # type: ignore[arg-type]
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,14 @@
 """평양냉면 MCP 도구"""
 
-from .definitions import TOOLS, register_tools
+from .definitions import REGISTRY, TOOLS, ToolSpec, register_tools, run_tool
+from .response_cache import ResponseCache, response_cache
 
-__all__ = ["TOOLS", "register_tools"]
+__all__ = [
+    "REGISTRY",
+    "TOOLS",
+    "ResponseCache",
+    "ToolSpec",
+    "register_tools",
+    "response_cache",
+    "run_tool",
+]
@@ -1,14 +1,25 @@
 """평양냉면 MCP 서버 도구 정의"""
 
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
 from mcp.server import Server
-from mcp.types import Tool, TextContent
-from pydantic import BaseModel, Field
-from typing import Optional
+from mcp.types import CallToolResult, ListToolsResult, TextContent, Tool
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
-from ..models import (
-    Region, Lineage, ExperienceLevel, BrothPreference, 
-    VisitSituation
-)
+from ..catalog.hours import pin_clock
+from ..metrics import metrics
+from ..models import BrothPreference, ExperienceLevel, Lineage, Region, VisitSituation
+from .response_cache import cache_key, response_cache
+
+if TYPE_CHECKING:
+    from ..server import DataProvider
+
+logger = logging.getLogger(__name__)
 
 
 # ============================================================
@@ -27,12 +38,23 @@ class SearchRestaurantsInput(BaseModel):
     has_slush_ice: Optional[bool] = Field(default=None, description="살얼음 육수 맛집만")
     tier: Optional[int] = Field(default=None, description="등급 필터 (1=최상위, 2=우수)")
     query: Optional[str] = Field(default=None, description="자연어 검색")
+    open_at: Optional[str] = Field(
+        default=None,
+        description=(
+            "이 시각에 영업 중인 곳만 (한국 시간): "
+            "now, 2026-05-01T12:30, 12:30(오늘), 토 12:30(요일)"
+        ),
+    )
+    limit: int = Field(default=20, ge=1, le=100, description="페이지당 결과 수")
+    cursor: Optional[str] = Field(
+        default=None, description="다음 페이지 커서 (이전 응답의 next_cursor)"
+    )
 
 
 class GetRestaurantInput(BaseModel):
     """맛집 상세 조회 입력"""
     id: Optional[str] = Field(default=None, description="맛집 ID")
-    name: Optional[str] = Field(default=None, description="맛집 이름")
+    name: Optional[str] = Field(default=None, description="맛집 이름 (오타, 초성 검색 허용)")
 
 
 class GetLineageInfoInput(BaseModel):
@@ -50,6 +72,13 @@ class RecommendInput(BaseModel):
     situation: Optional[VisitSituation] = Field(default=None, description="방문 상황")
     region: Optional[Region] = Field(default=None, description="선호 지역")
     avoid_long_wait: bool = Field(default=False, description="긴 웨이팅 회피")
+    open_at: Optional[str] = Field(
+        default=None,
+        description=(
+            "이 시각에 영업 중인 곳만 (한국 시간): "
+            "now, 2026-05-01T12:30, 12:30(오늘), 토 12:30(요일)"
+        ),
+    )
 
 
 class CompareInput(BaseModel):
@@ -57,11 +86,83 @@ class CompareInput(BaseModel):
     restaurant1: str = Field(description="첫 번째 맛집 (ID 또는 이름)")
     restaurant2: str = Field(description="두 번째 맛집 (ID 또는 이름)")
     focus_on: Optional[str] = Field(
-        default=None, 
-        description="비교 초점: broth, noodle, overall, value"
+        default=None,
+        description="비교 초점: broth, noodle, overall, value (쉼표로 여러 개, 생략 시 전체)"
     )
 
 
+class CompareManyInput(BaseModel):
+    """여러 맛집 비교 입력"""
+    restaurants: list[str] = Field(
+        min_length=2, max_length=10, description="비교할 맛집 목록 (ID, slug 또는 이름)"
+    )
+    focus_on: Optional[str] = Field(
+        default=None,
+        description="비교 초점: broth, noodle, overall, value (쉼표로 여러 개, 생략 시 전체)"
+    )
+
+
+class FindSimilarInput(BaseModel):
+    """비슷한 맛집 찾기 입력"""
+    restaurant: str = Field(description="기준 맛집 (ID, slug 또는 이름)")
+    region: Optional[Region] = Field(default=None, description="지역 필터")
+    max_price: Optional[int] = Field(default=None, description="최대 가격 (원)")
+    tier: Optional[int] = Field(default=None, description="등급 필터 (1=최상위, 2=우수)")
+    limit: int = Field(default=5, ge=1, le=20, description="결과 수")
+
+
+class SearchNearbyInput(BaseModel):
+    """주변 맛집 검색 입력"""
+    near: Optional[str] = Field(
+        default=None, description="기준 위치: 역/랜드마크 이름(예: 시청역) 또는 맛집 이름"
+    )
+    latitude: Optional[float] = Field(default=None, ge=-90, le=90, description="기준 위도")
+    longitude: Optional[float] = Field(default=None, ge=-180, le=180, description="기준 경도")
+    radius_km: Optional[float] = Field(
+        default=None, gt=0, le=50, description="검색 반경 (km, 생략하면 가까운 순으로 limit 곳)"
+    )
+    region: Optional[Region] = Field(default=None, description="지역 필터")
+    lineage: Optional[Lineage] = Field(default=None, description="계보 필터")
+    max_price: Optional[int] = Field(default=None, description="최대 가격 (원)")
+    experience_level: Optional[ExperienceLevel] = Field(
+        default=None, description="추천 대상 경험 수준"
+    )
+    michelin_only: bool = Field(default=False, description="미쉐린 선정 맛집만")
+    has_slush_ice: Optional[bool] = Field(default=None, description="살얼음 육수 맛집만")
+    tier: Optional[int] = Field(default=None, description="등급 필터 (1=최상위, 2=우수)")
+    query: Optional[str] = Field(default=None, description="자연어 검색")
+    limit: int = Field(default=5, ge=1, le=20, description="결과 수")
+
+
+class PlanCrawlInput(BaseModel):
+    """냉면 투어 계획 입력"""
+    restaurants: Optional[list[str]] = Field(
+        default=None, min_length=2, max_length=50,
+        description="후보 맛집 (ID, slug 또는 이름, 생략하면 필터에 맞는 전체 맛집)"
+    )
+    stops: int = Field(default=3, ge=2, le=8, description="방문할 곳 수")
+    start_time: str = Field(
+        default="now",
+        description="출발 시각 (한국 시간): now, 2026-05-01T11:00, 11:00(오늘), 토 11:00(요일)"
+    )
+    near: Optional[str] = Field(
+        default=None,
+        description="출발 위치: 역/랜드마크 또는 맛집 이름 (생략하면 첫 맛집에서 시작)",
+    )
+    latitude: Optional[float] = Field(default=None, ge=-90, le=90, description="출발 위도")
+    longitude: Optional[float] = Field(default=None, ge=-180, le=180, description="출발 경도")
+    meal_minutes: int = Field(default=40, ge=10, le=180, description="한 곳에서 머무는 시간 (분)")
+    region: Optional[Region] = Field(default=None, description="지역 필터")
+    lineage: Optional[Lineage] = Field(default=None, description="계보 필터")
+    max_price: Optional[int] = Field(default=None, description="최대 가격 (원)")
+    experience_level: Optional[ExperienceLevel] = Field(
+        default=None, description="추천 대상 경험 수준"
+    )
+    michelin_only: bool = Field(default=False, description="미쉐린 선정 맛집만")
+    has_slush_ice: Optional[bool] = Field(default=None, description="살얼음 육수 맛집만")
+    tier: Optional[int] = Field(default=None, description="등급 필터 (1=최상위, 2=우수)")
+
+
 class GetEatingGuideInput(BaseModel):
     """먹는 법 가이드 입력"""
     restaurant_id: Optional[str] = Field(default=None, description="특정 맛집용 가이드")
@@ -75,15 +176,131 @@ class GetSidePairingsInput(BaseModel):
     """사이드 메뉴 추천 입력"""
     restaurant_id: Optional[str] = Field(default=None, description="맛집 ID")
     budget: Optional[int] = Field(default=None, description="1인 예산 (원)")
+    party_size: int = Field(
+        default=2, ge=1, le=10, description="인원수 (맛집 지정 시 예산 맞춤 구성에 사용)"
+    )
     include_alcohol: bool = Field(default=False, description="주류 포함")
 
 
+class BatchCall(BaseModel):
+    """일괄 호출 항목"""
+    tool: str = Field(description="도구 이름 (batch 제외)")
+    arguments: dict[str, Any] = Field(default_factory=dict, description="도구 입력")
+
+
+class BatchInput(BaseModel):
+    """일괄 호출 입력"""
+    calls: list[BatchCall] = Field(min_length=1, max_length=20, description="호출 목록 (최대 20건)")
+
+
+# ============================================================
+# 도구 레지스트리
+# ============================================================
+
+Handler = Callable[["DataProvider", Any], Awaitable[str]]
+
+
+@dataclass(frozen=True, slots=True)
+class ToolSpec:
+    """도구 하나의 선언 (이름, 입력 모델, 핸들러, 설명)
+
+    handler 를 생략하면 같은 이름의 DataProvider 메서드를 호출한다.
+    입력 검증기(TypeAdapter)와 MCP Tool(JSON 스키마 포함)은 선언 시 한 번만 만든다.
+    cacheable 이면 응답을 (입력, 스냅샷 버전) 키로 응답 캐시에 저장한다.
+    clock_fields 의 상대 시각("now", "12:30")은 키를 만들 때 분 단위 날짜시각으로 고정해
+    시각이 지난 응답을 돌려주지 않는다 (핸들러에는 입력 그대로 전달).
+    """
+
+    name: str
+    input_model: type[BaseModel]
+    description: str
+    handler: Handler | None = None
+    cacheable: bool = True
+    clock_fields: tuple[str, ...] = ()
+    adapter: TypeAdapter[BaseModel] = field(init=False, repr=False)
+    tool: Tool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        adapter: TypeAdapter[BaseModel] = TypeAdapter(self.input_model)
+        object.__setattr__(self, "adapter", adapter)
+        object.__setattr__(
+            self,
+            "tool",
+            Tool(name=self.name, description=self.description, inputSchema=adapter.json_schema()),
+        )
+
+    async def _call(self, data_provider: "DataProvider", params: BaseModel) -> str:
+        if self.handler is not None:
+            return await self.handler(data_provider, params)
+        method: Callable[[BaseModel], Awaitable[str]] = getattr(data_provider, self.name)
+        return await method(params)
+
+    async def run(self, data_provider: "DataProvider", arguments: dict[str, Any]) -> str:
+        params = self.adapter.validate_python(arguments)
+        if not self.cacheable:
+            return await self._call(data_provider, params)
+        version = data_provider.snapshot.version
+        key_params = params
+        if pinned := {
+            name: pin_clock(value)
+            for name in self.clock_fields
+            if (value := getattr(params, name)) is not None
+        }:
+            key_params = params.model_copy(update=pinned)
+        return await response_cache.get_or_compute(
+            cache_key(self.name, version, key_params),
+            lambda: self._call(data_provider, params),
+            # 계산 중 리로드되면 새 데이터로 만든 응답일 수 있으므로 저장하지 않음
+            store=lambda: data_provider.snapshot.version == version,
+        )
+
+
+async def run_tool(data_provider: "DataProvider", name: str, arguments: dict[str, Any]) -> str:
+    """도구 하나 실행 (입력 검증 → 핸들러 호출)"""
+    spec = REGISTRY.get(name)
+    if spec is None:
+        return f"Unknown tool: {name}"
+    return await spec.run(data_provider, arguments)
+
+
+async def _run_batch_item(data_provider: "DataProvider", call: BatchCall) -> tuple[str, bool]:
+    """(결과, 성공 여부) — 항목 오류는 결과 문자열로 격리"""
+    if call.tool == "batch":
+        return "batch 안에서 batch 를 호출할 수 없습니다.", False
+    if call.tool not in REGISTRY:
+        return f"알 수 없는 도구입니다: {call.tool}", False
+    try:
+        return await run_tool(data_provider, call.tool, call.arguments), True
+    except ValidationError as e:
+        errors = "; ".join(
+            f"{'.'.join(map(str, err['loc'])) or '(입력)'}: {err['msg']}" for err in e.errors()
+        )
+        return f"입력 오류: {errors}", False
+    except Exception as e:
+        logger.exception("batch 항목 처리 실패: %s", call.tool)
+        return f"처리 중 오류가 발생했습니다: {e}", False
+
+
+async def run_batch(data_provider: "DataProvider", params: BatchInput) -> str:
+    """일괄 호출 (같은 스냅샷에서 동시 실행, 항목별 오류 격리)"""
+    pinned = data_provider.pinned()
+    results = await asyncio.gather(*(_run_batch_item(pinned, call) for call in params.calls))
+    failed = sum(not ok for _, ok in results)
+
+    output = f"# 일괄 호출 결과 ({len(results)}건"
+    output += f", 실패 {failed}건)\n\n" if failed else ")\n\n"
+    for i, (call, (result, ok)) in enumerate(zip(params.calls, results), 1):
+        status = "" if ok else " ❌"
+        output += f"---\n## [{i}] {call.tool}{status}\n\n{result.rstrip()}\n\n"
+    return output
+
+
 # ============================================================
 # 도구 정의
 # ============================================================
 
-TOOLS: list[Tool] = [
-    Tool(
+TOOL_SPECS: tuple[ToolSpec, ...] = (
+    ToolSpec(
         name="search_restaurants",
         description="""평양냉면 맛집을 다양한 조건으로 검색합니다.
 
@@ -95,11 +312,15 @@ TOOLS: list[Tool] = [
 - 최상위 등급만: tier=1
 - 자연어 검색: query="진한 육수 슴슴한"
 
-반환: 조건에 맞는 맛집 목록 (이름, 위치, 계보, 가격, 특징)""",
-        inputSchema=SearchRestaurantsInput.model_json_schema(),
+결과는 limit 건씩 페이지로 나뉩니다. 응답 끝의 next_cursor 값을
+같은 조건과 함께 cursor 로 넘기면 다음 페이지를 받습니다.
+
+반환: 전체 건수와 현재 페이지의 맛집 목록 (이름, 위치, 계보, 가격, 특징)""",
+        input_model=SearchRestaurantsInput,
+        clock_fields=("open_at",),
     ),
-    
-    Tool(
+
+    ToolSpec(
         name="get_restaurant",
         description="""특정 맛집의 상세 정보를 조회합니다.
 
@@ -111,10 +332,10 @@ TOOLS: list[Tool] = [
 - 인증 이력: 미쉐린, 블루리본, 방송 출연
 - 사이드 메뉴: 추천 메뉴와 페어링 팁
 - 방문 팁: 웨이팅, 주차, 특이사항""",
-        inputSchema=GetRestaurantInput.model_json_schema(),
+        input_model=GetRestaurantInput,
     ),
-    
-    Tool(
+
+    ToolSpec(
         name="get_lineage_info",
         description="""평양냉면 계보(파벌) 정보를 조회합니다.
 
@@ -125,10 +346,10 @@ TOOLS: list[Tool] = [
 - eulmildae: 을밀대식 (살얼음, 굵은 면)
 
 'all' 입력 시 전체 계보 비교 정보 제공""",
-        inputSchema=GetLineageInfoInput.model_json_schema(),
+        input_model=GetLineageInfoInput,
     ),
-    
-    Tool(
+
+    ToolSpec(
         name="recommend",
         description="""사용자 취향과 상황에 맞는 맛집을 추천합니다.
 
@@ -139,10 +360,11 @@ TOOLS: list[Tool] = [
 - 지역 및 웨이팅 허용 여부
 
 추천 근거와 함께 2-3곳 제안""",
-        inputSchema=RecommendInput.model_json_schema(),
+        input_model=RecommendInput,
+        clock_fields=("open_at",),
     ),
-    
-    Tool(
+
+    ToolSpec(
         name="compare",
         description="""두 맛집을 매니아 관점에서 비교 분석합니다.
 
@@ -153,11 +375,97 @@ TOOLS: list[Tool] = [
 - 가격 및 가성비
 - 분위기 및 웨이팅
 
-상황별 추천 (입문자 vs 매니아, 혼밥 vs 접대 등) 제공""",
-        inputSchema=CompareInput.model_json_schema(),
+상황별 추천 (입문자 vs 매니아, 혼밥 vs 접대 등) 제공
+
+focus_on 으로 필요한 섹션만 받을 수 있습니다 (쉼표로 여러 개):
+- broth: 육수 비교 / noodle: 면 비교
+- overall: 기본 정보 + 매니아 평가 + 상황별 추천
+- value: 가격, 전체 밸런스, 가성비 점수""",
+        input_model=CompareInput,
     ),
-    
-    Tool(
+
+    ToolSpec(
+        name="compare_many",
+        description="""여러 맛집(2~10곳)을 한 번에 비교합니다.
+
+후보 목록을 비교할 때 compare 를 쌍마다 호출하는 대신 사용합니다.
+맛집마다 열 하나인 비교표를 한 번에 만듭니다.
+
+비교 항목:
+- 기본 정보: 등급, 계보, 가격, 창업, 평점
+- 육수: 베이스, 맑기, 깊이, 육향, 간, 살얼음
+- 면: 스타일, 메밀 함량, 굵기
+- 매니아 평가: 정통성 점수, 전체 밸런스
+
+후보 전체 중 상황별 추천 (입문자 / 매니아 / 가성비) 제공
+
+focus_on 으로 필요한 섹션만 받을 수 있습니다 (쉼표로 여러 개):
+- broth: 육수 비교 / noodle: 면 비교
+- overall: 기본 정보 + 매니아 평가 + 상황별 추천
+- value: 가격, 전체 밸런스, 가성비 점수""",
+        input_model=CompareManyInput,
+    ),
+
+    ToolSpec(
+        name="find_similar",
+        description="""기준 맛집과 맛이 비슷한 맛집을 찾습니다.
+
+비교 특징:
+- 육수: 맑기, 깊이, 간, 육향, 살얼음, 동치미, 베이스
+- 면: 메밀 함량, 자가제면, 스타일, 굵기
+- 고명: 편육, 달걀, 오이, 배, 동치미 무, 고춧가루
+- 매니아 평가 6개 항목과 정통성 점수, 계보
+
+사용 예시:
+- 필동면옥 같은 곳을 강남에서: restaurant="필동면옥", region="gangnam_seocho"
+- 1만 5천원 이하: max_price=15000
+
+반환: 유사도 순 맛집 목록 (유사도, 위치, 계보, 가격, 육수/면 특징)""",
+        input_model=FindSimilarInput,
+    ),
+
+    ToolSpec(
+        name="search_nearby",
+        description="""기준 위치에서 가까운 평양냉면 맛집을 찾습니다.
+
+기준 위치 (하나 지정):
+- near: 역/랜드마크 이름 (예: 시청역, 을지로3가, 여의도) 또는 맛집 이름
+- latitude + longitude: 좌표 (WGS84)
+
+radius_km 를 주면 반경 안의 맛집을 가까운 순으로, 생략하면 가장 가까운 limit 곳을 반환합니다.
+search_restaurants 와 같은 필터(region, lineage, max_price, experience_level,
+michelin_only, has_slush_ice, tier, query)를 함께 쓸 수 있습니다.
+
+사용 예시:
+- 시청역 1km 안: near="시청역", radius_km=1
+- 여의도 근처 입문자용: near="여의도", experience_level="beginner"
+
+반환: 거리 순 맛집 목록 (거리, 위치, 계보, 가격, 평점)""",
+        input_model=SearchNearbyInput,
+    ),
+
+    ToolSpec(
+        name="plan_crawl",
+        description="""하루에 여러 평양냉면집을 도는 투어 코스를 짭니다.
+
+평점/등급이 높으면서 웨이팅과 이동 시간이 적은 조합을 골라 방문 순서를 정합니다.
+- 영업시간/브레이크타임/휴무일을 반영해 도착 시각에 문을 연 곳만 넣음
+- 평균 웨이팅(average_wait_minutes, 정보가 없으면 전체 중앙값)과 맛집 간 거리로 소요 시간 추정
+
+후보는 restaurants 로 직접 지정하거나 search_restaurants 와 같은 필터
+(region, lineage, max_price, experience_level, michelin_only, has_slush_ice, tier)로 좁힙니다.
+
+사용 예시:
+- 토요일 점심 3곳: stops=3, start_time="토 11:00"
+- 시청역에서 출발, 종로/을지로 위주: near="시청역", region="jongno_euljiro"
+- 정해 둔 후보 중 순서만: restaurants=["우래옥", "을밀대", "필동면옥"]
+
+반환: 순서별 도착/착석/출발 시각, 이동 거리, 웨이팅, 총 소요 시간""",
+        input_model=PlanCrawlInput,
+        clock_fields=("start_time",),
+    ),
+
+    ToolSpec(
         name="get_eating_guide",
         description="""평양냉면 제대로 즐기는 법을 안내합니다.
 
@@ -169,10 +477,10 @@ TOOLS: list[Tool] = [
 - seasonal: 계절별 즐기는 팁
 
 특정 맛집 ID 입력 시 해당 맛집 특화 가이드 제공""",
-        inputSchema=GetEatingGuideInput.model_json_schema(),
+        input_model=GetEatingGuideInput,
     ),
-    
-    Tool(
+
+    ToolSpec(
         name="get_side_pairings",
         description="""냉면과 어울리는 사이드 메뉴를 추천합니다.
 
@@ -183,59 +491,66 @@ TOOLS: list[Tool] = [
 - 주류 페어링 (소주, 막걸리)
 
 특정 맛집 ID 입력 시 해당 맛집 메뉴 기반 추천""",
-        inputSchema=GetSidePairingsInput.model_json_schema(),
+        input_model=GetSidePairingsInput,
+    ),
+
+    ToolSpec(
+        name="batch",
+        description="""여러 도구 호출을 한 번에 처리합니다.
+
+get_restaurant 를 여러 번 부르거나 맛집마다 get_side_pairings 를 부르는 등
+조회를 연달아 할 때 사용합니다. 모든 호출은 같은 카탈로그 스냅샷으로
+동시에 처리되고 결과는 입력 순서대로 한 응답에 담깁니다.
+한 항목이 실패해도 나머지 결과는 그대로 반환합니다.
+
+사용 예시:
+calls=[
+  {"tool": "get_restaurant", "arguments": {"name": "우래옥"}},
+  {"tool": "get_side_pairings", "arguments": {"restaurant_id": "1"}}
+]""",
+        input_model=BatchInput,
+        handler=run_batch,
+        cacheable=False,
     ),
-]
+)
+
+# 이름 → 도구 (호출 시 dict 조회 한 번)
+REGISTRY: dict[str, ToolSpec] = {spec.name: spec for spec in TOOL_SPECS}
+
+# tools/list 응답 (스키마 포함, 한 번만 구성)
+TOOLS: list[Tool] = [spec.tool for spec in TOOL_SPECS]
+LIST_TOOLS_RESULT = ListToolsResult(tools=TOOLS)
 
 
 # ============================================================
 # 도구 핸들러 등록 함수
 # ============================================================
 
-def register_tools(server: Server, data_provider):
-    """MCP 서버에 도구 핸들러 등록"""
-    
+def register_tools(server: Server, data_provider: "DataProvider") -> None:
+    """MCP 서버에 도구 핸들러 등록
+
+    입력은 도구별 TypeAdapter 로 검증하므로 SDK 의 호출마다 jsonschema 검증은 끈다.
+    """
+
     @server.list_tools()
-    async def list_tools() -> list[Tool]:
-        return TOOLS
-    
-    @server.call_tool()
-    async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-        
-        if name == "search_restaurants":
-            params = SearchRestaurantsInput(**arguments)
-            result = await data_provider.search_restaurants(params)
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_restaurant":
-            params = GetRestaurantInput(**arguments)
-            result = await data_provider.get_restaurant(params)
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_lineage_info":
-            params = GetLineageInfoInput(**arguments)
-            result = await data_provider.get_lineage_info(params)
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "recommend":
-            params = RecommendInput(**arguments)
-            result = await data_provider.recommend(params)
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "compare":
-            params = CompareInput(**arguments)
-            result = await data_provider.compare(params)
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_eating_guide":
-            params = GetEatingGuideInput(**arguments)
-            result = await data_provider.get_eating_guide(params)
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_side_pairings":
-            params = GetSidePairingsInput(**arguments)
-            result = await data_provider.get_side_pairings(params)
-            return [TextContent(type="text", text=result)]
-        
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    async def list_tools() -> ListToolsResult:
+        return LIST_TOOLS_RESULT
+
+    @server.call_tool(validate_input=False)
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent] | CallToolResult:
+        started = time.perf_counter()
+        # 지표 레이블은 등록된 도구 이름만 (임의 이름으로 레이블이 늘어나지 않도록)
+        tool = name if name in REGISTRY else "unknown"
+        try:
+            result = await run_tool(data_provider, name, arguments)
+        except ValidationError as e:
+            text = f"Input validation error: {e}"
+            metrics.observe_call(tool, time.perf_counter() - started, len(text.encode()), ok=False)
+            return CallToolResult(content=[TextContent(type="text", text=text)], isError=True)
+        except BaseException:
+            metrics.observe_call(tool, time.perf_counter() - started, 0, ok=False)
+            raise
+        metrics.observe_call(
+            tool, time.perf_counter() - started, len(result.encode()), ok=tool != "unknown"
+        )
+        return [TextContent(type="text", text=result)]
@@ -0,0 +1,157 @@
+"""도구 응답 캐시
+
+같은 입력의 도구 호출이 반복되면 필터/정렬/렌더링을 다시 하지 않고 이전 응답을
+돌려준다. 키는 검증된 입력 모델(기본값 채움, 키 정렬 JSON)과 카탈로그 스냅샷
+버전이므로 리로드 후에는 자연히 새 키가 된다.
+
+- 최대 건수 LRU + TTL 만료
+- single-flight: 같은 키의 동시 미스는 한 번만 계산하고 나머지는 결과를 기다림
+- 적중/미스/대기 합류/퇴출/만료 지표
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from pydantic import BaseModel
+
+# 기본 설정 (환경변수로 조정)
+RESPONSE_CACHE_SIZE = int(os.environ.get("NAENGMYEON_RESPONSE_CACHE_SIZE", "1024"))
+RESPONSE_CACHE_TTL = float(os.environ.get("NAENGMYEON_RESPONSE_CACHE_TTL", "300"))
+
+
+def cache_key(tool: str, version: str, params: BaseModel) -> tuple[str, str, str]:
+    """(도구, 스냅샷 버전, 정규화된 입력)"""
+    canonical = json.dumps(
+        params.model_dump(mode="json"),
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return tool, version, canonical
+
+
+@dataclass
+class CacheStats:
+    """응답 캐시 지표"""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class ResponseCache:
+    """LRU + TTL 응답 캐시 (single-flight)
+
+    maxsize=0 이면 캐시하지 않는다 (single-flight 도 하지 않음). ttl=0 이면 만료 없음.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = RESPONSE_CACHE_SIZE,
+        ttl: float = RESPONSE_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, str]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future[str]] = {}
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: Hashable) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if self.ttl and self._clock() - stored_at > self.ttl:
+            del self._entries[key]
+            self.stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: Hashable, value: str) -> None:
+        self._entries[key] = (self._clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[str]],
+        store: Callable[[], bool] = lambda: True,
+    ) -> str:
+        """캐시된 응답 또는 compute() 결과
+
+        store() 가 False 면 계산 결과를 저장하지 않는다 (계산 중 리로드 등).
+        """
+        if not self.maxsize:
+            return await compute()
+
+        value = self._lookup(key)
+        if value is not None:
+            self.stats.hits += 1
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # 계산하던 쪽이 취소된 경우에만 직접 계산 (자신이 취소됐으면 전파)
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                return await self.get_or_compute(key, compute, store)
+
+        self.stats.misses += 1
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # 기다리는 쪽이 없어도 경고하지 않도록
+            raise
+        finally:
+            del self._inflight[key]
+
+        if store():
+            self._store(key, value)
+        future.set_result(value)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def snapshot_stats(self) -> dict[str, Any]:
+        served = self.stats.hits + self.stats.coalesced
+        lookups = served + self.stats.misses
+        return {
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            **asdict(self.stats),
+            "hit_rate": round(served / lookups, 4) if lookups else 0.0,
+        }
+
+
+# 프로세스 전역 응답 캐시 (모든 세션 공유)
+response_cache = ResponseCache()
@@ -0,0 +1,150 @@
+"""멀티 워커(pre-fork) 실행
+
+uvicorn 의 --workers 는 spawn 으로 워커를 띄우므로 카탈로그를 워커마다 다시
+로드한다. 여기서는 부모 프로세스가 카탈로그와 공유 서버를 미리 로드하고
+gc.freeze() 로 GC 대상에서 제외한 뒤 fork 하므로, 워커들은 카탈로그 메모리
+페이지를 copy-on-write 로 공유한다. 리스닝 소켓도 부모가 열어 워커에 넘긴다.
+
+SSE 와 stateful Streamable HTTP 세션은 한 워커의 메모리에 묶이는데, 커널이
+연결을 워커에 임의로 배분하므로 후속 요청이 다른 워커로 갈 수 있다.
+그래서 멀티 워커 모드에서는 /mcp 를 stateless 로 강제하고 SSE 는 비활성화한다.
+"""
+
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from collections import deque
+from collections.abc import Callable
+
+import uvicorn
+
+logger = logging.getLogger(__name__)
+
+# 워커가 비정상 종료되면 재시작하되, RESTART_WINDOW_SECONDS 안에 MAX_RESTARTS 번을
+# 넘기면 (예: import 단계에서 바로 죽는 워커) 전체를 종료하고 1 로 끝낸다
+RESTART_BACKOFF_SECONDS = 1.0
+MAX_RESTARTS = int(os.environ.get("NAENGMYEON_MAX_RESTARTS", "5"))
+RESTART_WINDOW_SECONDS = float(os.environ.get("NAENGMYEON_RESTART_WINDOW", "60"))
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    """워커들이 공유할 리스닝 소켓"""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(app: object, sock: socket.socket) -> None:
+    """워커 프로세스: 공유 소켓으로 uvicorn 실행"""
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, signal.SIG_DFL)
+    if hasattr(signal, "SIGHUP"):
+        # 워커의 lifespan 이 이벤트 루프 핸들러를 다시 등록할 때까지 무시
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    config = uvicorn.Config(app, lifespan="on", log_level="info")  # type: ignore[arg-type]
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def serve_prefork(
+    app: object,
+    host: str,
+    port: int,
+    workers: int,
+    preload: Callable[[], None],
+    reload: Callable[[], object] | None = None,
+) -> None:
+    """카탈로그를 미리 로드한 뒤 워커 N개를 fork 해서 실행
+
+    SIGHUP 은 워커에 전달하고, reload 가 주어지면 부모도 리로드해서
+    이후 재시작되는 워커가 새 카탈로그로 fork 되게 한다.
+    """
+    if not hasattr(os, "fork"):
+        raise RuntimeError("멀티 워커 모드는 fork 를 지원하는 OS 에서만 사용할 수 있습니다.")
+
+    started = time.perf_counter()
+    preload()
+    gc.collect()
+    gc.freeze()
+    logger.info(
+        "카탈로그 사전 로드 완료 (%.2fs), 워커 %d개 시작", time.perf_counter() - started, workers
+    )
+
+    sock = _bind_socket(host, port)
+    children: dict[int, int] = {}
+    restarts: deque[float] = deque()
+    shutting_down = False
+    exit_code = 0
+
+    def spawn(slot: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _run_worker(app, sock)
+            except BaseException:
+                logger.exception("워커 %d 실행 실패", slot)
+                code = 1
+            os._exit(code)
+        children[pid] = slot
+
+    def shutdown(signum: int, frame: object) -> None:
+        nonlocal shutting_down
+        shutting_down = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def forward_reload(signum: int, frame: object) -> None:
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGHUP)
+            except ProcessLookupError:
+                pass
+        if reload is not None:
+            reload()
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, forward_reload)
+
+    for initial_slot in range(workers):
+        spawn(initial_slot)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        slot: int | None = children.pop(pid, None)
+        if slot is None or shutting_down:
+            continue
+        now = time.monotonic()
+        restarts.append(now)
+        while restarts and restarts[0] < now - RESTART_WINDOW_SECONDS:
+            restarts.popleft()
+        if len(restarts) > MAX_RESTARTS:
+            logger.error(
+                "워커가 %.0f초 안에 %d번 넘게 비정상 종료되어 서버를 중단합니다",
+                RESTART_WINDOW_SECONDS,
+                MAX_RESTARTS,
+            )
+            exit_code = 1
+            shutdown(signal.SIGTERM, None)
+            continue
+        logger.warning("워커 %d (pid %d) 종료 (status %d), 재시작", slot, pid, status)
+        time.sleep(RESTART_BACKOFF_SECONDS)
+        spawn(slot)
+
+    sock.close()
+    sys.exit(exit_code)
@@ -0,0 +1,23 @@
+"""공용 픽스처"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pyongyang_naengmyeon.catalog import CatalogSnapshot, load_snapshot
+from pyongyang_naengmyeon.catalog.snapshot import DATA_FILES, DEFAULT_DATA_DIR
+
+
+@pytest.fixture(scope="session")
+def snapshot() -> CatalogSnapshot:
+    """번들 데이터를 JSON 에서 로드한 스냅샷"""
+    return load_snapshot(use_compiled=False)
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    """번들 데이터 파일 복사본 (catalog.bin 제외, 수정해도 됨)"""
+    for name in DATA_FILES:
+        shutil.copy(DEFAULT_DATA_DIR / name, tmp_path / name)
+    return tmp_path
@@ -0,0 +1,68 @@
+"""컴파일된 카탈로그 (catalog.bin) 와 JSON 로드의 동등성"""
+
+import dataclasses
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from pyongyang_naengmyeon.catalog import CatalogSnapshot, build_catalog, load_snapshot
+from pyongyang_naengmyeon.catalog.binary import CATALOG_FILE, CompiledCatalog, InvalidCatalogError
+
+
+def _assert_same(a: Any, b: Any, path: str) -> None:
+    if isinstance(a, np.ndarray):
+        assert a.dtype == b.dtype, path
+        np.testing.assert_array_equal(a, b, err_msg=path)
+    elif dataclasses.is_dataclass(a):
+        for f in dataclasses.fields(a):
+            _assert_same(getattr(a, f.name), getattr(b, f.name), f"{path}.{f.name}")
+    else:
+        assert a == b, path
+
+
+@pytest.fixture
+def loaded(data_dir: Path) -> tuple[CatalogSnapshot, CatalogSnapshot]:
+    """(catalog.bin 에서, JSON 에서) 로드한 같은 데이터의 스냅샷"""
+    build_catalog(data_dir)
+    compiled = load_snapshot(data_dir, use_compiled=True)
+    parsed = load_snapshot(data_dir, use_compiled=False)
+    assert compiled.compiled and not parsed.compiled
+    return compiled, parsed
+
+
+def test_columns_match(loaded: tuple[CatalogSnapshot, CatalogSnapshot]) -> None:
+    compiled, parsed = loaded
+    _assert_same(compiled.index.columns, parsed.index.columns, "columns")
+
+
+def test_records_and_aux_files_match(loaded: tuple[CatalogSnapshot, CatalogSnapshot]) -> None:
+    compiled, parsed = loaded
+    assert list(compiled.restaurants) == list(parsed.restaurants)
+    assert compiled.restaurants[-1] == parsed.restaurants[-1]
+    assert compiled.version == parsed.version
+    for name in ("lineages", "eating_guides", "side_menus", "courses", "places", "holidays"):
+        assert getattr(compiled, name) == getattr(parsed, name), name
+
+
+@pytest.mark.parametrize("query", ["을밀대", "동치미 육수", "메밀 100%", "살얼음"])
+def test_fulltext_matches(loaded: tuple[CatalogSnapshot, CatalogSnapshot], query: str) -> None:
+    compiled, parsed = loaded
+    a, b = compiled.fulltext.search(query), parsed.fulltext.search(query)
+    assert [pos for pos, _ in a] == [pos for pos, _ in b]
+    np.testing.assert_allclose([s for _, s in a], [s for _, s in b], rtol=1e-6)
+
+
+def test_stale_catalog_falls_back_to_json(data_dir: Path) -> None:
+    build_catalog(data_dir)
+    path = data_dir / "places.json"
+    path.write_bytes(path.read_bytes() + b"\n")
+    assert not load_snapshot(data_dir, use_compiled=True).compiled
+
+
+def test_rejects_foreign_file(tmp_path: Path) -> None:
+    path = tmp_path / CATALOG_FILE
+    path.write_bytes(b"not a catalog" * 10)
+    with pytest.raises(InvalidCatalogError):
+        CompiledCatalog(path)
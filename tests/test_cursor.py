@@ -0,0 +1,70 @@
+"""검색 결과 페이지 커서"""
+
+import re
+
+import pytest
+
+from pyongyang_naengmyeon.catalog import CatalogSnapshot
+from pyongyang_naengmyeon.catalog.cursor import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    fingerprint,
+)
+from pyongyang_naengmyeon.server import DataProvider
+from pyongyang_naengmyeon.tools.definitions import SearchRestaurantsInput
+
+
+def test_round_trip() -> None:
+    token = encode_cursor("v1", "fp", 40)
+    assert decode_cursor(token, "v1", "fp") == 40
+
+
+def test_fingerprint_ignores_key_order() -> None:
+    assert fingerprint({"a": 1, "b": [2]}) == fingerprint({"b": [2], "a": 1})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+@pytest.mark.parametrize(
+    ("token", "message"),
+    [
+        (encode_cursor("v0", "fp", 20), "만료"),
+        (encode_cursor("v1", "other", 20), "검색 조건"),
+        (encode_cursor("v1", "fp", -1), "잘못된"),
+        ("not-a-cursor!", "잘못된"),
+        ("", "잘못된"),
+    ],
+)
+def test_rejects(token: str, message: str) -> None:
+    with pytest.raises(InvalidCursorError, match=message):
+        decode_cursor(token, "v1", "fp")
+
+
+def _page(output: str) -> tuple[list[str], str | None]:
+    names = re.findall(r"^### (.+?) ?⭐?$", output, re.MULTILINE)
+    cursor = re.search(r"^next_cursor: (\S+)$", output, re.MULTILINE)
+    return names, cursor[1] if cursor else None
+
+
+async def test_pages_cover_full_result(snapshot: CatalogSnapshot) -> None:
+    provider = DataProvider(snapshot=snapshot)
+    full, cursor = _page(await provider.search_restaurants(SearchRestaurantsInput(limit=100)))
+    assert cursor is None and len(full) == len(snapshot.restaurants)
+
+    paged: list[str] = []
+    cursor = None
+    while True:
+        params = SearchRestaurantsInput(limit=7, cursor=cursor)
+        names, cursor = _page(await provider.search_restaurants(params))
+        paged += names
+        if cursor is None:
+            break
+    assert paged == full
+
+
+async def test_cursor_bound_to_conditions(snapshot: CatalogSnapshot) -> None:
+    provider = DataProvider(snapshot=snapshot)
+    _, cursor = _page(await provider.search_restaurants(SearchRestaurantsInput(limit=5)))
+    assert cursor is not None
+    output = await provider.search_restaurants(SearchRestaurantsInput(tier=1, cursor=cursor))
+    assert output == "검색 조건이 달라 cursor 를 사용할 수 없습니다."
@@ -0,0 +1,135 @@
+"""영업시간 해석 / open_at 시각 해석"""
+
+import logging
+from datetime import date, datetime
+
+import pytest
+
+from pyongyang_naengmyeon.catalog import CatalogSnapshot
+from pyongyang_naengmyeon.catalog.hours import (
+    DAY_SLOTS,
+    HOLIDAY_KINDS,
+    KST,
+    SLOT_MINUTES,
+    OpenAt,
+    Schedule,
+    compile_schedule,
+    load_holidays,
+    parse_open_at,
+    pin_clock,
+)
+from pyongyang_naengmyeon.models import Hours
+
+NOW = datetime(2026, 5, 20, 15, 7, tzinfo=KST)  # 수요일
+
+
+def _open(schedule: Schedule, day: str, hhmm: str) -> bool:
+    hour, minute = map(int, hhmm.split(":"))
+    return bool(schedule.week[OpenAt("월화수목금토일".index(day), hour * 60 + minute).slot])
+
+
+def _schedule(snapshot: CatalogSnapshot, **fields: object) -> Schedule:
+    base = snapshot.restaurants[0]
+    update: dict[str, object] = {
+        "hours": None,
+        "hours_string": None,
+        "closed_days": [],
+        "closed_days_string": None,
+        **fields,
+    }
+    return compile_schedule(base.model_copy(update=update))
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("토 12:30", OpenAt(5, 750)),
+        ("일요일 23:55", OpenAt(6, 1435)),
+        ("now", OpenAt(2, 907, date(2026, 5, 20))),
+        ("지금", OpenAt(2, 907, date(2026, 5, 20))),
+        ("9:05", OpenAt(2, 545, date(2026, 5, 20))),
+        ("2026-05-02T12:00", OpenAt(5, 720, date(2026, 5, 2))),
+        ("2026-05-01T03:30+00:00", OpenAt(4, 750, date(2026, 5, 1))),
+    ],
+)
+def test_parse_open_at(text: str, expected: OpenAt) -> None:
+    assert parse_open_at(text, NOW) == expected
+
+
+@pytest.mark.parametrize("text", ["24:00", "12:60", "토요일", "내일 점심", ""])
+def test_parse_open_at_rejects(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse_open_at(text, NOW)
+
+
+def test_holiday_table(snapshot: CatalogSnapshot) -> None:
+    when = parse_open_at("2026-09-25T12:00", holidays=snapshot.holidays)
+    assert when.holiday == "chuseok_day"
+    assert [HOLIDAY_KINDS[i] for i in when.holidays] == ["chuseok_day", "chuseok", "public"]
+    assert parse_open_at("2026-09-28T12:00", holidays=snapshot.holidays).holidays == []
+    # 날짜가 없는 질의는 공휴일로 보지 않음
+    assert parse_open_at("금 12:00", holidays=snapshot.holidays).holidays == []
+
+
+def test_holiday_table_outside_years(caplog: pytest.LogCaptureFixture) -> None:
+    data = {"holidays": [{"date": "2026-01-01", "kind": "public"}, {"date": "2026-02-17"}]}
+    with caplog.at_level(logging.WARNING):
+        holidays = load_holidays(data, today=date(2030, 1, 1))
+    assert dict(holidays) == {date(2026, 1, 1): "public", date(2026, 2, 17): "public"}
+    assert "2030" in caplog.text
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING):
+        load_holidays({"holidays": [{"date": "2026-01-01", "kind": "설"}]}, today=NOW.date())
+    assert "알 수 없는 공휴일 종류" in caplog.text
+
+
+def test_pin_clock() -> None:
+    assert pin_clock("now", NOW) == "2026-05-20T15:07"
+    assert pin_clock(" 12:30 ", NOW) == "2026-05-20T12:30"
+    assert pin_clock("토 12:30", NOW) == "토 12:30"
+    assert pin_clock("99:99", NOW) == "99:99"
+
+
+def test_weekday_weekend_and_break(snapshot: CatalogSnapshot) -> None:
+    schedule = _schedule(
+        snapshot,
+        hours=Hours(weekday="11:00–21:00 (브레이크타임 15:00–17:00)", weekend="11:30~20:00"),
+    )
+    assert not schedule.problems
+    assert _open(schedule, "월", "11:00") and _open(schedule, "금", "20:55")
+    assert not _open(schedule, "월", "10:55") and not _open(schedule, "월", "21:00")
+    assert not _open(schedule, "화", "15:00") and _open(schedule, "화", "17:00")
+    assert _open(schedule, "토", "15:00") and not _open(schedule, "일", "11:00")
+
+
+def test_day_spec_and_early_close(snapshot: CatalogSnapshot) -> None:
+    schedule = _schedule(snapshot, hours_string="화-일 11:00-22:00 (일 ~21:00)")
+    assert not _open(schedule, "월", "12:00")
+    assert _open(schedule, "토", "21:30") and not _open(schedule, "일", "21:30")
+
+
+def test_overnight_wraps_to_monday(snapshot: CatalogSnapshot) -> None:
+    schedule = _schedule(snapshot, hours_string="매일 18:00-02:00")
+    assert _open(schedule, "일", "23:55") and _open(schedule, "월", "01:55")
+    assert not _open(schedule, "월", "02:00")
+    assert schedule.week[:2 * 60 // SLOT_MINUTES].all()
+    assert not schedule.week[2 * 60 // SLOT_MINUTES:DAY_SLOTS * 3 // 4].any()
+
+
+def test_closed_days(snapshot: CatalogSnapshot) -> None:
+    schedule = _schedule(
+        snapshot,
+        hours_string="11:00-21:00",
+        closed_days=["매주 월요일", "설 당일", "추석 연휴", "비정기 휴무"],
+    )
+    assert not schedule.problems
+    assert not _open(schedule, "월", "12:00") and _open(schedule, "화", "12:00")
+    closed = {kind for kind, flag in zip(HOLIDAY_KINDS, schedule.closed_on) if flag}
+    assert closed == {"seollal_day", "chuseok"}
+
+
+def test_unparsed_reported(snapshot: CatalogSnapshot) -> None:
+    schedule = _schedule(snapshot, hours_string="문의 바람", closed_days=["매월 특정일"])
+    assert not schedule.week.any()
+    assert schedule.problems == ["hours_string: 문의 바람", "closed_days: 매월 특정일"]
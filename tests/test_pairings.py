@@ -0,0 +1,80 @@
+"""예산 맞춤 사이드 구성 (배낭 DP 최적성)"""
+
+import itertools
+import math
+
+import pytest
+
+from pyongyang_naengmyeon.catalog import CatalogSnapshot
+from pyongyang_naengmyeon.catalog.pairings import (
+    BASE_VALUE,
+    PAIRING_VALUE,
+    PRICE_UNIT,
+    SHARE,
+    SIGNATURE_VALUE,
+    load_courses,
+    optimize_sides,
+)
+from pyongyang_naengmyeon.models import Restaurant, SideMenu
+
+
+def _value(menu: SideMenu, plates: int) -> float:
+    base = (
+        BASE_VALUE
+        + SIGNATURE_VALUE * menu.is_signature
+        + PAIRING_VALUE * bool(menu.pairing_note)
+    )
+    return base * sum(1 / c for c in range(1, plates + 1))
+
+
+def _exhaustive(r: Restaurant, party: int, budget: int) -> float | None:
+    """메뉴별 접시 수 조합 전수 평가 (가격은 PRICE_UNIT 단위로 올림)"""
+    remaining = budget - r.naengmyeon_price * party
+    if remaining < 0:
+        return None
+    copies = max(1, math.ceil(party / SHARE))
+    best = 0.0
+    for counts in itertools.product(range(copies + 1), repeat=len(r.side_menus)):
+        cost = sum(-(-m.price // PRICE_UNIT) * PRICE_UNIT * n for m, n in zip(r.side_menus, counts))
+        if cost <= remaining:
+            best = max(best, sum(_value(m, n) for m, n in zip(r.side_menus, counts)))
+    return best
+
+
+@pytest.mark.parametrize("party", [1, 2, 4, 6])
+@pytest.mark.parametrize("per_person", [12_000, 20_000, 30_000, 60_000])
+def test_matches_exhaustive(snapshot: CatalogSnapshot, party: int, per_person: int) -> None:
+    column = snapshot.index.columns.side_menus
+    budget = per_person * party
+    for pos, r in enumerate(snapshot.restaurants):
+        course = optimize_sides(column, pos, r.naengmyeon_price, party, budget)
+        best = _exhaustive(r, party, budget)
+        if best is None:
+            assert course is None
+            continue
+        assert course is not None
+        assert course.value == pytest.approx(best)
+        # 돌려준 구성이 실제로 예산 안이고 가치가 일치
+        assert course.total <= budget
+        assert course.naengmyeon == r.naengmyeon_price * party
+        assert course.total == course.naengmyeon + sum(
+            r.side_menus[i].price * n for i, n in course.sides
+        )
+        assert sum(_value(r.side_menus[i], n) for i, n in course.sides) == pytest.approx(best)
+        assert all(1 <= n <= max(1, math.ceil(party / SHARE)) for _, n in course.sides)
+
+
+def test_load_courses() -> None:
+    courses = load_courses({
+        "course_examples": [
+            {"name": "클래식 2인 코스", "budget": "₩50,000 ~ ₩60,000"},
+            {"name": "가족 4인 코스", "budget": "₩150,000 내외"},
+            {"name": "혼밥", "budget": "문의"},
+        ]
+    })
+    assert [(c.min_budget, c.max_budget, c.party_size) for c in courses] == [
+        (50_000, 60_000, 2),
+        (150_000, 150_000, 4),
+        (100_000, 100_000, 1),
+    ]
+    assert [c.per_person for c in courses] == [30_000, 37_500, 100_000]
@@ -0,0 +1,43 @@
+"""맛집 이름 해석 (id/slug/이름/오타/초성)"""
+
+import pytest
+
+from pyongyang_naengmyeon.catalog import CatalogSnapshot
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        (12, "을밀대"),
+        ("12", "을밀대"),
+        ("eulmildae-mapo", "을밀대"),
+        ("EULMILDAE-MAPO", "을밀대"),
+        ("을밀대", "을밀대"),
+        ("을 밀 대", "을밀대"),
+        ("필동", "필동면옥"),
+        ("을밀데", "을밀대"),
+        ("우레옥", "우래옥"),
+        ("ㅇㄹㅇ", "우래옥"),
+        ("eulmildae", "을밀대"),
+    ],
+)
+def test_resolve(snapshot: CatalogSnapshot, query: str | int, expected: str) -> None:
+    restaurant = snapshot.resolver.resolve(query)
+    assert restaurant is not None and restaurant.name == expected
+
+
+@pytest.mark.parametrize("query", [None, "", "없는집zz", 9999, "²"])
+def test_unresolved(snapshot: CatalogSnapshot, query: str | int | None) -> None:
+    assert snapshot.resolver.resolve(query) is None
+
+
+def test_shorter_match_ranks_first(snapshot: CatalogSnapshot) -> None:
+    # 같은 부분 일치면 이름이 짧은 쪽이 먼저
+    names = [r.name for r in snapshot.resolver.search_names("평양면옥")]
+    assert names[0] == "본가평양면옥"
+    assert set(names) == {"본가평양면옥", "의정부평양면옥", "장충동평양면옥"}
+
+
+def test_suggest(snapshot: CatalogSnapshot) -> None:
+    assert [r.name for r in snapshot.resolver.suggest("을밀데")] == ["을밀대"]
+    assert snapshot.resolver.suggest(12) == []
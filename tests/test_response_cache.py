@@ -0,0 +1,116 @@
+"""도구 응답 캐시 (single-flight, LRU/TTL)"""
+
+import asyncio
+
+import pytest
+
+from pyongyang_naengmyeon.tools.response_cache import ResponseCache
+
+
+class _Compute:
+    """호출 횟수를 세고 release 될 때까지 기다리는 계산"""
+
+    def __init__(self, value: str = "응답") -> None:
+        self.value = value
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        self.started.set()
+        await self.release.wait()
+        return self.value
+
+
+async def test_single_flight() -> None:
+    cache = ResponseCache(maxsize=8, ttl=0)
+    compute = _Compute()
+    tasks = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(10)]
+    await compute.started.wait()
+    await asyncio.sleep(0)
+    compute.release.set()
+
+    assert await asyncio.gather(*tasks) == ["응답"] * 10
+    assert compute.calls == 1
+    assert (cache.stats.misses, cache.stats.coalesced) == (1, 9)
+    assert await cache.get_or_compute("k", compute) == "응답"
+    assert (compute.calls, cache.stats.hits) == (1, 1)
+
+
+async def test_error_reaches_waiters_and_is_not_cached() -> None:
+    cache = ResponseCache(maxsize=8, ttl=0)
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def fail() -> str:
+        started.set()
+        await release.wait()
+        raise RuntimeError("계산 실패")
+
+    leader = asyncio.create_task(cache.get_or_compute("k", fail))
+    await started.wait()
+    follower = asyncio.create_task(cache.get_or_compute("k", fail))
+    await asyncio.sleep(0)
+    release.set()
+
+    for task in (leader, follower):
+        with pytest.raises(RuntimeError, match="계산 실패"):
+            await task
+    assert len(cache) == 0
+
+    compute = _Compute()
+    compute.release.set()
+    assert await cache.get_or_compute("k", compute) == "응답"
+
+
+async def test_cancelled_leader_hands_over() -> None:
+    cache = ResponseCache(maxsize=8, ttl=0)
+    first = _Compute("first")
+    leader = asyncio.create_task(cache.get_or_compute("k", first))
+    await first.started.wait()
+
+    second = _Compute("second")
+    second.release.set()
+    follower = asyncio.create_task(cache.get_or_compute("k", second))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "second"
+    assert leader.cancelled()
+    assert (first.calls, second.calls) == (1, 1)
+
+
+async def test_store_false_skips_cache() -> None:
+    cache = ResponseCache(maxsize=8, ttl=0)
+    compute = _Compute()
+    compute.release.set()
+    await cache.get_or_compute("k", compute, store=lambda: False)
+    await cache.get_or_compute("k", compute, store=lambda: False)
+    assert compute.calls == 2 and len(cache) == 0
+
+
+async def test_lru_and_ttl() -> None:
+    now = [0.0]
+    cache = ResponseCache(maxsize=2, ttl=10, clock=lambda: now[0])
+
+    async def value(v: str) -> str:
+        return v
+
+    await cache.get_or_compute("a", lambda: value("a"))
+    await cache.get_or_compute("b", lambda: value("b"))
+    await cache.get_or_compute("a", lambda: value("new-a"))  # a 를 최근 사용으로
+    await cache.get_or_compute("c", lambda: value("c"))
+    assert await cache.get_or_compute("b", lambda: value("new-b")) == "new-b"
+    assert cache.stats.evictions == 2
+
+    now[0] = 11.0
+    assert await cache.get_or_compute("c", lambda: value("new-c")) == "new-c"
+    assert cache.stats.expirations == 1
+
+
+async def test_disabled() -> None:
+    cache = ResponseCache(maxsize=0)
+    compute = _Compute()
+    compute.release.set()
+    await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(3)))
+    assert compute.calls == 3 and len(cache) == 0
@@ -0,0 +1,77 @@
+"""Streamable HTTP 세션 수명 관리 (LRU 퇴출, 유휴 만료)"""
+
+import time
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+import pytest
+
+from pyongyang_naengmyeon.sessions import SessionManager, StreamableSession
+
+
+class _Transport:
+    def __init__(self) -> None:
+        self.terminated = False
+
+    async def terminate(self) -> None:
+        self.terminated = True
+
+
+def _session() -> StreamableSession:
+    return StreamableSession(transport=cast(Any, _Transport()), server=cast(Any, None))
+
+
+def _terminated(session: StreamableSession) -> bool:
+    return cast(_Transport, session.transport).terminated
+
+
+@pytest.fixture
+async def manager() -> AsyncIterator[SessionManager]:
+    manager = SessionManager(idle_ttl=60, max_sessions=2, sweep_interval=3600)
+    yield manager
+    await manager.close_all()
+
+
+async def test_evicts_least_recently_used(manager: SessionManager) -> None:
+    a, b, c = _session(), _session(), _session()
+    await manager.add("a", a)
+    await manager.add("b", b)
+    assert manager.get("a") is a  # a 를 최근 사용으로
+
+    await manager.add("c", c)
+
+    assert "b" not in manager and _terminated(b)
+    assert "a" in manager and "c" in manager and not _terminated(a)
+    assert manager.snapshot_stats()["evicted"] == 1
+
+
+async def test_busy_session_not_evicted(manager: SessionManager) -> None:
+    a, b = _session(), _session()
+    await manager.add("a", a)
+    await manager.add("b", b)
+    async with manager.activity(a):
+        await manager.add("c", _session())
+        assert "a" in manager and "b" not in manager
+
+
+async def test_sweep_expires_idle_sessions(manager: SessionManager) -> None:
+    idle, busy = _session(), _session()
+    await manager.add("idle", idle)
+    await manager.add("busy", busy)
+    idle.last_active = busy.last_active = time.monotonic() - 120
+
+    async with manager.activity(busy):
+        assert await manager.sweep() == 1
+
+    assert "idle" not in manager and _terminated(idle)
+    assert "busy" in manager
+    assert manager.stats.expired == 1
+
+
+async def test_remove(manager: SessionManager) -> None:
+    session = _session()
+    await manager.add("a", session)
+    assert await manager.remove("a") and _terminated(session)
+    assert not await manager.remove("a")
+    assert manager.get("a") is None
+    assert manager.stats.terminated == 1
@@ -0,0 +1,66 @@
+"""스냅샷 리로드 (원자적 교체, 해시가 같은 파일 재사용)"""
+
+import json
+from pathlib import Path
+
+from pyongyang_naengmyeon.catalog import CatalogStore, load_snapshot
+from pyongyang_naengmyeon.catalog.snapshot import RESTAURANT_FIELDS
+
+
+def _rename_first_course(data_dir: Path) -> None:
+    path = data_dir / "side_menus.json"
+    data = json.loads(path.read_bytes())
+    data["course_examples"][0]["name"] += " (수정)"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def test_reload_swaps_and_reuses_unchanged_files(data_dir: Path) -> None:
+    store = CatalogStore(data_dir)
+    before = store.current
+    _rename_first_course(data_dir)
+
+    result = store.reload_sync()
+
+    after = store.current
+    assert result.changed and result.error is None
+    assert after is not before and result.version == after.version != before.version
+    assert after.courses[0].data["name"].endswith("(수정)")
+    # restaurants.json 은 그대로이므로 레코드/인덱스를 다시 만들지 않음
+    for name in RESTAURANT_FIELDS:
+        assert getattr(after, name) is getattr(before, name)
+    assert after.lineages is before.lineages
+    assert after.places is before.places
+    assert store.reloads == 1
+
+
+def test_reload_without_changes_keeps_snapshot(data_dir: Path) -> None:
+    store = CatalogStore(data_dir)
+    before = store.current
+    (data_dir / "places.json").touch()
+
+    result = store.reload_sync()
+
+    assert not result.changed
+    assert store.current is before
+    assert store.reloads == 0
+
+
+async def test_failed_reload_keeps_previous(data_dir: Path) -> None:
+    store = CatalogStore(data_dir)
+    before = store.current
+    (data_dir / "restaurants.json").write_text("{", encoding="utf-8")
+
+    result = await store.reload()
+
+    assert not result.changed and result.error is not None
+    assert store.current is before
+    assert store.reload_failures == 1 and store.last_error == result.error
+
+
+def test_version_follows_content(data_dir: Path) -> None:
+    first = load_snapshot(data_dir)
+    _rename_first_course(data_dir)
+    second = load_snapshot(data_dir, previous=first)
+    assert second.version != first.version
+    assert second.file_hashes["side_menus.json"] != first.file_hashes["side_menus.json"]
+    assert second.file_hashes["restaurants.json"] == first.file_hashes["restaurants.json"]